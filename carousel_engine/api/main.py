@@ -70,6 +70,8 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Carousel Engine v2 application")
+    if engine is not None:
+        await engine.close()
 
 
 # Create FastAPI application
@@ -75,7 +75,7 @@ async def upload_client_documents(
         
         
         # Initialize services
-        notion_service = NotionService()
+        notion_service = NotionService.get()
         google_drive_service = GoogleDriveService()
         document_processor = DocumentProcessor()
         
@@ -282,7 +282,7 @@ async def upload_service_status():
     """
     try:
         # Initialize services to test connectivity
-        notion_service = NotionService()
+        notion_service = NotionService.get()
         google_drive_service = GoogleDriveService()
         document_processor = DocumentProcessor()
         
@@ -297,11 +297,7 @@ async def upload_service_status():
         try:
             # Try to query the client project database (limit to 1 for quick test)
             # Use a simple query without sorts to test basic connectivity
-            query_params = {
-                "database_id": config.client_project_database_id,
-                "page_size": 1
-            }
-            response = notion_service.client.databases.query(**query_params)
+            await notion_service.check_connection(config.client_project_database_id)
             status["notion"] = "ok"
         except Exception as e:
             status["notion"] = f"error: {str(e)}"
@@ -3,6 +3,7 @@ Configuration management for Carousel Engine v2
 """
 
 import os
+import tempfile
 from typing import Optional, List, Union
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
@@ -32,6 +33,8 @@ class Config(BaseSettings):
     image_height: int = Field(default=1080, description="Generated image height in pixels") 
     max_carousel_slides: int = Field(default=7, description="Maximum number of slides per carousel")
     lines_per_slide: int = Field(default=2, description="Maximum lines of text per slide")
+    slide_output_format: str = Field(default="JPEG", description="Slide image format: JPEG, WEBP or PNG")
+    png_compress_level: int = Field(default=1, ge=0, le=9, description="zlib level for slide PNGs (1 fastest, 6 PIL default)")
     
     # Font Settings for Maximum Legibility
     min_title_font_size: int = Field(default=60, description="Minimum font size for titles (pt)")
@@ -42,6 +45,36 @@ class Config(BaseSettings):
     # Cost Monitoring
     max_cost_per_run: float = Field(default=1.00, description="Maximum cost per carousel generation")
     
+    # Notion API Limits (Notion allows ~3 requests/second per integration)
+    notion_requests_per_second: float = Field(default=2.5, description="Sustained Notion API request rate")
+    notion_burst_size: int = Field(default=5, description="Maximum burst of Notion API requests")
+    notion_max_concurrent_requests: int = Field(default=5, description="Maximum Notion API requests in flight")
+    
+    # OpenAI API Limits
+    openai_max_concurrent_requests: int = Field(default=10, description="Maximum OpenAI API requests in flight per service")
+    openai_max_retries: int = Field(default=5, description="Maximum attempts for transient OpenAI and image download failures")
+    
+    # OpenAI Response Cache (deterministic or explicitly cacheable requests only)
+    openai_cache_dir: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "carousel_engine", "openai_cache"),
+        description="Directory for the on-disk OpenAI response cache"
+    )
+    openai_cache_ttl_seconds: int = Field(default=7 * 24 * 3600, description="Expiry for cached OpenAI responses")
+    openai_memory_cache_size: int = Field(default=1000, description="Maximum OpenAI responses kept in memory")
+    openai_memory_cache_ttl_seconds: int = Field(default=3600, description="Expiry for in-memory OpenAI responses")
+    openai_image_cache_dir: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "carousel_engine", "dalle_cache"),
+        description="Directory for cached DALL-E images, keyed by prompt"
+    )
+    openai_image_cache_max_bytes: int = Field(default=2 * 1024 ** 3, description="Size at which old cached images are evicted")
+    openai_semantic_cache_enabled: bool = Field(default=False, description="Reuse backgrounds for near-duplicate titles and prompts")
+    openai_semantic_cache_threshold: float = Field(default=0.92, description="Minimum cosine similarity for a semantic cache hit")
+    openai_semantic_cache_size: int = Field(default=256, description="Maximum entries per semantic cache")
+    semantic_cache_redis_url: Optional[str] = Field(
+        default=None,
+        description="Redis Stack URL for sharing the background description semantic cache across workers"
+    )
+    
     # Google Drive Settings
     google_drive_folder_name: str = Field(default="Carousel Images", description="Default folder name")
     
@@ -63,6 +96,17 @@ class Config(BaseSettings):
             return [item.strip() for item in v.split(',') if item.strip()]
         return v
     
+    @field_validator('slide_output_format')
+    @classmethod
+    def normalize_slide_output_format(cls, v):
+        """Upper-case the slide format and reject unsupported values"""
+        v = v.strip().upper()
+        if v == 'JPG':
+            v = 'JPEG'
+        if v not in ('JPEG', 'WEBP', 'PNG'):
+            raise ValueError(f"Unsupported slide_output_format: {v}")
+        return v
+    
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
     sentry_dsn: Optional[str] = Field(default=None, description="Sentry DSN for error tracking")
@@ -2,15 +2,16 @@
 Core Carousel Engine for automated carousel generation
 """
 
+import asyncio
 import logging
 import time
 from datetime import datetime
-from typing import List, Tuple, Optional
+from typing import Any, Awaitable, List, Tuple, Optional
 
 from ..services.notion import NotionService
 from ..services.google_drive import GoogleDriveService
 from ..services.openai_service import OpenAIService
-from ..utils.image_processor import ImageProcessor
+from ..utils.image_processor import ImageProcessor, SLIDE_FILE_EXTENSIONS
 from ..utils.content_processor import ContentProcessor
 from ..core.config import config
 from ..core.models import (
@@ -57,7 +58,7 @@ class CarouselEngine:
         self.content_processor = None
         
         try:
-            self.notion = notion_service or NotionService()
+            self.notion = notion_service or NotionService.get()
         except Exception as e:
             logger.warning(f"Failed to initialize Notion service: {e}")
         
@@ -84,6 +85,20 @@ class CarouselEngine:
         # Performance tracking
         self.metrics = {}
     
+    async def close(self) -> None:
+        """Release HTTP connection pools held by the API services"""
+        if self.notion is not None:
+            try:
+                self.notion.close()
+            except Exception as e:
+                logger.warning(f"Failed to close Notion service: {e}")
+        
+        if self.openai is not None:
+            try:
+                await self.openai.close()
+            except Exception as e:
+                logger.warning(f"Failed to close OpenAI service: {e}")
+    
     async def generate_carousel(
         self, 
         notion_page_id: str,
@@ -137,20 +152,29 @@ class CarouselEngine:
             # Update status to processing
             await self.notion.update_page_status(notion_page_id, CarouselStatus.PROCESSING)
             
+            # Steps 2 and 3 are independent API calls, so they run concurrently:
             # Step 2: Process and optimize content
-            content_start = time.time()
-            optimized_slides = await self._process_content(notion_page, client_system_message)
-            content_time = time.time() - content_start
-            
+            content_task = asyncio.create_task(
+                self._timed(self._process_content(notion_page, client_system_message))
+            )
             # Step 3: Generate actual background image using DALL-E 3
-            image_gen_start = time.time()
-            background_image_data, image_cost = await self.openai.generate_background_image(
-                notion_page.title,
-                "professional",  # theme
-                client_system_message or "",  # client context for theming
-                "1024x1024"  # 1:1 square aspect ratio to match final output dimensions
+            image_task = asyncio.create_task(
+                self._timed(self.openai.generate_background_image(
+                    notion_page.title,
+                    "professional",  # theme
+                    client_system_message or "",  # client context for theming
+                    "1024x1024"  # 1:1 square aspect ratio to match final output dimensions
+                ))
             )
-            image_gen_time = time.time() - image_gen_start
+            try:
+                (optimized_slides, content_time), ((background_image_data, image_cost), image_gen_time) = (
+                    await asyncio.gather(content_task, image_task)
+                )
+            except BaseException:
+                # Don't leave the other call running (and billing) after a failure
+                content_task.cancel()
+                image_task.cancel()
+                raise
             
             # Step 4: Create carousel slides with real background image
             slide_images = await self._create_slide_images(optimized_slides, background_image_data)
@@ -240,6 +264,20 @@ class CarouselEngine:
                 error_message=str(e)
             )
     
+    @staticmethod
+    async def _timed(awaitable: Awaitable[Any]) -> Tuple[Any, float]:
+        """Await a step and measure how long it took
+        
+        Args:
+            awaitable: Step to run
+            
+        Returns:
+            Tuple of (result, elapsed_seconds)
+        """
+        start = time.time()
+        result = await awaitable
+        return result, time.time() - start
+    
     async def _process_content(self, notion_page, client_system_message: Optional[str] = None) -> List[CarouselSlide]:
         """Process and optimize content for carousel slides
         
@@ -302,11 +340,12 @@ class CarouselEngine:
             self.image_processor.reset_font_consistency()
         
         slide_images = []
+        file_extension = SLIDE_FILE_EXTENSIONS[config.slide_output_format]
         
         for slide in slides:
             try:
                 # Generate filename (content slides only)
-                filename = f"{slide.slide_number:02d}_slide.png"
+                filename = f"{slide.slide_number:02d}_slide{file_extension}"
                 
                 # Use the real generated background image directly
                 # This is now a professional DALL-E 3 generated real estate image
@@ -479,7 +518,7 @@ class CarouselEngine:
                     related_page_id = relation_pages[0].get("id")
                     if related_page_id:
                         try:
-                            related_page = self.notion.client.pages.retrieve(page_id=related_page_id)
+                            related_page = await self.notion.retrieve_page(related_page_id)
                             project_name = self.notion._extract_title(related_page)
                             logger.info(f"Found Project relation: {project_name}")
                         except Exception as e:
@@ -596,10 +635,7 @@ class CarouselEngine:
         # Test Notion API
         try:
             # Try to list database (basic connectivity test)
-            test_response = self.notion.client.databases.query(
-                database_id=config.notion_database_id,
-                page_size=1
-            )
+            await self.notion.check_connection(config.notion_database_id)
             health_status["services"]["notion"] = "healthy"
         except Exception as e:
             health_status["services"]["notion"] = f"unhealthy: {e}"
@@ -615,7 +651,7 @@ class CarouselEngine:
         # Test OpenAI API
         try:
             # Try to list models (basic connectivity test)
-            models = self.openai.client.models.list()
+            models = await self.openai.client.models.list()
             health_status["services"]["openai"] = "healthy"
         except Exception as e:
             health_status["services"]["openai"] = f"unhealthy: {e}"
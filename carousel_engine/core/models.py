@@ -3,8 +3,8 @@ Data models for Carousel Engine v2
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Union
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -142,4 +142,95 @@ class ClientDocument(BaseModel):
     file_size_bytes: int = Field(..., description="File size in bytes")
     google_drive_file_id: str = Field(..., description="Google Drive file ID")
     google_drive_file_url: str = Field(..., description="Google Drive file URL")
-    upload_timestamp: datetime = Field(default_factory=datetime.utcnow, description="Upload timestamp")
\ No newline at end of file
+    upload_timestamp: datetime = Field(default_factory=datetime.utcnow, description="Upload timestamp")
+
+
+# Notion property payloads, validated locally before pages.create/update
+
+class NotionText(BaseModel):
+    """Text content of a Notion rich text object"""
+    model_config = ConfigDict(extra="forbid")
+    
+    content: str = Field(..., max_length=2000, description="Text content (Notion limit: 2000 chars)")
+
+
+class NotionRichTextItem(BaseModel):
+    """Single Notion rich text object"""
+    model_config = ConfigDict(extra="forbid")
+    
+    text: NotionText = Field(..., description="Text content")
+
+
+class NotionTitleProperty(BaseModel):
+    """Title property payload"""
+    model_config = ConfigDict(extra="forbid")
+    
+    title: List[NotionRichTextItem] = Field(..., description="Title rich text")
+
+
+class NotionRichTextProperty(BaseModel):
+    """Rich text property payload"""
+    model_config = ConfigDict(extra="forbid")
+    
+    rich_text: List[NotionRichTextItem] = Field(..., description="Rich text content")
+
+
+class NotionSelectOption(BaseModel):
+    """Select option reference"""
+    model_config = ConfigDict(extra="forbid")
+    
+    name: str = Field(..., min_length=1, max_length=100, description="Option name")
+
+
+class NotionSelectProperty(BaseModel):
+    """Select property payload"""
+    model_config = ConfigDict(extra="forbid")
+    
+    select: NotionSelectOption = Field(..., description="Selected option")
+
+
+class NotionUrlProperty(BaseModel):
+    """URL property payload"""
+    model_config = ConfigDict(extra="forbid")
+    
+    url: Optional[str] = Field(..., description="URL value")
+
+
+class NotionCheckboxProperty(BaseModel):
+    """Checkbox property payload"""
+    model_config = ConfigDict(extra="forbid")
+    
+    checkbox: bool = Field(..., description="Checkbox value")
+
+
+class NotionNumberProperty(BaseModel):
+    """Number property payload"""
+    model_config = ConfigDict(extra="forbid")
+    
+    number: Optional[float] = Field(..., description="Number value")
+
+
+class NotionDateValue(BaseModel):
+    """Date range value"""
+    model_config = ConfigDict(extra="forbid")
+    
+    start: str = Field(..., description="ISO 8601 start date")
+    end: Optional[str] = Field(None, description="ISO 8601 end date")
+
+
+class NotionDateProperty(BaseModel):
+    """Date property payload"""
+    model_config = ConfigDict(extra="forbid")
+    
+    date: NotionDateValue = Field(..., description="Date value")
+
+
+NotionPropertyPayload = Union[
+    NotionTitleProperty,
+    NotionRichTextProperty,
+    NotionSelectProperty,
+    NotionUrlProperty,
+    NotionCheckboxProperty,
+    NotionNumberProperty,
+    NotionDateProperty,
+]
@@ -446,11 +446,14 @@ For every piece of content:
             from ..services.openai_service import OpenAIService
             openai_service = OpenAIService()
             
-            response = await openai_service.generate_text_completion(
-                prompt=distillation_prompt,
-                max_tokens=8000,  # Removed limits - ensure complete output for all 5+ ICPs
-                temperature=0.05  # Minimal temperature for absolute consistency and thoroughness
-            )
+            try:
+                response = await openai_service.generate_text_completion(
+                    prompt=distillation_prompt,
+                    max_tokens=8000,  # Removed limits - ensure complete output for all 5+ ICPs
+                    temperature=0.05  # Minimal temperature for absolute consistency and thoroughness
+                )
+            finally:
+                await openai_service.close()
             
             if response and response.strip():
                 return response.strip()
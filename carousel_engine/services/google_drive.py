@@ -321,7 +321,9 @@ class GoogleDriveService:
         
         for image_data, filename in images:
             try:
-                file_id, file_url = await self.upload_image(image_data, filename, folder_id)
+                file_id, file_url = await self.upload_image(
+                    image_data, filename, folder_id, mime_type=self._get_mime_type(filename)
+                )
                 results.append((file_id, file_url))
             except GoogleDriveError:
                 # Re-raise to stop processing on first failure
@@ -680,7 +682,11 @@ class GoogleDriveService:
             'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
             'doc': 'application/msword',
             'txt': 'text/plain',
-            'md': 'text/markdown'
+            'md': 'text/markdown',
+            'png': 'image/png',
+            'jpg': 'image/jpeg',
+            'jpeg': 'image/jpeg',
+            'webp': 'image/webp'
         }
         
         return mime_types.get(file_extension, 'application/octet-stream')
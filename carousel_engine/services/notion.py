@@ -2,18 +2,116 @@
 Notion API service for Carousel Engine v2
 """
 
+import asyncio
 import logging
+import operator
+import sys
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable, Iterator, List, Tuple
+import httpx
 from notion_client import Client
-from notion_client.errors import APIResponseError
+from pydantic import TypeAdapter, ValidationError
+from notion_client.errors import APIResponseError, HTTPResponseError, RequestTimeoutError
+from tenacity import RetryCallState, before_sleep_log, retry, stop_after_attempt
 
 from ..core.config import config
-from ..core.models import NotionPage, CarouselFormat, CarouselStatus
+from ..core.models import NotionPage, CarouselFormat, CarouselStatus, NotionPropertyPayload
 from ..core.exceptions import NotionAPIError
+from ..utils.rate_limiter import AsyncTokenBucket
+from ..utils.retry import wait_retry_after_or_exponential
 
 logger = logging.getLogger(__name__)
 
+# Shared service instances keyed by API key so the HTTP connection pool is reused
+_instances: Dict[str, "NotionService"] = {}
+
+# Maximum number of page updates in flight at once
+_MAX_CONCURRENT_WRITES = 3
+
+# Maximum number of parsed pages kept in the get_page cache
+_PAGE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a Notion ISO 8601 timestamp such as 2024-01-01T00:00:00.000Z"""
+    if sys.version_info >= (3, 11):
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# Block type -> prefix used when flattening page content to text
+_BLOCK_HANDLERS = {
+    "paragraph": "",
+    "bulleted_list_item": "• ",
+    "numbered_list_item": "1. ",
+    "heading_1": "# ",
+    "heading_2": "## ",
+    "heading_3": "### ",
+}
+
+# HTTP statuses worth retrying: rate limited or a transient gateway/server error
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """Check whether a Notion SDK error is worth retrying"""
+    if isinstance(exc, RequestTimeoutError):
+        return True
+    return isinstance(exc, HTTPResponseError) and exc.status in _RETRYABLE_STATUSES
+
+
+def _should_retry(retry_state: RetryCallState) -> bool:
+    """Retry policy for NotionService._request
+    
+    Idempotent calls retry timeouts and transient statuses. A non-idempotent
+    call such as pages.create may have succeeded on the server despite a
+    timeout or 5xx, so it is only resent after a 429, which Notion rejects
+    before doing any work.
+    """
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if exc is None:
+        return False
+    if retry_state.kwargs.get("idempotent", True):
+        return _is_transient_error(exc)
+    return isinstance(exc, HTTPResponseError) and exc.status == 429
+
+
+def _title_prop(text: str) -> Dict[str, Any]:
+    """Build a title property payload"""
+    return {"title": [{"text": {"content": text}}]}
+
+
+def _rt_prop(text: str) -> Dict[str, Any]:
+    """Build a rich_text property payload"""
+    return {"rich_text": [{"text": {"content": text}}]}
+
+
+# Validator for pages.create/update property payloads, built once at import
+_PROPERTIES_ADAPTER = TypeAdapter(Dict[str, NotionPropertyPayload])
+
+
+def _validate_props(properties: Dict[str, Any], page_id: Optional[str] = None) -> None:
+    """Check a property payload locally before spending a request on it
+    
+    Args:
+        properties: Properties payload for pages.create/update
+        page_id: Page the payload is for, used in the error
+        
+    Raises:
+        NotionAPIError: If the payload does not match a supported property shape
+    """
+    try:
+        _PROPERTIES_ADAPTER.validate_python(properties)
+    except ValidationError as e:
+        raise NotionAPIError(f"Invalid Notion property payload: {e}", page_id=page_id)
+
+
+# Marker for property handlers that found no value and should fall back to the default
+_MISSING = object()
+
 
 class NotionService:
     """Service for interacting with Notion API"""
@@ -24,12 +122,67 @@ class NotionService:
         Args:
             api_key: Notion API key, defaults to config value
         """
-        self.client = Client(auth=api_key or config.notion_api_key)
+        self._api_key = api_key or config.notion_api_key
+        self._http_client = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60)
+        )
+        self.client = Client(auth=self._api_key, client=self._http_client)
         self.database_id = config.notion_database_id
         
+        # Property type -> value extractor, used by _get_property_value
+        self._prop_handlers = {
+            "select": self._extract_select_prop,
+            "rich_text": self._extract_rich_text_prop,
+            "title": self._extract_title_prop,
+            "url": operator.itemgetter("url"),
+            "number": operator.itemgetter("number"),
+            "checkbox": operator.itemgetter("checkbox"),
+        }
+        
+        # Notion rate limits per integration: a token bucket caps the request
+        # rate and semaphores cap how many calls are in flight at once
+        self._limiter = AsyncTokenBucket(config.notion_requests_per_second, config.notion_burst_size)
+        self._sem = asyncio.Semaphore(config.notion_max_concurrent_requests)
+        self._write_sem = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+        
+        # page_id -> (last_edited_time, parsed page), least recently used first
+        self._page_cache: "OrderedDict[str, Tuple[str, NotionPage]]" = OrderedDict()
+    
+    @classmethod
+    def get(cls, api_key: Optional[str] = None) -> "NotionService":
+        """Get the shared Notion service for an API key
+        
+        Reusing one instance keeps the underlying connection pool warm instead
+        of paying a new TCP/TLS handshake for every request.
+        
+        Args:
+            api_key: Notion API key, defaults to config value
+            
+        Returns:
+            Cached NotionService instance for the API key
+        """
+        key = api_key or config.notion_api_key
+        service = _instances.get(key)
+        if service is None:
+            service = _instances[key] = cls(key)
+        return service
+    
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool
+        
+        The instance is also dropped from the shared cache so the next
+        NotionService.get() call builds a fresh client.
+        """
+        if _instances.get(self._api_key) is self:
+            del _instances[self._api_key]
+        self._http_client.close()
+        
     async def get_page(self, page_id: str) -> NotionPage:
         """Retrieve a Notion page by ID
         
+        Parsed pages are cached on their last_edited_time, so an unchanged page
+        only costs the page retrieve call.
+        
         Args:
             page_id: The Notion page ID
             
@@ -45,13 +198,20 @@ class NotionService:
         content = ""
         
         try:
-            logger.info(f"Fetching Notion page: {page_id}")
+            logger.info("Fetching Notion page: %s", page_id)
             
             # Get page content
-            page = self.client.pages.retrieve(page_id=page_id)
+            page = await self._request(self.client.pages.retrieve, page_id=page_id)
+            
+            # Serve the parsed page from cache if it has not been edited since
+            cached = self._page_cache.get(page_id)
+            if cached and cached[0] == page["last_edited_time"]:
+                self._page_cache.move_to_end(page_id)
+                logger.info("Using cached Notion page: %s", page_id)
+                return cached[1].model_copy()
             
             # Get page content blocks
-            blocks = self.client.blocks.children.list(block_id=page_id)
+            blocks = await self._request(self.client.blocks.children.list, block_id=page_id)
             
             # Extract title
             title = self._extract_title(page)
@@ -70,13 +230,13 @@ class NotionService:
                     prop_content = self._get_rich_text_property(properties, prop_name)
                     if prop_content and prop_content.strip():
                         content = prop_content
-                        logger.info(f"Extracted content from '{prop_name}' property: {len(content)} chars")
+                        logger.info("Extracted content from '%s' property: %s chars", prop_name, len(content))
                         break
             
             # If still no content, use title as content (common for structured entries)
             if not content.strip() and title:
                 content = title
-                logger.info(f"No block or property content found, using title as content: {len(content)} chars")
+                logger.info("No block or property content found, using title as content: %s chars", len(content))
             
             # Parse format and status
             format_prop = self._get_property_value(properties, "Format", CarouselFormat.FACEBOOK.value)
@@ -87,10 +247,10 @@ class NotionService:
             google_folder_url = self._get_property_value(properties, "Google Folder URL")
             
             # Parse timestamps
-            created_time = datetime.fromisoformat(page["created_time"].replace("Z", "+00:00"))
-            last_edited_time = datetime.fromisoformat(page["last_edited_time"].replace("Z", "+00:00"))
+            created_time = _parse_timestamp(page["created_time"])
+            last_edited_time = _parse_timestamp(page["last_edited_time"])
             
-            return NotionPage(
+            notion_page = NotionPage(
                 id=page_id,
                 title=title,
                 content=content,
@@ -103,6 +263,13 @@ class NotionService:
                 properties=properties
             )
             
+            self._page_cache[page_id] = (page["last_edited_time"], notion_page)
+            self._page_cache.move_to_end(page_id)
+            if len(self._page_cache) > _PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+            
+            return notion_page.model_copy()
+            
         except APIResponseError as e:
             error_msg = f"Failed to retrieve Notion page {page_id}: {e}"
             logger.error(error_msg)
@@ -136,7 +303,7 @@ class NotionService:
             NotionAPIError: If page update fails
         """
         try:
-            logger.info(f"Updating Notion page {page_id} to status: {status.value}")
+            logger.info("Updating Notion page %s to status: %s", page_id, status.value)
             
             # Prepare properties update
             properties = {
@@ -152,7 +319,7 @@ class NotionService:
                 properties["Images"] = {
                     "url": google_folder_url
                 }
-                logger.info(f"Adding Google Drive URL to page: {google_folder_url}")
+                logger.info("Adding Google Drive URL to page: %s", google_folder_url)
             
             # Update Format field from "Carousel" to "Complete" if requested
             if mark_format_complete:
@@ -165,10 +332,8 @@ class NotionService:
             
             # Add system message usage tracking if used
             if system_message_used:
-                from datetime import datetime
-                
                 # Get current page to check available properties
-                page = self.client.pages.retrieve(page_id=page_id)
+                page = await self._request(self.client.pages.retrieve, page_id=page_id)
                 available_properties = page.get("properties", {})
                 
                 # Add system message usage fields if they exist
@@ -187,12 +352,9 @@ class NotionService:
                     logger.info("Updating Last_System_Message_Date")
             
             # Update the page
-            self.client.pages.update(
-                page_id=page_id,
-                properties=properties
-            )
+            await self._update_page(page_id, properties)
             
-            logger.info(f"Successfully updated Notion page {page_id}")
+            logger.info("Successfully updated Notion page %s", page_id)
             return True
             
         except APIResponseError as e:
@@ -204,6 +366,69 @@ class NotionService:
             logger.error(error_msg)
             raise NotionAPIError(error_msg, page_id=page_id)
     
+    async def retrieve_page(self, page_id: str) -> Dict[str, Any]:
+        """Retrieve a raw Notion page object
+        
+        Args:
+            page_id: The Notion page ID
+            
+        Returns:
+            Page object as returned by the Notion API
+        """
+        return await self._request(self.client.pages.retrieve, page_id=page_id)
+    
+    async def check_connection(self, database_id: str) -> None:
+        """Query a single row of a database to confirm the API is reachable
+        
+        Args:
+            database_id: Notion database ID to query
+        """
+        await self._request(self.client.databases.query, database_id=database_id, page_size=1)
+    
+    @retry(
+        retry=_should_retry,
+        wait=wait_retry_after_or_exponential(initial=1, max=30),
+        stop=stop_after_attempt(6),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    async def _request(self, method: Callable[..., Any], *, idempotent: bool = True, **kwargs: Any) -> Any:
+        """Call a Notion SDK method within the service's rate limits
+        
+        The SDK client is synchronous, so the call runs in a worker thread and
+        the concurrency limit bounds real in-flight requests. Rate limited
+        (429) and transient server errors are retried with backoff, honoring
+        Retry-After when Notion sends it.
+        
+        Args:
+            method: Bound Notion SDK method, e.g. self.client.pages.update
+            idempotent: False for calls that must not be resent after a
+                timeout or server error, e.g. pages.create
+            **kwargs: Arguments for the SDK method
+            
+        Returns:
+            SDK response
+        """
+        async with self._sem, self._limiter:
+            return await asyncio.to_thread(method, **kwargs)
+    
+    async def _update_page(self, page_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Update page properties, limiting the number of concurrent writes
+        
+        Args:
+            page_id: The Notion page ID
+            properties: Properties payload for pages.update
+            
+        Returns:
+            Updated page object
+            
+        Raises:
+            NotionAPIError: If the payload fails local validation
+        """
+        _validate_props(properties, page_id)
+        async with self._write_sem:
+            return await self._request(self.client.pages.update, page_id=page_id, properties=properties)
+    
     def _extract_title(self, page: Dict[str, Any]) -> str:
         """Extract title from Notion page
         
@@ -230,7 +455,7 @@ class NotionService:
             return "Untitled"
             
         except Exception as e:
-            logger.warning(f"Error extracting title: {e}")
+            logger.warning("Error extracting title: %s", e)
             return "Untitled"
     
     def _extract_content(self, blocks: Dict[str, Any]) -> str:
@@ -242,48 +467,32 @@ class NotionService:
         Returns:
             Combined text content
         """
-        content_parts = []
-        
         try:
-            for block in blocks.get("results", []):
-                block_type = block.get("type")
-                
-                if block_type == "paragraph":
-                    text = self._extract_rich_text(block["paragraph"].get("rich_text", []))
-                    if text.strip():
-                        content_parts.append(text)
-                        
-                elif block_type == "bulleted_list_item":
-                    text = self._extract_rich_text(block["bulleted_list_item"].get("rich_text", []))
-                    if text.strip():
-                        content_parts.append(f"• {text}")
-                        
-                elif block_type == "numbered_list_item":
-                    text = self._extract_rich_text(block["numbered_list_item"].get("rich_text", []))
-                    if text.strip():
-                        content_parts.append(f"1. {text}")
-                        
-                elif block_type == "heading_1":
-                    text = self._extract_rich_text(block["heading_1"].get("rich_text", []))
-                    if text.strip():
-                        content_parts.append(f"# {text}")
-                        
-                elif block_type == "heading_2":
-                    text = self._extract_rich_text(block["heading_2"].get("rich_text", []))
-                    if text.strip():
-                        content_parts.append(f"## {text}")
-                        
-                elif block_type == "heading_3":
-                    text = self._extract_rich_text(block["heading_3"].get("rich_text", []))
-                    if text.strip():
-                        content_parts.append(f"### {text}")
-            
-            return "\n\n".join(content_parts)
+            return "\n\n".join(self._iter_block_texts(blocks))
             
         except Exception as e:
-            logger.error(f"Error extracting content from blocks: {e}")
+            logger.error("Error extracting content from blocks: %s", e)
             return ""
     
+    def _iter_block_texts(self, blocks: Dict[str, Any]) -> Iterator[str]:
+        """Yield the formatted text of each supported, non-empty block
+        
+        Args:
+            blocks: Notion blocks response
+            
+        Yields:
+            Block text with its list or heading prefix
+        """
+        for block in blocks.get("results", ()):
+            block_type = block.get("type")
+            prefix = _BLOCK_HANDLERS.get(block_type)
+            if prefix is None:
+                continue
+            
+            text = self._extract_rich_text(block[block_type].get("rich_text", ()))
+            if text.strip():
+                yield prefix + text
+    
     def _extract_rich_text(self, rich_text: list) -> str:
         """Extract plain text from Notion rich text objects
         
@@ -296,7 +505,7 @@ class NotionService:
         try:
             return "".join([item.get("plain_text", "") for item in rich_text])
         except Exception as e:
-            logger.error(f"Error extracting rich text: {e}")
+            logger.error("Error extracting rich text: %s", e)
             return ""
     
     def _get_property_value(self, properties: Dict[str, Any], property_name: str, default: Any = None) -> Any:
@@ -312,27 +521,31 @@ class NotionService:
         """
         try:
             prop = properties.get(property_name, {})
-            prop_type = prop.get("type")
-            
-            if prop_type == "select" and prop.get("select"):
-                return prop["select"].get("name")
-            elif prop_type == "rich_text":
-                return self._extract_rich_text(prop.get("rich_text", []))
-            elif prop_type == "title":
-                return self._extract_rich_text(prop.get("title", []))
-            elif prop_type == "url":
-                return prop.get("url")
-            elif prop_type == "number":
-                return prop.get("number")
-            elif prop_type == "checkbox":
-                return prop.get("checkbox")
-                
-            return default
+            handler = self._prop_handlers.get(prop.get("type"))
+            if handler is None:
+                return default
+            
+            value = handler(prop)
+            return default if value is _MISSING else value
             
         except Exception as e:
-            logger.error(f"Error extracting property {property_name}: {e}")
+            logger.error("Error extracting property %s: %s", property_name, e)
             return default
     
+    @staticmethod
+    def _extract_select_prop(prop: Dict[str, Any]) -> Any:
+        """Extract the option name from a select property"""
+        select = prop.get("select")
+        return select.get("name") if select else _MISSING
+    
+    def _extract_rich_text_prop(self, prop: Dict[str, Any]) -> str:
+        """Extract plain text from a rich_text property"""
+        return self._extract_rich_text(prop.get("rich_text", ()))
+    
+    def _extract_title_prop(self, prop: Dict[str, Any]) -> str:
+        """Extract plain text from a title property"""
+        return self._extract_rich_text(prop.get("title", ()))
+    
     def _get_rich_text_property(self, properties: Dict[str, Any], property_name: str) -> str:
         """Get rich text content from a property
         
@@ -360,7 +573,7 @@ class NotionService:
             NotionAPIError: If database query fails
         """
         try:
-            logger.info(f"Querying Notion database: {database_id}")
+            logger.info("Querying Notion database: %s", database_id)
             
             # Build query with optional filter
             query_params = {
@@ -382,12 +595,12 @@ class NotionService:
                         "equals": format_filter
                     }
                 }
-                logger.info(f"Filtering for Format = {format_filter}")
+                logger.info("Filtering for Format = %s", format_filter)
             
-            response = self.client.databases.query(**query_params)
+            response = await self._request(self.client.databases.query, **query_params)
             
             pages = response.get("results", [])
-            logger.info(f"Retrieved {len(pages)} pages from database")
+            logger.info("Retrieved %s pages from database", len(pages))
             
             return pages
             
@@ -414,7 +627,7 @@ class NotionService:
             NotionAPIError: If database query fails
         """
         try:
-            logger.info(f"Querying database for Carousel records with Brainstorming status")
+            logger.info("Querying database for Carousel records with Brainstorming status")
             
             # Build compound filter for Format='Carousel' AND Status='Brainstorming'
             query_params = {
@@ -446,10 +659,10 @@ class NotionService:
             
             logger.info("Filtering for Format='Carousel' AND Status='Brainstorming'")
             
-            response = self.client.databases.query(**query_params)
+            response = await self._request(self.client.databases.query, **query_params)
             
             pages = response.get("results", [])
-            logger.info(f"Found {len(pages)} Carousel records with Brainstorming status")
+            logger.info("Found %s Carousel records with Brainstorming status", len(pages))
             
             return pages
             
@@ -462,6 +675,36 @@ class NotionService:
             logger.error(error_msg)
             raise NotionAPIError(error_msg)
     
+    async def query_brainstorming_carousels_full(self, database_id: str, limit: int = 10) -> List[NotionPage]:
+        """Query Brainstorming carousels and fetch each matching page
+        
+        Args:
+            database_id: The Notion database ID
+            limit: Maximum number of pages to return
+            
+        Returns:
+            List of NotionPage models; pages that fail to load are skipped
+            
+        Raises:
+            NotionAPIError: If the database query fails
+        """
+        pages = await self.query_brainstorming_carousels(database_id, limit)
+        
+        results = await asyncio.gather(
+            *(self.get_page(page["id"]) for page in pages),
+            return_exceptions=True
+        )
+        
+        notion_pages = []
+        for page, result in zip(pages, results):
+            if isinstance(result, NotionPage):
+                notion_pages.append(result)
+            else:
+                logger.warning("Skipping brainstorming carousel %s: %s", page.get('id'), result)
+        
+        logger.info("Loaded %s of %s brainstorming carousels", len(notion_pages), len(pages))
+        return notion_pages
+    
     async def query_client_projects(self, database_id: str, project_name: str) -> list:
         """Query Client Project Database for name matching
         
@@ -476,7 +719,7 @@ class NotionService:
             NotionAPIError: If database query fails
         """
         try:
-            logger.info(f"Searching for client project: {project_name}")
+            logger.info("Searching for client project: %s", project_name)
             
             # Build query to search for project name in both Name (title) and Client_Project_Name fields
             query_params = {
@@ -500,12 +743,12 @@ class NotionService:
                 "page_size": 10
             }
             
-            logger.info(f"Searching Name and Client_Project_Name fields for: '{project_name}'")
+            logger.info("Searching Name and Client_Project_Name fields for: '%s'", project_name)
             
-            response = self.client.databases.query(**query_params)
+            response = await self._request(self.client.databases.query, **query_params)
             
             projects = response.get("results", [])
-            logger.info(f"Found {len(projects)} matching client projects")
+            logger.info("Found %s matching client projects", len(projects))
             
             # If multiple matches, prefer the one with existing system message data
             if len(projects) > 1:
@@ -516,7 +759,7 @@ class NotionService:
                     system_message_generated = properties.get("System_Message_Generated", {}).get("checkbox", False)
                     
                     if system_message_url and system_message_generated:
-                        logger.info(f"Prioritizing project with system message: {project.get('id')}")
+                        logger.info("Prioritizing project with system message: %s", project.get('id'))
                         return [project]  # Return only the one with system message
                 
                 # If no project has system message, return the first one
@@ -547,7 +790,7 @@ class NotionService:
             NotionAPIError: If page retrieval fails
         """
         try:
-            logger.info(f"Fetching Social Media Dashboard page: {page_id}")
+            logger.info("Fetching Social Media Dashboard page: %s", page_id)
             return await self.get_page(page_id)
         except Exception as e:
             error_msg = f"Failed to retrieve Social Media Dashboard page {page_id}: {e}"
@@ -586,7 +829,7 @@ class NotionService:
             return "Unknown_Client"
             
         except Exception as e:
-            logger.warning(f"Error extracting client name: {e}")
+            logger.warning("Error extracting client name: %s", e)
             return "Unknown_Client"
     
     async def update_client_project_system_message(
@@ -611,10 +854,10 @@ class NotionService:
             NotionAPIError: If update fails
         """
         try:
-            logger.info(f"Updating Client Project {project_id} with system message references")
+            logger.info("Updating Client Project %s with system message references", project_id)
             
             # Get current page to check available properties
-            page = self.client.pages.retrieve(page_id=project_id)
+            page = await self._request(self.client.pages.retrieve, page_id=project_id)
             available_properties = page.get("properties", {})
             
             # Build properties update with only available properties
@@ -625,77 +868,57 @@ class NotionService:
                 properties["System_Message_URL"] = {
                     "url": system_message_url
                 }
-                logger.info(f"Will update System_Message_URL")
+                logger.info("Will update System_Message_URL")
             
             if "System_Message_Generated" in available_properties:
                 properties["System_Message_Generated"] = {
                     "checkbox": True
                 }
-                logger.info(f"Will update System_Message_Generated")
+                logger.info("Will update System_Message_Generated")
             
             # Update Content Engine Profile Updated checkbox 
             if "Content Engine Profile Updated" in available_properties:
                 properties["Content Engine Profile Updated"] = {
                     "checkbox": True
                 }
-                logger.info(f"Will update Content Engine Profile Updated")
+                logger.info("Will update Content Engine Profile Updated")
             
             # Update Client_Project_Name field with extracted client name
             if "Client_Project_Name" in available_properties and client_name:
-                properties["Client_Project_Name"] = {
-                    "rich_text": [
-                        {
-                            "text": {
-                                "content": client_name
-                            }
-                        }
-                    ]
-                }
-                logger.info(f"Will update Client_Project_Name with: {client_name}")
+                properties["Client_Project_Name"] = _rt_prop(client_name)
+                logger.info("Will update Client_Project_Name with: %s", client_name)
             
             # Optional properties - only add if they exist
             if "System_Message_File_ID" in available_properties:
                 # Try to determine the property type
                 prop_type = available_properties["System_Message_File_ID"].get("type")
                 if prop_type == "rich_text":
-                    properties["System_Message_File_ID"] = {
-                        "rich_text": [
-                            {
-                                "text": {
-                                    "content": system_message_file_id
-                                }
-                            }
-                        ]
-                    }
+                    properties["System_Message_File_ID"] = _rt_prop(system_message_file_id)
                 elif prop_type == "url":
                     # If it's a URL field, we'd need the full Google Drive URL, not just file ID
                     pass
-                logger.info(f"Will update System_Message_File_ID ({prop_type})")
+                logger.info("Will update System_Message_File_ID (%s)", prop_type)
             else:
-                logger.warning(f"System_Message_File_ID property not found, skipping")
+                logger.warning("System_Message_File_ID property not found, skipping")
             
             if "Last_System_Message_Update" in available_properties:
-                from datetime import datetime
                 properties["Last_System_Message_Update"] = {
                     "date": {
                         "start": datetime.now().isoformat()
                     }
                 }
-                logger.info(f"Will update Last_System_Message_Update")
+                logger.info("Will update Last_System_Message_Update")
             else:
-                logger.warning(f"Last_System_Message_Update property not found, skipping")
+                logger.warning("Last_System_Message_Update property not found, skipping")
             
             if not properties:
-                logger.warning(f"No updatable properties found for project {project_id}")
+                logger.warning("No updatable properties found for project %s", project_id)
                 return False
             
             # Update the page
-            self.client.pages.update(
-                page_id=project_id,
-                properties=properties
-            )
+            await self._update_page(project_id, properties)
             
-            logger.info(f"Successfully updated Client Project {project_id} with {len(properties)} properties")
+            logger.info("Successfully updated Client Project %s with %s properties", project_id, len(properties))
             return True
             
         except APIResponseError as e:
@@ -727,12 +950,10 @@ class NotionService:
             NotionAPIError: If update fails
         """
         try:
-            logger.info(f"Updating Client Project {project_id} usage tracking for carousel: {carousel_title}")
-            
-            from datetime import datetime
+            logger.info("Updating Client Project %s usage tracking for carousel: %s", project_id, carousel_title)
             
             # Get current page to check available properties
-            page = self.client.pages.retrieve(page_id=project_id)
+            page = await self._request(self.client.pages.retrieve, page_id=project_id)
             available_properties = page.get("properties", {})
             
             # Build properties update for usage tracking
@@ -761,36 +982,25 @@ class NotionService:
                 properties["System_Message_Usage_Count"] = {
                     "number": current_count + 1
                 }
-                logger.info(f"Will update System_Message_Usage_Count from {current_count} to {current_count + 1}")
+                logger.info("Will update System_Message_Usage_Count from %s to %s", current_count, current_count + 1)
             else:
                 logger.warning("System_Message_Usage_Count field not found, skipping")
             
             # Update Last Used For field with carousel title
             if "Last_Used_For" in available_properties:
-                properties["Last_Used_For"] = {
-                    "rich_text": [
-                        {
-                            "text": {
-                                "content": carousel_title
-                            }
-                        }
-                    ]
-                }
-                logger.info(f"Will update Last_Used_For with: {carousel_title}")
+                properties["Last_Used_For"] = _rt_prop(carousel_title)
+                logger.info("Will update Last_Used_For with: %s", carousel_title)
             else:
                 logger.warning("Last_Used_For field not found, skipping")
             
             if not properties:
-                logger.warning(f"No updatable usage tracking properties found for project {project_id}")
+                logger.warning("No updatable usage tracking properties found for project %s", project_id)
                 return False
             
             # Update the page
-            self.client.pages.update(
-                page_id=project_id,
-                properties=properties
-            )
+            await self._update_page(project_id, properties)
             
-            logger.info(f"Successfully updated client project usage tracking: {project_id}")
+            logger.info("Successfully updated client project usage tracking: %s", project_id)
             return True
             
         except Exception as e:
@@ -798,6 +1008,62 @@ class NotionService:
             logger.error(error_msg)
             raise NotionAPIError(error_msg)
     
+    async def bulk_update_usage(
+        self,
+        project_ids: List[str],
+        carousel_page_id: str,
+        carousel_title: str
+    ) -> List[bool]:
+        """Record system message usage on several client projects concurrently
+        
+        Updates run through the shared rate limiter and concurrency limits.
+        
+        Args:
+            project_ids: Client Project Database page IDs
+            carousel_page_id: Content Engine DB page ID that used the system message
+            carousel_title: Title of the carousel that used the system message
+            
+        Returns:
+            Per-project success flags, in the same order as project_ids
+        """
+        results = await asyncio.gather(
+            *(
+                self.update_client_project_usage_tracking(project_id, carousel_page_id, carousel_title)
+                for project_id in project_ids
+            ),
+            return_exceptions=True
+        )
+        
+        return [self._bulk_result(project_id, result) is True for project_id, result in zip(project_ids, results)]
+    
+    async def bulk_create_projects(self, database_id: str, project_names: List[str]) -> List[Optional[dict]]:
+        """Create several client projects concurrently
+        
+        Creates run through the shared rate limiter and concurrency limits.
+        
+        Args:
+            database_id: Client Project Database ID
+            project_names: Names for the new projects
+            
+        Returns:
+            Created project page objects in the same order as project_names,
+            with None for projects that failed to create
+        """
+        results = await asyncio.gather(
+            *(self._create_client_project(database_id, name) for name in project_names),
+            return_exceptions=True
+        )
+        
+        return [self._bulk_result(name, result) for name, result in zip(project_names, results)]
+    
+    @staticmethod
+    def _bulk_result(item: str, result: Any) -> Any:
+        """Log a failed bulk operation result and map it to None"""
+        if isinstance(result, BaseException):
+            logger.error("Bulk Notion operation failed for %s: %s", item, result)
+            return None
+        return result
+    
     async def _create_client_project(self, database_id: str, project_name: str) -> dict:
         """Create a new client project in the Client Project Database
         
@@ -811,45 +1077,31 @@ class NotionService:
         Raises:
             NotionAPIError: If project creation fails
         """
+        logger.info("Creating new client project: %s", project_name)
+        
+        # Prepare properties for new client project
+        properties = {
+            "Name": _title_prop(project_name),  # Title field
+            "Client_Project_Name": _rt_prop(project_name)  # Rich text field
+        }
+        _validate_props(properties)
+        
+        # Create the page
         try:
-            logger.info(f"Creating new client project: {project_name}")
-            
-            # Prepare properties for new client project
-            properties = {
-                "Name": {  # Title field
-                    "title": [
-                        {
-                            "text": {
-                                "content": project_name
-                            }
-                        }
-                    ]
-                },
-                "Client_Project_Name": {  # Rich text field
-                    "rich_text": [
-                        {
-                            "text": {
-                                "content": project_name
-                            }
-                        }
-                    ]
-                }
-            }
-            
-            # Create the page
-            response = self.client.pages.create(
+            response = await self._request(
+                self.client.pages.create,
+                idempotent=False,
                 parent={"database_id": database_id},
                 properties=properties
             )
-            
-            logger.info(f"Successfully created client project: {response.get('id')}")
-            return response
-            
         except APIResponseError as e:
             error_msg = f"Failed to create client project '{project_name}': {e}"
             logger.error(error_msg)
-            raise NotionAPIError(error_msg)
+            raise NotionAPIError(error_msg) from e
         except Exception as e:
             error_msg = f"Unexpected error creating client project '{project_name}': {e}"
             logger.error(error_msg)
-            raise NotionAPIError(error_msg)
\ No newline at end of file
+            raise NotionAPIError(error_msg) from e
+        
+        logger.info("Successfully created client project: %s", response.get('id'))
+        return response
\ No newline at end of file
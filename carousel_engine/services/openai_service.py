@@ -2,17 +2,661 @@
 OpenAI API service for Carousel Engine v2
 """
 
+import importlib.util
+import asyncio
 import logging
-from typing import Optional
-import openai
-from openai import OpenAI
-import requests
+import random
+import re
+import sys
+import zlib
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterator, Optional
+import httpx
+import orjson
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI, RateLimitError
+from openai import OpenAIError as OpenAISDKError
+from openai.types import CompletionUsage
+from tenacity import before_sleep_log, retry, retry_if_exception, stop_after_attempt
 
 from ..core.config import config
 from ..core.exceptions import OpenAIError
+from ..utils.cache import DiskCache, FileCache, MemoryCache, RedisSemanticCache, SemanticCache, make_cache_key
+from ..utils.retry import wait_retry_after_or_exponential
 
 logger = logging.getLogger(__name__)
 
+# Connection pool settings for the OpenAI HTTP client; keep-alive lets repeated
+# completions reuse the TCP/TLS session instead of reconnecting every call
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60.0)
+
+# HTTP/2 needs the optional h2 package
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Generated image downloads: fail fast on connect, allow slow transfers
+_DOWNLOAD_TIMEOUT = httpx.Timeout(10.0, read=30.0)
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+# Title keyword sets -> background scene options, checked in priority order
+_THEME_KEYWORDS = (
+    (frozenset({"peace", "confidence", "mind", "secure"}),
+     ("serene bedroom with soft pillows", "quiet reading nook", "peaceful family room")),
+    (frozenset({"budget", "cost", "money", "financial"}),
+     ("organized home office", "clean kitchen with calculators", "tidy financial planning space")),
+    (frozenset({"lifestyle", "living", "community", "neighborhood"}),
+     ("vibrant living room with community views", "welcoming front porch", "family gathering space")),
+    (frozenset({"upgrade", "improve", "better", "enhance"}),
+     ("modern renovated kitchen", "stylish updated bathroom", "contemporary living space")),
+    (frozenset({"slow", "pause", "patient", "careful"}),
+     ("quiet meditation corner", "calm study space", "peaceful contemplation area")),
+)
+_DEFAULT_THEMES = ("welcoming living room", "bright kitchen area", "cozy family space")
+
+# Visual theme -> background style description
+_THEME_STYLES = {
+    "luxury": "luxurious materials, marble textures, gold accents, premium finishes, sophisticated lighting",
+    "modern": "clean lines, minimalist design, contemporary furniture, geometric shapes, neutral colors",
+    "warm": "warm colors, cozy atmosphere, inviting textures, soft lighting, comfortable furnishings",
+    "professional": "clean and organized, sophisticated neutral colors, business-appropriate aesthetics",
+    "vibrant": "bright accent colors, energetic atmosphere, dynamic composition, bold design elements"
+}
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+def _tokenize(text: str) -> frozenset:
+    """Split text into a set of lowercase words"""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
+class _KeywordBuckets:
+    """Match text against prioritized keyword buckets in a single regex pass
+    
+    Keywords match as substrings, like ``keyword in text``. Every keyword is
+    compiled into one lookahead alternation ordered by bucket priority, so
+    each position in the text reports its highest-priority keyword and
+    overlapping matches are not lost.
+    """
+    
+    def __init__(self, buckets: tuple):
+        """Initialize keyword buckets
+        
+        Args:
+            buckets: (keywords, value) pairs in priority order
+        """
+        self.values = tuple(value for _, value in buckets)
+        self._priority: dict[str, int] = {}
+        for priority, (keywords, _) in enumerate(buckets):
+            for keyword in keywords:
+                self._priority.setdefault(keyword, priority)
+        ordered = sorted(self._priority, key=self._priority.__getitem__)
+        self._pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+    
+    def matches(self, text: str) -> list[tuple[int, str]]:
+        """Return (bucket_index, keyword) for every keyword occurrence in text"""
+        return [(self._priority[m.group(1)], m.group(1)) for m in self._pattern.finditer(text)]
+    
+    def first(self, text: str, default: Any = None) -> Any:
+        """Return the value of the highest-priority bucket with a match"""
+        matches = self.matches(text)
+        return self.values[min(matches)[0]] if matches else default
+
+
+# ENHANCED Real Estate Detection - Tennessee residential focus
+_REAL_ESTATE_KEYWORDS = (
+    # Direct real estate terms
+    'real estate', 'realtor', 'property', 'home', 'buyer', 'seller', 'listing',
+    'house', 'residential', 'agent', 'broker', 'mortgage', 'closing',
+
+    # Geographic indicators
+    'tennessee', 'tn', 'nashville', 'memphis', 'knoxville', 'chattanooga',
+    'franklin', 'murfreesboro', 'clarksville', 'jackson', 'johnson city',
+    'south', 'southern', 'southeast',
+
+    # Real estate specific terms
+    'mls', 'appraisal', 'inspection', 'contract', 'deed', 'title',
+    'neighborhood', 'community', 'subdivision', 'market analysis',
+    'first time buyer', 'investment property', 'rental', 'lease',
+    'square feet', 'sqft', 'bedroom', 'bathroom', 'lot size',
+    'new construction', 'foreclosure', 'short sale', 'refinance',
+
+    # Emotional/lifestyle terms common in real estate
+    'dream home', 'family home', 'starter home', 'forever home',
+    'move', 'relocate', 'relocation', 'downsize', 'upgrade',
+    'school district', 'walkable', 'commute', 'neighborhood',
+    'local market', 'housing market'
+)
+
+# Business types in priority order, real estate first
+_BUSINESS_TYPES = _KeywordBuckets((
+    (_REAL_ESTATE_KEYWORDS, ('real_estate', None)),
+    (('fitness', 'gym', 'workout', 'health', 'nutrition', 'personal trainer', 'wellness'),
+     ('fitness', "💪 FITNESS business detected")),
+    (('restaurant', 'food', 'chef', 'dining', 'cuisine', 'menu', 'culinary'),
+     ('restaurant', "🍽️ RESTAURANT business detected")),
+    (('coach', 'coaching', 'consultant', 'mentor', 'business coach', 'life coach'),
+     ('coaching', "🎯 COACHING business detected")),
+    (('e-commerce', 'retail', 'store', 'shop', 'product', 'selling', 'brand'),
+     ('retail', "🛍️ RETAIL business detected")),
+    (('lawyer', 'attorney', 'accountant', 'financial', 'consulting', 'professional'),
+     ('professional_services', "⚖️ PROFESSIONAL SERVICES detected")),
+    (('corporate', 'business', 'enterprise', 'company', 'office', 'executive', 'management'),
+     ('corporate', "🏢 CORPORATE business detected")),
+    (('tech', 'software', 'app', 'saas', 'platform', 'digital', 'startup'),
+     ('technology', "💻 TECHNOLOGY business detected")),
+    (('beauty', 'spa', 'salon', 'skincare', 'massage', 'aesthetics'),
+     ('beauty', "💄 BEAUTY business detected")),
+))
+
+# Emotional themes that apply across industries, in priority order
+_EMOTIONS = _KeywordBuckets((
+    (('overwhelmed', 'confident', 'fear', 'peace', 'mind', 'stress'), 'calming_confidence'),
+    (('success', 'achievement', 'growth', 'results'), 'success_oriented'),
+    (('luxury', 'premium', 'exclusive', 'high-end'), 'luxury_focused'),
+))
+
+# Business type -> emotion -> visual focus
+_FOCUS_MAP = {
+    'real_estate': {
+        'calming_confidence': 'warm, inviting Tennessee home interior with cozy fireplace and natural light',
+        'success_oriented': 'beautiful Southern home exterior with front porch and mature landscaping',
+        'luxury_focused': 'upscale Tennessee residential architecture with luxury Southern charm',
+        'professional_standard': 'professionally staged Tennessee home with warm, welcoming atmosphere'
+    },
+    'fitness': {
+        'calming_confidence': 'serene, well-equipped fitness studio with natural lighting',
+        'success_oriented': 'modern gym with success-focused motivational atmosphere',
+        'luxury_focused': 'premium fitness facility with high-end equipment',
+        'professional_standard': 'clean, professional fitness environment'
+    },
+    'restaurant': {
+        'calming_confidence': 'warm, inviting restaurant interior with ambient lighting',
+        'success_oriented': 'bustling, successful restaurant kitchen in action',
+        'luxury_focused': 'upscale fine dining restaurant with elegant atmosphere',
+        'professional_standard': 'professional commercial kitchen or dining space'
+    },
+    'coaching': {
+        'calming_confidence': 'peaceful, professional office space for consultations',
+        'success_oriented': 'modern business environment showcasing growth and success',
+        'luxury_focused': 'premium executive office with sophisticated decor',
+        'professional_standard': 'clean, professional meeting or office space'
+    },
+    'retail': {
+        'calming_confidence': 'welcoming, organized retail space with soft lighting',
+        'success_oriented': 'thriving retail store with customers and activity',
+        'luxury_focused': 'high-end boutique with premium product displays',
+        'professional_standard': 'clean, well-organized retail environment'
+    },
+    'professional_services': {
+        'calming_confidence': 'calm, trustworthy professional office environment',
+        'success_oriented': 'modern business office showcasing professionalism and success',
+        'luxury_focused': 'executive-level office with premium furnishings',
+        'professional_standard': 'clean, professional business environment'
+    },
+    'technology': {
+        'calming_confidence': 'clean, modern tech workspace with calming elements',
+        'success_oriented': 'innovative tech office with cutting-edge equipment',
+        'luxury_focused': 'premium tech headquarters with sophisticated design',
+        'professional_standard': 'professional tech workspace or office'
+    },
+    'beauty': {
+        'calming_confidence': 'serene spa treatment room with soft, natural lighting',
+        'success_oriented': 'modern beauty salon with professional equipment',
+        'luxury_focused': 'luxury spa or high-end beauty salon with premium atmosphere',
+        'professional_standard': 'clean, professional beauty or wellness space'
+    },
+    'corporate': {
+        'calming_confidence': 'professional corporate office with calming, organized atmosphere',
+        'success_oriented': 'modern corporate headquarters showcasing business success',
+        'luxury_focused': 'premium executive boardroom with high-end corporate design',
+        'professional_standard': 'clean corporate office environment with business atmosphere'
+    }
+}
+
+# Visual theme -> base DALL-E visual elements
+_THEME_ELEMENTS = {
+    "luxury": "premium materials, elegant fixtures, sophisticated lighting, high-end finishes",
+    "modern": "clean lines, contemporary design, minimalist aesthetic, natural light",
+    "warm": "cozy textures, warm lighting, inviting atmosphere, comfortable elements",
+    "professional": "clean design, neutral tones, business-appropriate elegance, organized space",
+    "vibrant": "bright natural light, energetic colors, dynamic atmosphere, engaging elements"
+}
+
+# Business type -> industry-specific DALL-E visual elements
+_INDUSTRY_ELEMENTS = {
+    'real_estate': "Southern architectural details, Tennessee home staging, cozy family atmosphere, residential warmth and charm",
+    'fitness': "exercise equipment, motivational elements, health-focused atmosphere, active energy",
+    'restaurant': "culinary elements, dining atmosphere, food presentation spaces, hospitality warmth",
+    'coaching': "consultation areas, growth-oriented atmosphere, trust-building elements, professional rapport",
+    'retail': "product displays, customer-friendly layout, brand presentation, shopping experience",
+    'professional_services': "credibility elements, trust-building atmosphere, expertise showcase, client comfort",
+    'technology': "innovation elements, modern tech aesthetic, cutting-edge atmosphere, digital sophistication",
+    'beauty': "wellness atmosphere, relaxation elements, self-care environment, transformation space",
+    'corporate': "business authority, executive presence, corporate professionalism, enterprise atmosphere"
+}
+
+# DALL-E background prompt; {business}, {focus}, {elements} and {title} are filled per request
+_DALLE_PROMPT = (
+    "Ultra-high-quality professional {business} photography of a {focus}, showcasing {elements}. "
+    "The scene should convey the emotional theme of '{title}' - creating powerful feelings that resonate with "
+    "the target audience and inspire trust, confidence, and engagement. "
+    "Technical specifications: Shot with professional camera equipment, perfect depth of field, razor-sharp focus, "
+    "studio-quality lighting with soft shadows and balanced exposure. Wide angle view optimized for text overlay placement. "
+    "Visual style: Award-winning commercial photography, luxury brand aesthetic, magazine cover quality, "
+    "Instagram-worthy composition with sophisticated color grading and professional post-processing. "
+    "Composition requirements: Clean background areas for text placement, balanced visual weight, "
+    "leading lines that guide the eye, professional staging and arrangement. "
+    "Lighting setup: Multi-point professional lighting with key light, fill light, and accent lighting "
+    "to create dimensional depth and premium atmosphere appropriate for {business}. "
+    "Avoid: People, faces, text, logos, brand names, cluttered details, harsh shadows, "
+    "dark areas that interfere with text readability, amateur photography aesthetics. "
+    "Color palette: Sophisticated, brand-appropriate colors that complement text overlays and "
+    "create emotional connection with the target audience. "
+    "Final result: Premium visual that elevates brand perception and drives engagement."
+)
+
+# Client context keywords -> DALL-E audience adaptation, all matches applied in order
+_AUDIENCE_ADAPTATIONS = (
+    (("millennial",), " Appeal to millennial preferences with modern, clean, authentic design."),
+    (("luxury", "premium"), " Emphasize luxury elements, premium materials, and sophisticated atmosphere."),
+    (("first-time", "beginner"), " Show approachable, welcoming spaces that reduce anxiety and build confidence."),
+    (("professional", "business"), " Emphasize credibility, expertise, and professional excellence."),
+)
+
+
+# Slide header lines in GPT output ("SLIDE 1:", "SLIDE 2 - HOOK:", ...)
+_SLIDE_SPLIT = re.compile(r"^[ \t]*SLIDE [^\n]*$", re.MULTILINE)
+
+# Meta-commentary GPT sometimes adds around the slides; lines containing these are dropped
+_UNWANTED_PHRASES = (
+    "here's your carousel",
+    "i'll create",
+    "let me craft",
+    "here are the slides",
+    "i've created",
+    "this carousel",
+    "here's how",
+    "let's break this down",
+    "i've optimized",
+    "here's the content",
+    "based on your request",
+)
+_UNWANTED_RE = re.compile("|".join(map(re.escape, _UNWANTED_PHRASES)), re.IGNORECASE)
+
+# Line prefixes marking notes, markdown emphasis and placeholders rather than slide text
+_UNWANTED_PREFIXES = ('*', '[', 'Note:')
+
+
+def _is_slide_line(line: str) -> bool:
+    """Check whether a stripped line of GPT output belongs on a slide"""
+    # Skip lines that are clearly commentary/meta-text
+    return bool(line) and not line.startswith(_UNWANTED_PREFIXES) and not _UNWANTED_RE.search(line)
+
+
+# Slides up to this length are interned, so repeated short slides share one string
+_MAX_INTERNED_SLIDE_CHARS = 512
+
+
+def _intern_slide(slide_text: str) -> str:
+    """Intern short slide texts; longer ones are returned unchanged"""
+    return sys.intern(slide_text) if len(slide_text) < _MAX_INTERNED_SLIDE_CHARS else slide_text
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """Check whether an OpenAI SDK error is worth retrying (rate limits, 5xx, connection drops)"""
+    if isinstance(exc, (RateLimitError, APIConnectionError)):
+        return True
+    return isinstance(exc, APIStatusError) and exc.status_code >= 500
+
+
+# Completions shared by every service instance in the process; the disk cache
+# backs it across restarts
+_response_cache = MemoryCache(
+    maxsize=config.openai_memory_cache_size,
+    default_ttl=config.openai_memory_cache_ttl_seconds
+)
+
+# Near-duplicate lookups for background descriptions and DALL-E images, used
+# when config.openai_semantic_cache_enabled is set. Descriptions are small, so
+# they're shared across workers through Redis when a URL is configured. The
+# image cache maps to (size, FileCache key) so HD images stay on disk
+_description_semantic_cache = RedisSemanticCache(
+    config.semantic_cache_redis_url,
+    fallback=SemanticCache(
+        threshold=config.openai_semantic_cache_threshold,
+        maxsize=config.openai_semantic_cache_size
+    ),
+    index_name="bg_description_idx",
+    prefix="bg:",
+    ttl=config.openai_cache_ttl_seconds
+)
+_image_semantic_cache = SemanticCache(
+    threshold=config.openai_semantic_cache_threshold,
+    maxsize=config.openai_semantic_cache_size
+)
+
+# Multi-content slide optimization: contents per GPT call and the response delimiters
+_MAX_CONTENTS_PER_CALL = 10
+_ITEM_BLOCK_RE = re.compile(r"<<ITEM (\d+)>>(.*?)<<END>>", re.DOTALL)
+
+# Batch API jobs are billed at half the real-time price
+_BATCH_DISCOUNT = 0.5
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+_EMBEDDING_MODEL = "text-embedding-3-small"
+_EMBEDDING_COST_PER_TOKEN = 0.00000002  # $0.02 per 1M tokens
+
+
+# Retry policy for OpenAI requests; the SDK's own retries are disabled in favor of this
+_openai_retry = retry(
+    retry=retry_if_exception(_is_transient_error),
+    wait=wait_retry_after_or_exponential(initial=1, max=30),
+    stop=stop_after_attempt(config.openai_max_retries),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+
+
+def _is_transient_download_error(exc: BaseException) -> bool:
+    """Check whether an image download failure is worth retrying (timeouts, dropped connections, 5xx)"""
+    if isinstance(exc, (httpx.TimeoutException, httpx.NetworkError)):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code >= 500
+
+
+# Retry policy for downloading generated images
+_download_retry = retry(
+    retry=retry_if_exception(_is_transient_download_error),
+    wait=wait_retry_after_or_exponential(initial=1, max=30),
+    stop=stop_after_attempt(config.openai_max_retries),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+
+
+@lru_cache(maxsize=1024)
+def _bg_prompt(title: str, style: str, theme: str, variant_seed: int = 0) -> str:
+    """Build the background description prompt (see OpenAIService._create_background_description_prompt)"""
+    # Match title words against theme keywords for content-specific imagery
+    tokens = _tokenize(title)
+    content_themes = _DEFAULT_THEMES
+    for keywords, themes in _THEME_KEYWORDS:
+        if tokens & keywords:
+            content_themes = themes
+            break
+    
+    # Select a theme - seeded by the title (not hash(), which varies per process)
+    # so the same title gives the same prompt; variant_seed picks another scene
+    selected_theme = random.Random(zlib.crc32(title.encode("utf-8")) + variant_seed).choice(content_themes)
+    
+    theme_description = _THEME_STYLES.get(theme, _THEME_STYLES["modern"])
+    
+    return (
+        f"Create a detailed description for a {theme} social media background image for real estate content titled: '{title}'. "
+        f"The background should feature: {selected_theme} with {theme_description}. "
+        f"Style requirements: {style} with excellent contrast areas for text overlay. "
+        f"The image should evoke emotions related to the theme of '{title}' while maintaining professional real estate standards. "
+        f"Avoid: people, text, logos, busy patterns, or overly detailed elements that would interfere with text readability. "
+        f"Focus on: architectural elements, interior design, lighting, and spatial composition that supports the emotional message of '{title}'. "
+        f"Describe the color palette, lighting conditions, furniture arrangement, and any unique design elements that make this background "
+        f"specifically tailored to the content theme. Keep the description detailed but concise (under 200 words)."
+    )
+
+
+# Carousel optimization guidelines; {lines_per_slide} is filled per request
+_CONTENT_GUIDELINES = (
+    "You are a professional Instagram carousel strategist creating polished, strategic content that stands alone "
+    "while amplifying Facebook copy. Your carousels are self-contained stories that encourage swiping through "
+    "natural narrative flow and curiosity gaps.\n\n"
+    
+    "PROFESSIONAL CAROUSEL STRUCTURE (Slides 1-7):\n\n"
+    
+    "SLIDE 1 - HOOK: Bold, scroll-stopping headline (max 5 words)\n"
+    "  • Grab attention immediately with power phrases\n"
+    "  • Examples: 'This Changes Everything', 'You're Missing This', 'The Hidden Truth'\n"
+    "  • Create instant intrigue that demands the swipe\n\n"
+    
+    "SLIDE 2 - PROBLEM/INSIGHT: Establish tension or context\n"
+    "  • Build on slide 1's hook with deeper context\n"
+    "  • Use smooth transitions: 'Here's what happens...', 'The problem is...', 'Most people believe...'\n"
+    "  • Create anticipation for the solution coming next\n\n"
+    
+    "SLIDE 3 - VALUE POINT 1: Single benefit, fact, or emotional driver\n"
+    "  • Focus on ONE key insight that builds the story\n"
+    "  • Connect logically: 'That's when I discovered...', 'The breakthrough came when...'\n"
+    "  • Provide the 'aha moment' that explains slide 2's tension\n\n"
+    
+    "SLIDE 4 - VALUE POINT 2: Proof, data, or transformation story\n"
+    "  • Build credibility with evidence or deeper insight\n"
+    "  • Transition smoothly: 'Here's why this matters...', 'The real impact was...'\n"
+    "  • Set up anticipation for practical application\n\n"
+    
+    "SLIDE 5 - SOLUTION/ACTION: Clear takeaway or action step\n"
+    "  • Show the outcome/solution in action\n"
+    "  • Connect with: 'So we started...', 'The result was...', 'Now when you...'\n"
+    "  • Demonstrate real-world application of previous insights\n\n"
+    
+    "SLIDE 6 - DEEPENING (Optional): Bonus insight, testimonial, or visual punch\n"
+    "  • Strengthen the transformation story\n"
+    "  • Use: 'And the best part...', 'What's even better...', 'This led to...'\n"
+    "  • Provide additional evidence or benefits\n\n"
+    
+    "SLIDE 7 - BRAND/CTA: Reinforce brand identity and next action\n"
+    "  • Close the story loop with satisfying resolution\n"
+    "  • Clear, specific call to action ('Book your free consult' not 'Learn more')\n"
+    "  • Make the CTA feel like the natural conclusion to their journey\n\n"
+    
+    "COHESIVE FLOW PRINCIPLES:\n"
+    "- NEVER break sentences or thoughts across slides - each slide must be complete\n"
+    "- Use literary devices for cliffhangers: curiosity gaps, not abrupt cuts\n"
+    "- Each slide must stand alone AND contribute to the whole story\n"
+    "- Create natural narrative bridges between slides\n"
+    "- Build emotional momentum that crescendos toward resolution\n"
+    "- Every slide should feel like the next logical chapter\n\n"
+    
+    "PROFESSIONAL TEXT RULES:\n"
+    "- MAX {lines_per_slide} lines per slide, 4-6 words per line (mobile-optimized)\n"
+    "- Short, declarative sentences or powerful phrases\n"
+    "- Every word must serve purpose - remove all filler\n"
+    "- Write for skimmability - assume quick swiping\n"
+    "- Use verbs and benefit-focused language\n"
+    "- Direct address ('you') to keep it personal\n"
+    "- Favor clarity over cleverness - avoid jargon\n\n"
+    
+    "LITERARY CLIFFHANGER TECHNIQUES:\n"
+    "- Use curiosity gaps: 'You're missing this one thing...' (next slide reveals it)\n"
+    "- Employ foreshadowing: 'This discovery changed everything' (story unfolds)\n"
+    "- Create anticipation: 'Here's why it matters →' (natural bridge)\n"
+    "- Use incomplete revelation: 'The secret is simple...' (completed next slide)\n"
+    "- Build suspense through pacing: alternate short headlines with micro-stories\n\n"
+    
+    "ENGAGEMENT & SWIPE TECHNIQUES:\n"
+    "- Each slide must pass the 'single-slide test' (screenshot value)\n"
+    "- Create rhythm: alternate bold statements with context stories\n"
+    "- Use progressive revelation: each slide unveils another layer\n"
+    "- Reference previous slides to maintain cohesion\n"
+    "- End with forward momentum that feels natural, not forced\n\n"
+    
+    "QUALITY STANDARDS:\n"
+    "- Tell a full story visually and textually\n"
+    "- Clear and compelling without reading the caption\n"
+    "- Consistent hierarchy: headline > subtext > visual cue\n"
+    "- Smooth narrative flow that never feels choppy or disjointed\n"
+    "- Natural conclusion that doesn't feel abrupt\n\n"
+)
+
+# Output format for plain-text responses split on SLIDE headers
+_TEXT_FORMAT = (
+    "FORMATTING REQUIREMENTS:\n"
+    "- Start immediately with 'SLIDE 1:' followed by slide content\n"
+    "- Each slide contains ONLY text that will appear on the slide\n"
+    "- No introductory text, explanations, or meta-commentary\n"
+    "- No phrases like 'Here's your carousel' or 'I'll create'\n"
+    "- Focus on professional, cohesive storytelling\n\n"
+    
+    "Create a professional carousel where each slide flows seamlessly into the next, "
+    "building a complete narrative that feels polished, strategic, and engaging.\n\n"
+    
+    "Format your response EXACTLY as:\n"
+    "SLIDE 1:\n[bold hook - max 5 words]\n\n"
+    "SLIDE 2:\n[problem/insight that builds naturally]\n\n"
+    "... continuing through all slides with cohesive flow"
+)
+
+# Output format for JSON mode responses; braces are doubled for format_map
+_JSON_FORMAT = (
+    "FORMATTING REQUIREMENTS:\n"
+    "- Respond with a single JSON object and nothing else\n"
+    "- Each slide contains ONLY text that will appear on the slide\n"
+    "- No introductory text, explanations, or meta-commentary\n"
+    "- Focus on professional, cohesive storytelling\n\n"
+    
+    "Create a professional carousel where each slide flows seamlessly into the next, "
+    "building a complete narrative that feels polished, strategic, and engaging.\n\n"
+    
+    "Format your response EXACTLY as:\n"
+    '{{"slides": [["bold hook - max 5 words"], ["problem/insight line 1", "line 2"], ...]}}\n'
+    "with one inner array of lines per slide, in slide order"
+)
+
+_CONTENT_INSTRUCTIONS = _CONTENT_GUIDELINES + _TEXT_FORMAT
+
+# Upper bound on the prompt-sized default for generate_text_completion
+_MAX_TEXT_COMPLETION_TOKENS = 8000
+
+# Output token budget per slide line and for the JSON wrapper in JSON mode
+_TOKENS_PER_SLIDE_LINE = 30
+_JSON_OVERHEAD_TOKENS = 100
+
+_SLIDE_PERSONA = "You are an expert social media content creator who specializes in creating engaging carousel posts."
+
+# Static prefix of the carousel optimization prompt; the content is appended last
+_CONTENT_PROMPT_HEAD = _CONTENT_INSTRUCTIONS + "\n\nContent to transform:\n"
+
+
+@lru_cache(maxsize=8)
+def _content_prompt_head(lines_per_slide: int) -> str:
+    """Resolve the carousel optimization prompt prefix for a slide line count"""
+    return _CONTENT_PROMPT_HEAD.format_map({"lines_per_slide": lines_per_slide})
+
+
+@lru_cache(maxsize=16)
+def _slide_system_prompt(lines_per_slide: int, json_output: bool = False) -> str:
+    """Build the static system prompt for slide optimization
+    
+    Everything that doesn't depend on the content or client lives here, at
+    the start of the request, so OpenAI's automatic prompt caching can reuse
+    the prefix across calls.
+    """
+    instructions = _CONTENT_GUIDELINES + (_JSON_FORMAT if json_output else _TEXT_FORMAT)
+    return _SLIDE_PERSONA + "\n\n" + instructions.format_map({"lines_per_slide": lines_per_slide})
+
+
+def _json_slide_max_tokens(max_slides: int, lines_per_slide: int) -> int:
+    """Output budget for a JSON slide response
+    
+    The prompt's structure asks for up to seven slides whatever max_slides
+    is, so the budget covers at least that many.
+    """
+    return max(max_slides, 7) * lines_per_slide * _TOKENS_PER_SLIDE_LINE + _JSON_OVERHEAD_TOKENS
+
+
+# System message dicts are shared across requests and must be treated as read-only
+_DESIGNER_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a professional graphic designer specializing in social media background designs."
+}
+
+
+@lru_cache(maxsize=16)
+def _slide_system_message(lines_per_slide: int, json_output: bool = False) -> dict:
+    """Shared system message carrying the slide optimization instructions"""
+    return {"role": "system", "content": _slide_system_prompt(lines_per_slide, json_output)}
+
+
+@lru_cache(maxsize=64)
+def _client_system_message(client_system_message: str) -> dict:
+    """Shared system message carrying a client's personalization context"""
+    return {
+        "role": "system",
+        "content": f"Client-specific instructions and context:\n{client_system_message}"
+    }
+
+
+# Structured output schema for batched background descriptions
+_BACKGROUND_BATCH_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "background_descriptions",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "items": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["items"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Per-token GPT pricing in USD, keyed by model
+_GPT_PRICING = {
+    "gpt-4o": {"input": 0.00003, "output": 0.00006},  # $0.03 / $0.06 per 1K tokens
+}
+
+# DALL-E 3 HD quality pricing per image (as of 2024); other sizes use the square price
+_DALLE_HD_PRICING = {
+    "1024x1024": 0.080,  # $0.080 per HD image (double standard quality)
+    "1792x1024": 0.120,  # $0.120 per HD image (1.5x standard quality)
+    "1024x1792": 0.120,
+}
+_DALLE_HD_DEFAULT_PRICE = 0.080
+
+# Prompt tokens served from OpenAI's prompt cache are billed at half the input rate
+_CACHED_INPUT_DISCOUNT = 0.5
+
+# Output tokens assumed when estimating a completion's cost up front without a max_tokens cap
+_ESTIMATED_OUTPUT_TOKENS = 500
+
+
+@lru_cache(maxsize=None)
+def _get_encoder(model: str):
+    """Load the tiktoken encoding for a model, or None if it can't be loaded
+    
+    tiktoken downloads its BPE files on first use, which can fail in locked-down
+    environments; callers then fall back to a character-based estimate.
+    """
+    try:
+        # Imported lazily; only cost estimation needs it
+        import tiktoken
+        return tiktoken.encoding_for_model(model)
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable for {model}, estimating tokens from length: {e}")
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _count_tokens(prompt: str, model: str = "gpt-4o") -> int:
+    """Count prompt tokens for a model"""
+    encoder = _get_encoder(model)
+    if encoder is None:
+        # Rough token estimation (4 chars ≈ 1 token)
+        return len(prompt) // 4
+    return len(encoder.encode(prompt))
+
+
+async def collect_slides(slides: AsyncIterator[str]) -> list[str]:
+    """Drain a slide stream into a list
+    
+    Args:
+        slides: Async iterator from OpenAIService.stream_content_for_slides
+        
+    Returns:
+        All slide texts, in order
+    """
+    return [slide_text async for slide_text in slides]
+
 
 class OpenAIService:
     """Service for interacting with OpenAI API"""
@@ -23,14 +667,100 @@ class OpenAIService:
         Args:
             api_key: OpenAI API key, defaults to config value
         """
-        self.client = OpenAI(api_key=api_key or config.openai_api_key)
+        self._http_client = httpx.AsyncClient(limits=_HTTP_LIMITS, http2=_HTTP2_AVAILABLE)
+        self.client = AsyncOpenAI(
+            api_key=api_key or config.openai_api_key,
+            http_client=self._http_client,
+            max_retries=0
+        )
         self.total_cost = 0.0
         
+        # Bounds in-flight API calls when steps fan out with asyncio.gather;
+        # taken inside the retried helpers so backoff sleeps don't hold a slot
+        self._sem = asyncio.Semaphore(config.openai_max_concurrent_requests)
+        
+        # Persistent cache for deterministic completions; optional, so a
+        # read-only filesystem just disables caching
+        try:
+            self._cache = DiskCache(config.openai_cache_dir, default_ttl=config.openai_cache_ttl_seconds)
+        except Exception as e:
+            logger.warning(f"OpenAI response cache disabled: {e}")
+            self._cache = None
+        
+        # Generated images, keyed by the exact DALL-E request
+        try:
+            self._image_cache = FileCache(
+                config.openai_image_cache_dir,
+                max_bytes=config.openai_image_cache_max_bytes,
+                suffix=".png"
+            )
+        except Exception as e:
+            logger.warning(f"DALL-E image cache disabled: {e}")
+            self._image_cache = None
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool and response cache"""
+        await self._http_client.aclose()
+        if self._cache is not None:
+            self._cache.close()
+        
+    async def generate_carousel_assets(
+        self,
+        title: str,
+        content: str,
+        theme: str = "professional",
+        client_context: str = "",
+        max_slides: int = 5,
+        lines_per_slide: int = 2,
+        client_system_message: Optional[str] = None,
+        size: str = "1024x1024"
+    ) -> tuple[tuple[str, float], tuple[list[str], float], tuple[bytes, float]]:
+        """Generate everything a carousel needs from OpenAI concurrently
+        
+        The background description, slide optimization and DALL-E image are
+        independent, so they run together; the service's semaphore keeps
+        the number of in-flight requests within limits. If one fails, the
+        others are cancelled rather than left running (and billing).
+        
+        Args:
+            title: Content title
+            content: Raw content text
+            theme: Visual theme (luxury, modern, warm, professional, vibrant)
+            client_context: Client-specific context for image theming
+            max_slides: Maximum number of content slides (excluding title)
+            lines_per_slide: Maximum lines per slide
+            client_system_message: Optional client-specific system message for personalization
+            size: Image size (1024x1024, 1792x1024, or 1024x1792)
+            
+        Returns:
+            Tuple of ((background_description, cost), (slide_texts, cost), (image_data, cost))
+            
+        Raises:
+            OpenAIError: If any of the generations fails
+        """
+        tasks = [
+            asyncio.create_task(self.generate_background_description(title, theme=theme)),
+            asyncio.create_task(
+                self.optimize_content_for_slides(content, max_slides, lines_per_slide, client_system_message)
+            ),
+            asyncio.create_task(self.generate_background_image(title, theme, client_context, size))
+        ]
+        try:
+            description, slides, image = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return description, slides, image
+    
     async def generate_background_description(
         self, 
         title: str, 
         style: str = "professional social media background",
-        theme: str = "modern"
+        theme: str = "modern",
+        deterministic: bool = False,
+        cacheable: bool = False,
+        variant_seed: int = 0
     ) -> tuple[str, float]:
         """Generate a background image description using GPT model
         
@@ -38,6 +768,9 @@ class OpenAIService:
             title: Content title for image context
             style: Image style description
             theme: Visual theme (luxury, modern, warm, professional, vibrant)
+            deterministic: Use temperature 0 and a fixed seed so the response can be cached
+            cacheable: Cache the sampled response too, so re-runs on the same input reuse it
+            variant_seed: Pick a different background scene for the same title
             
         Returns:
             Tuple of (background_description, estimated_cost)
@@ -45,49 +778,148 @@ class OpenAIService:
         Raises:
             OpenAIError: If description generation fails
         """
+        logger.info(f"Generating background description for title: {title}")
+        
+        # Reuse the description of a near-identical title, if any; an explicit
+        # variant asks for something new, so it skips the semantic cache
+        embedding = None
+        if config.openai_semantic_cache_enabled and not variant_seed:
+            embedding = await self._embed(f"{title}|{theme}|{style}")
+            cached = await _description_semantic_cache.search(embedding) if embedding else None
+            if cached is not None:
+                logger.info("Using semantically cached background description")
+                return cached, 0.0
+        
+        # Create prompt for background description
+        prompt = self._create_background_description_prompt(title, style, theme, variant_seed)
+        
+        # Check cost limit
+        estimated_cost = self._estimate_gpt_cost(prompt, max_tokens=300)
+        if self.total_cost + estimated_cost > config.max_cost_per_run:
+            raise OpenAIError(
+                f"Cost limit would be exceeded. Current: ${self.total_cost:.2f}, "
+                f"Estimated: ${estimated_cost:.2f}, Limit: ${config.max_cost_per_run:.2f}",
+                prompt=prompt
+            )
+        
+        # Generate background description
         try:
-            logger.info(f"Generating background description for title: {title}")
-            
-            # Create prompt for background description
-            prompt = self._create_background_description_prompt(title, style, theme)
-            
-            # Check cost limit
-            estimated_cost = self._estimate_gpt_cost(prompt)
-            if self.total_cost + estimated_cost > config.max_cost_per_run:
-                raise OpenAIError(
-                    f"Cost limit would be exceeded. Current: ${self.total_cost:.2f}, "
-                    f"Estimated: ${estimated_cost:.2f}, Limit: ${config.max_cost_per_run:.2f}",
-                    prompt=prompt
-                )
-            
-            # Generate background description
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
+            response_text, usage = await self._chat_completion(
                 messages=[
-                    {"role": "system", "content": "You are a professional graphic designer specializing in social media background designs."},
+                    _DESIGNER_SYSTEM_MESSAGE,
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=300,
-                temperature=0.7
+                temperature=0.7,
+                deterministic=deterministic,
+                cacheable=cacheable
             )
+        except OpenAISDKError as e:
+            error_msg = f"OpenAI API error generating background description: {e}"
+            logger.error(error_msg)
+            raise OpenAIError(error_msg, prompt=prompt) from e
+        
+        if not response_text:
+            raise OpenAIError("Empty response from OpenAI API", prompt=prompt)
+        background_description = response_text.strip()
+        if embedding:
+            await _description_semantic_cache.add(embedding, background_description)
+        
+        # Calculate actual cost
+        actual_cost = self._calculate_actual_gpt_cost(usage)
+        self.total_cost += actual_cost
+        
+        logger.info(f"Successfully generated background description. Cost: ${actual_cost:.4f}")
+        return background_description, actual_cost
+    
+    async def generate_background_descriptions_batch(
+        self,
+        titles: list[str],
+        style: str = "professional social media background",
+        theme: str = "modern",
+        deterministic: bool = False,
+        cacheable: bool = False
+    ) -> list[tuple[str, float]]:
+        """Generate background descriptions for several titles in one GPT call
+        
+        One request carries every title's brief and returns a JSON array, so
+        the system prompt and round trip are paid once instead of per title.
+        
+        Args:
+            titles: Content titles for image context
+            style: Image style description
+            theme: Visual theme (luxury, modern, warm, professional, vibrant)
+            deterministic: Use temperature 0 and a fixed seed so the response can be cached
+            cacheable: Cache the sampled response too, so re-runs on the same input reuse it
             
-            background_description = response.choices[0].message.content.strip()
-            
-            # Calculate actual cost
-            actual_cost = self._calculate_actual_gpt_cost(response.usage)
-            self.total_cost += actual_cost
-            
-            logger.info(f"Successfully generated background description. Cost: ${actual_cost:.4f}")
-            return background_description, actual_cost
+        Returns:
+            List of (background_description, cost) in the same order as titles,
+            with the call's cost apportioned by description length
             
-        except openai.OpenAIError as e:
-            error_msg = f"OpenAI API error generating background description: {e}"
+        Raises:
+            OpenAIError: If description generation fails
+        """
+        if not titles:
+            return []
+        
+        logger.info(f"Generating {len(titles)} background descriptions in one request")
+        
+        briefs = "\n\n".join(
+            f"{i}. {self._create_background_description_prompt(title, style, theme)}"
+            for i, title in enumerate(titles, 1)
+        )
+        prompt = (
+            f"Write one background description for each of the {len(titles)} numbered briefs below. "
+            f"Return them as the JSON array \"items\", in the same order as the briefs.\n\n{briefs}"
+        )
+        
+        # Check cost limit
+        estimated_cost = self._estimate_gpt_cost(prompt, max_tokens=300 * len(titles))
+        if self.total_cost + estimated_cost > config.max_cost_per_run:
+            raise OpenAIError(
+                f"Cost limit would be exceeded. Current: ${self.total_cost:.2f}, "
+                f"Estimated: ${estimated_cost:.2f}, Limit: ${config.max_cost_per_run:.2f}",
+                prompt=prompt
+            )
+        
+        try:
+            response_text, usage = await self._chat_completion(
+                messages=[
+                    _DESIGNER_SYSTEM_MESSAGE,
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=300 * len(titles),
+                temperature=0.7,
+                deterministic=deterministic,
+                cacheable=cacheable,
+                response_format=_BACKGROUND_BATCH_FORMAT
+            )
+        except OpenAISDKError as e:
+            error_msg = f"OpenAI API error generating background descriptions: {e}"
             logger.error(error_msg)
-            raise OpenAIError(error_msg, prompt=prompt)
-        except Exception as e:
-            error_msg = f"Unexpected error generating background description: {e}"
+            raise OpenAIError(error_msg, prompt=prompt) from e
+        
+        # Calculate actual cost; the call is paid for even if the response is unusable
+        actual_cost = self._calculate_actual_gpt_cost(usage)
+        self.total_cost += actual_cost
+        
+        try:
+            descriptions = [item.strip() for item in orjson.loads(response_text or "")["items"]]
+        except (orjson.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            error_msg = f"Malformed background descriptions response: {e!r}"
             logger.error(error_msg)
-            raise OpenAIError(error_msg, prompt=prompt)
+            raise OpenAIError(error_msg, prompt=prompt) from e
+        if len(descriptions) != len(titles):
+            raise OpenAIError(
+                f"Expected {len(titles)} background descriptions, got {len(descriptions)}",
+                prompt=prompt
+            )
+        
+        # Split the cost across titles by output length
+        total_length = sum(len(d) for d in descriptions) or 1
+        
+        logger.info(f"Successfully generated {len(descriptions)} background descriptions. Cost: ${actual_cost:.4f}")
+        return [(d, actual_cost * len(d) / total_length) for d in descriptions]
     
     async def generate_background_image(
         self, 
@@ -110,23 +942,44 @@ class OpenAIService:
         Raises:
             OpenAIError: If image generation fails
         """
+        logger.info(f"Generating DALL-E 3 background image for title: {title}")
+        
+        # Create optimized prompt for real estate imagery
+        prompt = self._create_dalle_background_prompt(title, theme, client_context)
+        
+        # Reuse the image generated for exactly this request, if any
+        image_key = make_cache_key("dall-e-3", "hd", size, prompt)
+        if self._image_cache is not None:
+            cached_image = await asyncio.to_thread(self._image_cache.get, image_key)
+            if cached_image is not None:
+                logger.info("Using cached background image")
+                return cached_image, 0.0
+        
+        # Reuse the image for a near-identical title at the same size, if any.
+        # The prompt template is mostly boilerplate, so embed only what varies;
+        # the semantic cache holds file cache keys, not image bytes
+        embedding = None
+        if config.openai_semantic_cache_enabled and self._image_cache is not None:
+            embedding = await self._embed(f"{title}|{theme}|{size}")
+            cached = await asyncio.to_thread(_image_semantic_cache.search, embedding) if embedding else None
+            if cached is not None and cached[0] == size:
+                cached_image = await asyncio.to_thread(self._image_cache.get, cached[1])
+                if cached_image is not None:
+                    logger.info("Using semantically cached background image")
+                    return cached_image, 0.0
+        
+        # Check cost limit
+        estimated_cost = self._estimate_dalle_cost(size)
+        if self.total_cost + estimated_cost > config.max_cost_per_run:
+            raise OpenAIError(
+                f"Cost limit would be exceeded. Current: ${self.total_cost:.2f}, "
+                f"Estimated: ${estimated_cost:.2f}, Limit: ${config.max_cost_per_run:.2f}",
+                prompt=prompt
+            )
+        
         try:
-            logger.info(f"Generating DALL-E 3 background image for title: {title}")
-            
-            # Create optimized prompt for real estate imagery
-            prompt = self._create_dalle_background_prompt(title, theme, client_context)
-            
-            # Check cost limit
-            estimated_cost = self._estimate_dalle_cost(size)
-            if self.total_cost + estimated_cost > config.max_cost_per_run:
-                raise OpenAIError(
-                    f"Cost limit would be exceeded. Current: ${self.total_cost:.2f}, "
-                    f"Estimated: ${estimated_cost:.2f}, Limit: ${config.max_cost_per_run:.2f}",
-                    prompt=prompt
-                )
-            
             # Generate image with DALL-E 3 - HD quality for professional results
-            response = self.client.images.generate(
+            response = await self._openai_generate_image(
                 model="dall-e-3",
                 prompt=prompt,
                 size=size,
@@ -135,38 +988,36 @@ class OpenAIService:
             )
             
             # Get image URL and download
-            image_url = response.data[0].url
-            import requests
-            image_response = requests.get(image_url, timeout=30)
-            image_response.raise_for_status()
-            
-            image_data = image_response.content
-            
-            # Update cost tracking
-            self.total_cost += estimated_cost
-            
-            logger.info(f"Successfully generated background image. Cost: ${estimated_cost:.2f}")
-            return image_data, estimated_cost
-            
-        except openai.OpenAIError as e:
+            image_data = await self._download_image(response.data[0].url)
+        except OpenAISDKError as e:
             error_msg = f"OpenAI API error generating background image: {e}"
             logger.error(error_msg)
-            raise OpenAIError(error_msg, prompt=prompt)
-        except requests.RequestException as e:
+            raise OpenAIError(error_msg, prompt=prompt) from e
+        except httpx.HTTPError as e:
             error_msg = f"Failed to download generated image: {e}"
             logger.error(error_msg)
-            raise OpenAIError(error_msg, prompt=prompt)
-        except Exception as e:
-            error_msg = f"Unexpected error generating background image: {e}"
-            logger.error(error_msg)
-            raise OpenAIError(error_msg, prompt=prompt)
+            raise OpenAIError(error_msg, prompt=prompt) from e
+        
+        # Update cost tracking
+        self.total_cost += estimated_cost
+        
+        if self._image_cache is not None:
+            await asyncio.to_thread(self._image_cache.set, image_key, image_data)
+            if embedding:
+                _image_semantic_cache.add(embedding, (size, image_key))
+        
+        logger.info(f"Successfully generated background image. Cost: ${estimated_cost:.2f}")
+        return image_data, estimated_cost
     
     async def optimize_content_for_slides(
         self, 
         content: str, 
         max_slides: int = 5,
         lines_per_slide: int = 2,
-        client_system_message: Optional[str] = None
+        client_system_message: Optional[str] = None,
+        deterministic: bool = False,
+        cacheable: bool = False,
+        json_output: bool = True
     ) -> tuple[list[str], float]:
         """Optimize content for carousel slides using GPT
         
@@ -175,6 +1026,10 @@ class OpenAIService:
             max_slides: Maximum number of content slides (excluding title)
             lines_per_slide: Maximum lines per slide
             client_system_message: Optional client-specific system message for personalization
+            deterministic: Use temperature 0 and a fixed seed so the response can be cached
+            cacheable: Cache the sampled response too, so re-runs on the same input reuse it
+            json_output: Request slides in JSON mode with a tight output budget;
+                False uses the plain-text SLIDE format
             
         Returns:
             Tuple of (optimized_slide_texts, estimated_cost)
@@ -182,76 +1037,419 @@ class OpenAIService:
         Raises:
             OpenAIError: If content optimization fails
         """
+        logger.info(f"Optimizing content for {max_slides} slides")
+        
+        max_tokens = _json_slide_max_tokens(max_slides, lines_per_slide) if json_output else 1000
+        messages, prompt = self._build_slide_messages(
+            content, max_slides, lines_per_slide, client_system_message,
+            max_tokens=max_tokens, json_output=json_output
+        )
+        
+        # Call GPT-5
+        try:
+            content_text, usage = await self._chat_completion(
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=0.7,
+                deterministic=deterministic,
+                response_format={"type": "json_object"} if json_output else None,
+                cacheable=cacheable
+            )
+        except OpenAISDKError as e:
+            error_msg = f"OpenAI API error optimizing content: {e}"
+            logger.error(error_msg)
+            raise OpenAIError(error_msg, prompt=prompt) from e
+        
+        # Update cost tracking; the call is paid for even if the response is unusable
+        actual_cost = self._calculate_actual_gpt_cost(usage)
+        self.total_cost += actual_cost
+        
+        # Parse response
+        if json_output:
+            slide_texts = self._parse_json_slides(content_text or "")
+        else:
+            slide_texts = self._parse_optimized_content(content_text or "")
+        
+        logger.info(f"Successfully optimized content into {len(slide_texts)} slides. Cost: ${actual_cost:.4f}")
+        return slide_texts, actual_cost
+
+    async def stream_content_for_slides(
+        self,
+        content: str,
+        max_slides: int = 5,
+        lines_per_slide: int = 2,
+        client_system_message: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Optimize content for carousel slides, yielding each slide as it streams in
+        
+        A slide is yielded as soon as the next SLIDE header arrives, so callers
+        can start rendering while GPT is still writing the rest. Streamed
+        responses are never cached; use optimize_content_for_slides with
+        deterministic=True for that. Use collect_slides() to get a list.
+        
+        Args:
+            content: Raw content text
+            max_slides: Maximum number of content slides (excluding title)
+            lines_per_slide: Maximum lines per slide
+            client_system_message: Optional client-specific system message for personalization
+            
+        Yields:
+            Clean slide text, in order
+            
+        Raises:
+            OpenAIError: If content optimization fails
+        """
+        logger.info(f"Streaming optimized content for {max_slides} slides")
+        
+        messages, prompt = self._build_slide_messages(content, max_slides, lines_per_slide, client_system_message)
+        
+        buffer = ""
+        streamed = []
+        usage = None
+        slide_count = 0
         try:
-            logger.info(f"Optimizing content for {max_slides} slides")
-            
-            # Create system message - personalize if client system message available
-            system_message = "You are an expert social media content creator who specializes in creating engaging carousel posts."
-            if client_system_message:
-                system_message += f"\n\nClient-specific instructions and context:\n{client_system_message}"
-                logger.info("Using personalized system message with client context")
-            
-            # Create prompt for content optimization
-            prompt = self._create_content_optimization_prompt(content, max_slides, lines_per_slide)
-            
-            # Estimate cost
-            estimated_cost = self._estimate_gpt_cost(prompt)
-            if self.total_cost + estimated_cost > config.max_cost_per_run:
-                raise OpenAIError(
-                    f"Cost limit would be exceeded. Current: ${self.total_cost:.2f}, "
-                    f"Estimated: ${estimated_cost:.2f}, Limit: ${config.max_cost_per_run:.2f}",
-                    prompt=prompt
-                )
-            
-            # Call GPT-5
-            response = self.client.chat.completions.create(
+            stream = await self._openai_chat(
                 model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system_message
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
+                messages=messages,
                 max_tokens=1000,
-                temperature=0.7
+                temperature=0.7,
+                stream=True,
+                stream_options={"include_usage": True}
             )
             
-            # Parse response
-            content_text = response.choices[0].message.content
-            slide_texts = self._parse_optimized_content(content_text)
+            async for chunk in stream:
+                # The final chunk has no choices and carries token usage
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                
+                buffer += chunk.choices[0].delta.content
+                streamed.append(chunk.choices[0].delta.content)
+                
+                # Everything before the last complete SLIDE header line is finished
+                boundary = None
+                for match in _SLIDE_SPLIT.finditer(buffer):
+                    if match.end() < len(buffer):
+                        boundary = match.start()
+                if not boundary:
+                    continue
+                
+                for slide_text in self._iter_parsed_slides(buffer[:boundary]):
+                    slide_count += 1
+                    yield slide_text
+                buffer = buffer[boundary:]
+        except OpenAISDKError as e:
+            error_msg = f"OpenAI API error streaming content: {e}"
+            logger.error(error_msg)
+            raise OpenAIError(error_msg, prompt=prompt) from e
+        
+        for slide_text in self._iter_parsed_slides(buffer):
+            slide_count += 1
+            yield slide_text
+        
+        # Update cost tracking; a stream that ends without a usage chunk is
+        # estimated from the messages and the streamed text
+        if usage is not None:
+            actual_cost = self._calculate_actual_gpt_cost(usage)
+        else:
+            actual_cost = self._estimate_slide_messages_cost(messages, max_tokens=_count_tokens("".join(streamed)))
+        self.total_cost += actual_cost
+        
+        logger.info(f"Successfully streamed {slide_count} slides. Cost: ${actual_cost:.4f}")
+    
+    def _build_slide_messages(
+        self,
+        content: str,
+        max_slides: int,
+        lines_per_slide: int,
+        client_system_message: Optional[str],
+        max_tokens: int = 1000,
+        user_message: Optional[str] = None,
+        json_output: bool = False
+    ) -> tuple[list[dict], str]:
+        """Build chat messages for slide optimization and check the cost limit
+        
+        Args:
+            content: Raw content text
+            max_slides: Maximum number of content slides (excluding title)
+            lines_per_slide: Maximum lines per slide
+            client_system_message: Optional client-specific system message
+            max_tokens: Output cap of the request, used for the cost estimate
+            user_message: Replaces the default "Content to transform" user message
+            json_output: Ask for the JSON slide format instead of SLIDE headers
             
-            # Update cost tracking
-            actual_cost = self._calculate_actual_gpt_cost(response.usage)
-            self.total_cost += actual_cost
+        Returns:
+            Tuple of (messages, user_prompt)
             
-            logger.info(f"Successfully optimized content into {len(slide_texts)} slides. Cost: ${actual_cost:.4f}")
-            return slide_texts, actual_cost
+        Raises:
+            OpenAIError: If the estimated cost would exceed the per-run limit
+        """
+        messages = self._slide_messages(content, lines_per_slide, client_system_message, user_message, json_output)
+        
+        # Full prompt for cost estimation and error reporting
+        prompt = self._create_content_optimization_prompt(content, max_slides, lines_per_slide)
+        
+        # Estimate cost
+        estimated_cost = self._estimate_slide_messages_cost(messages, max_tokens)
+        if self.total_cost + estimated_cost > config.max_cost_per_run:
+            raise OpenAIError(
+                f"Cost limit would be exceeded. Current: ${self.total_cost:.2f}, "
+                f"Estimated: ${estimated_cost:.2f}, Limit: ${config.max_cost_per_run:.2f}",
+                prompt=prompt
+            )
+        
+        return messages, prompt
+    
+    def _slide_messages(
+        self,
+        content: str,
+        lines_per_slide: int,
+        client_system_message: Optional[str],
+        user_message: Optional[str] = None,
+        json_output: bool = False
+    ) -> list[dict]:
+        """Build chat messages for slide optimization (see _build_slide_messages)"""
+        # Static instructions first, then client context, then the content, so
+        # the request prefix is identical across calls and eligible for caching
+        messages = [_slide_system_message(lines_per_slide, json_output)]
+        if client_system_message:
+            messages.append(_client_system_message(client_system_message))
+            logger.info("Using personalized system message with client context")
+        messages.append({"role": "user", "content": user_message or f"Content to transform:\n{content}"})
+        return messages
+    
+    def _estimate_slide_messages_cost(self, messages: list[dict], max_tokens: int) -> float:
+        """Estimate the cost of a slide optimization request from its messages"""
+        return self._estimate_gpt_cost("\n\n".join(message["content"] for message in messages), max_tokens=max_tokens)
+
+    async def optimize_multiple_contents_for_slides(
+        self,
+        contents: list[str],
+        max_slides: int = 5,
+        lines_per_slide: int = 2,
+        client_system_message: Optional[str] = None
+    ) -> list[tuple[list[str], float]]:
+        """Optimize several contents for slides, packing them into shared GPT calls
+        
+        Up to ten contents go into one request that shares the system prompt
+        and round trip; the model returns each carousel between
+        <<ITEM k>> and <<END>> markers. If a response can't be split back
+        into every item, that group falls back to one call per content.
+        
+        Args:
+            contents: Raw content texts
+            max_slides: Maximum number of content slides (excluding title)
+            lines_per_slide: Maximum lines per slide
+            client_system_message: Optional client-specific system message for personalization
             
-        except openai.OpenAIError as e:
-            error_msg = f"OpenAI API error optimizing content: {e}"
+        Returns:
+            List of (optimized_slide_texts, cost) in the same order as contents,
+            with each call's cost apportioned by output length
+            
+        Raises:
+            OpenAIError: If content optimization fails
+        """
+        results: list[tuple[list[str], float]] = []
+        for start in range(0, len(contents), _MAX_CONTENTS_PER_CALL):
+            group = contents[start:start + _MAX_CONTENTS_PER_CALL]
+            results.extend(await self._optimize_content_group(group, max_slides, lines_per_slide, client_system_message))
+        return results
+    
+    async def _optimize_content_group(
+        self,
+        contents: list[str],
+        max_slides: int,
+        lines_per_slide: int,
+        client_system_message: Optional[str]
+    ) -> list[tuple[list[str], float]]:
+        """Optimize one group of contents in a single GPT call (see optimize_multiple_contents_for_slides)"""
+        if len(contents) == 1:
+            return [await self.optimize_content_for_slides(
+                contents[0], max_slides, lines_per_slide, client_system_message
+            )]
+        
+        logger.info(f"Optimizing {len(contents)} contents for slides in one request")
+        
+        packed = "\n\n".join(f"Content {k}:\n{content}" for k, content in enumerate(contents, 1))
+        user_message = (
+            f"Optimize the following {len(contents)} contents into separate carousels. "
+            f"Return each carousel between <<ITEM k>> and <<END>>, where k is the content number, "
+            f"using the slide format above inside each block.\n\n{packed}"
+        )
+        max_tokens = 1000 * len(contents)
+        messages, prompt = self._build_slide_messages(
+            packed, max_slides, lines_per_slide, client_system_message,
+            max_tokens=max_tokens, user_message=user_message
+        )
+        
+        try:
+            response_text, usage = await self._chat_completion(
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=0.7
+            )
+        except OpenAISDKError as e:
+            error_msg = f"OpenAI API error optimizing multiple contents: {e}"
             logger.error(error_msg)
-            raise OpenAIError(error_msg, prompt=prompt)
-        except Exception as e:
-            error_msg = f"Unexpected error optimizing content: {e}"
+            raise OpenAIError(error_msg, prompt=prompt) from e
+        
+        actual_cost = self._calculate_actual_gpt_cost(usage)
+        self.total_cost += actual_cost
+        
+        blocks = {int(k): text for k, text in _ITEM_BLOCK_RE.findall(response_text or "")}
+        if set(blocks) != set(range(1, len(contents) + 1)):
+            logger.warning(
+                f"Could not split multi-content response into {len(contents)} items "
+                f"(got {sorted(blocks)}), falling back to one request per content"
+            )
+            return list(await asyncio.gather(*(
+                self.optimize_content_for_slides(content, max_slides, lines_per_slide, client_system_message)
+                for content in contents
+            )))
+        
+        # Split the call's cost across contents by output length
+        total_length = sum(len(text) for text in blocks.values()) or 1
+        logger.info(f"Successfully optimized {len(contents)} contents in one request. Cost: ${actual_cost:.4f}")
+        return [
+            (self._parse_optimized_content(blocks[k]), actual_cost * len(blocks[k]) / total_length)
+            for k in range(1, len(contents) + 1)
+        ]
+    
+    async def batch_optimize_content_for_slides(
+        self,
+        contents: list[str],
+        max_slides: int = 5,
+        lines_per_slide: int = 2,
+        client_system_message: Optional[str] = None,
+        poll_interval: float = 30.0,
+        max_poll_interval: float = 600.0
+    ) -> list[tuple[list[str], float]]:
+        """Optimize several contents for slides through the OpenAI Batch API
+        
+        Intended for offline bulk runs: the requests are submitted as one
+        batch job at half the real-time price and a separate rate-limit pool,
+        but results can take up to 24 hours. Interactive callers should use
+        optimize_content_for_slides.
+        
+        Args:
+            contents: Raw content texts
+            max_slides: Maximum number of content slides (excluding title)
+            lines_per_slide: Maximum lines per slide
+            client_system_message: Optional client-specific system message for personalization
+            poll_interval: Initial seconds between batch status checks
+            max_poll_interval: Upper bound for the backed-off polling interval
+            
+        Returns:
+            List of (optimized_slide_texts, cost) in the same order as contents;
+            requests that failed inside the batch come back as ([], 0.0)
+            
+        Raises:
+            OpenAIError: If the batch would exceed the cost limit, can't be
+                submitted, doesn't complete or returns a malformed output line
+        """
+        if not contents:
+            return []
+        
+        logger.info(f"Submitting batch of {len(contents)} slide optimizations")
+        
+        # One request per line; the cost limit covers the whole batch, at the batch price
+        jsonl = bytearray()
+        estimated_cost = 0.0
+        for i, content in enumerate(contents):
+            messages = self._slide_messages(content, lines_per_slide, client_system_message)
+            estimated_cost += self._estimate_slide_messages_cost(messages, max_tokens=1000) * _BATCH_DISCOUNT
+            jsonl += orjson.dumps({
+                "custom_id": f"slides-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": "gpt-4o", "max_tokens": 1000, "temperature": 0.7, "messages": messages}
+            }) + b"\n"
+        
+        if self.total_cost + estimated_cost > config.max_cost_per_run:
+            raise OpenAIError(
+                f"Cost limit would be exceeded. Current: ${self.total_cost:.2f}, "
+                f"Estimated: ${estimated_cost:.2f}, Limit: ${config.max_cost_per_run:.2f}"
+            )
+        
+        try:
+            batch_file = await self._openai_call(
+                self.client.files.create,
+                file=("slides.jsonl", bytes(jsonl)),
+                purpose="batch"
+            )
+            batch = await self._openai_call(
+                self.client.batches.create,
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            
+            # Poll with exponential backoff until the job finishes
+            delay = poll_interval
+            while batch.status not in _BATCH_TERMINAL_STATUSES:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
+                batch = await self._openai_call(self.client.batches.retrieve, batch.id)
+            
+            if batch.status != "completed" or not batch.output_file_id:
+                raise OpenAIError(f"Batch {batch.id} ended with status '{batch.status}'")
+            
+            output = await self._openai_call(self.client.files.content, batch.output_file_id)
+        except OpenAISDKError as e:
+            error_msg = f"OpenAI API error running slide optimization batch: {e}"
             logger.error(error_msg)
-            raise OpenAIError(error_msg, prompt=prompt)
-
+            raise OpenAIError(error_msg) from e
+        
+        # Output lines are not guaranteed to be in input order
+        results: list[tuple[list[str], float]] = [([], 0.0)] * len(contents)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                item = orjson.loads(line)
+                index = int(item["custom_id"].removeprefix("slides-"))
+                response = item.get("response") or {}
+                if item.get("error") or response.get("status_code") != 200:
+                    logger.warning(f"Batch request {item['custom_id']} failed: {item.get('error') or response.get('body')}")
+                    continue
+                
+                body = response["body"]
+                content_text = body["choices"][0]["message"]["content"]
+                usage = CompletionUsage.model_validate(body["usage"])
+            except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+                # ValueError covers JSON decode, custom_id and usage validation errors
+                error_msg = f"Malformed line in batch {batch.id} output: {e!r}"
+                logger.error(error_msg)
+                raise OpenAIError(error_msg) from e
+            if not 0 <= index < len(results):
+                raise OpenAIError(f"Unknown custom_id {item['custom_id']!r} in batch {batch.id} output")
+            
+            slide_texts = self._parse_optimized_content(content_text or "")
+            cost = self._calculate_actual_gpt_cost(usage) * _BATCH_DISCOUNT
+            self.total_cost += cost
+            results[index] = (slide_texts, cost)
+        
+        logger.info(f"Batch {batch.id} optimized {sum(1 for slides, _ in results if slides)}/{len(contents)} contents")
+        return results
+    
     async def generate_text_completion(
         self,
         prompt: str,
-        max_tokens: int = 8000,  # Increased default for comprehensive outputs
-        temperature: float = 0.3
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.3,
+        deterministic: bool = False,
+        cacheable: bool = False
     ) -> str:
         """Generate text completion using GPT
         
         Args:
             prompt: Input prompt
-            max_tokens: Maximum tokens to generate
+            max_tokens: Maximum tokens to generate, sized from the prompt
+                length (up to 8000) when omitted
             temperature: Creativity level (0.0-1.0)
+            deterministic: Use temperature 0 and a fixed seed so the response can be cached
+            cacheable: Cache the sampled response too, so re-runs on the same input reuse it
             
         Returns:
             Generated text response
@@ -259,40 +1457,168 @@ class OpenAIService:
         Raises:
             OpenAIError: If text generation fails
         """
+        logger.info(f"Generating text completion: {len(prompt)} chars prompt")
+        
+        if max_tokens is None:
+            max_tokens = min(int(len(prompt) * 1.5), _MAX_TEXT_COMPLETION_TOKENS)
+        
         try:
-            logger.info(f"Generating text completion: {len(prompt)} chars prompt")
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
+            content, usage = await self._chat_completion(
                 messages=[
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=max_tokens,
-                temperature=temperature
+                temperature=temperature,
+                deterministic=deterministic,
+                cacheable=cacheable
             )
+        except OpenAISDKError as e:
+            error_msg = f"OpenAI API error generating text: {e}"
+            logger.error(error_msg)
+            raise OpenAIError(error_msg) from e
+        
+        if not content:
+            raise OpenAIError("Empty response from OpenAI API")
+        
+        # Track costs
+        cost = self._calculate_actual_gpt_cost(usage)
+        self.total_cost += cost
+        
+        logger.info(f"Generated text completion: {len(content)} chars, cost: ${cost:.4f}")
+        return content
+    
+    async def _chat_completion(
+        self,
+        messages: list[dict],
+        max_tokens: int,
+        temperature: float,
+        deterministic: bool = False,
+        model: str = "gpt-4o",
+        response_format: Optional[dict] = None,
+        cacheable: bool = False
+    ) -> tuple[Optional[str], Optional[Any]]:
+        """Run a chat completion, serving repeated requests from the response cache
+        
+        Deterministic requests (temperature 0, fixed seed) are always cached.
+        Sampled responses are expected to vary between runs, so they are only
+        cached when the caller opts in with cacheable. Lookups check the
+        in-memory cache first, then the disk cache.
+        
+        Args:
+            messages: Chat messages
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature, ignored when deterministic
+            deterministic: Force temperature 0 and seed 0 and use the cache
+            model: Model name
+            response_format: Optional structured output format
+            cacheable: Cache the response even when it is sampled
             
-            if not response or not response.choices:
-                raise OpenAIError("No response from OpenAI API")
-            
-            content = response.choices[0].message.content
-            if not content:
-                raise OpenAIError("Empty response from OpenAI API")
+        Returns:
+            Tuple of (response_text, usage); usage is None for cache hits,
+            which cost nothing
             
-            # Track costs
-            cost = self._calculate_actual_gpt_cost(response.usage)
-            self.total_cost += cost
+        Raises:
+            OpenAIError: If the API returns no choices, or a structured
+                response was cut off at max_tokens
+        """
+        request = {"model": model, "messages": messages, "max_tokens": max_tokens, "temperature": temperature}
+        if response_format is not None:
+            request["response_format"] = response_format
+        if deterministic:
+            request["temperature"] = 0
+            request["seed"] = 0
+        
+        cache_key = None
+        if deterministic or cacheable:
+            cache_key = make_cache_key(request)
+            cached = _response_cache.get(cache_key)
+            if cached is None and self._cache is not None:
+                # SQLite I/O runs off the event loop
+                cached = await asyncio.to_thread(self._cache.get, cache_key)
+                if cached is not None:
+                    _response_cache.set(cache_key, cached)
+            if cached is not None:
+                logger.info("Using cached OpenAI completion")
+                return cached, None
+        
+        response = await self._openai_chat(**request)
+        if not response or not response.choices:
+            raise OpenAIError("No response from OpenAI API")
+        
+        # Structured output cut off at max_tokens is invalid JSON; the call is
+        # still billed, so its cost is tracked before giving up
+        if response_format is not None and response.choices[0].finish_reason == "length":
+            self.total_cost += self._calculate_actual_gpt_cost(response.usage, model)
+            raise OpenAIError(f"Structured response truncated at max_tokens={max_tokens}")
+        
+        content = response.choices[0].message.content
+        if cache_key is not None and content:
+            _response_cache.set(cache_key, content)
+            if self._cache is not None:
+                await asyncio.to_thread(self._cache.set, cache_key, content)
+        
+        return content, response.usage
+    
+    @_download_retry
+    async def _download_image(self, url: str) -> bytes:
+        """Download a generated image, retrying timeouts and transient server errors
+        
+        Args:
+            url: Image URL returned by the images API
             
-            logger.info(f"Generated text completion: {len(content)} chars, cost: ${cost:.4f}")
-            return content
+        Returns:
+            Image bytes
+        """
+        async with self._http_client.stream("GET", url, timeout=_DOWNLOAD_TIMEOUT) as image_response:
+            image_response.raise_for_status()
+            buffer = bytearray()
+            async for chunk in image_response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                buffer.extend(chunk)
+        return bytes(buffer)
+    
+    async def _embed(self, text: str) -> Optional[list[float]]:
+        """Embed text for the semantic caches
+        
+        Best effort: on failure the caller just skips the semantic cache.
+        
+        Args:
+            text: Text to embed
             
-        except openai.OpenAIError as e:
-            error_msg = f"OpenAI API error generating text: {e}"
-            logger.error(error_msg)
-            raise OpenAIError(error_msg)
-        except Exception as e:
-            error_msg = f"Unexpected error generating text: {e}"
-            logger.error(error_msg)
-            raise OpenAIError(error_msg)
+        Returns:
+            Embedding vector, or None if the request failed
+        """
+        try:
+            response = await self._openai_embed(model=_EMBEDDING_MODEL, input=text)
+        except OpenAISDKError as e:
+            logger.warning(f"Embedding request failed, skipping semantic cache: {e}")
+            return None
+        
+        self.total_cost += response.usage.total_tokens * _EMBEDDING_COST_PER_TOKEN
+        return response.data[0].embedding
+    
+    @_openai_retry
+    async def _openai_embed(self, **kwargs):
+        """Create embeddings, retrying rate limits and transient server errors"""
+        async with self._sem:
+            return await self.client.embeddings.create(**kwargs)
+    
+    @_openai_retry
+    async def _openai_call(self, method, *args, **kwargs):
+        """Call any other OpenAI client method, retrying rate limits and transient server errors"""
+        async with self._sem:
+            return await method(*args, **kwargs)
+    
+    @_openai_retry
+    async def _openai_chat(self, **kwargs):
+        """Create a chat completion, retrying rate limits and transient server errors"""
+        async with self._sem:
+            return await self.client.chat.completions.create(**kwargs)
+    
+    @_openai_retry
+    async def _openai_generate_image(self, **kwargs):
+        """Generate an image, retrying rate limits and transient server errors"""
+        async with self._sem:
+            return await self.client.images.generate(**kwargs)
     
     def get_total_cost(self) -> float:
         """Get total cost for this service instance
@@ -306,61 +1632,28 @@ class OpenAIService:
         """Reset cost tracking to zero"""
         self.total_cost = 0.0
     
-    def _create_background_description_prompt(self, title: str, style: str, theme: str) -> str:
+    def _create_background_description_prompt(
+        self,
+        title: str,
+        style: str,
+        theme: str,
+        variant_seed: int = 0
+    ) -> str:
         """Create prompt for generating background image description based on content
         
+        The prompt is deterministic: identical inputs give an identical prompt,
+        so response and prompt caching can hit on regenerations.
+        
         Args:
             title: Content title
             style: Image style description
             theme: Visual theme (luxury, modern, warm, professional, vibrant)
+            variant_seed: Change to get a different scene for the same title
             
         Returns:
             Prompt for generating detailed background description
         """
-        # Extract key themes from title for content-specific imagery
-        title_lower = title.lower()
-        content_themes = []
-        
-        # Theme-specific visual elements
-        if any(word in title_lower for word in ['peace', 'confidence', 'mind', 'secure']):
-            content_themes.extend(['serene bedroom with soft pillows', 'quiet reading nook', 'peaceful family room'])
-        elif any(word in title_lower for word in ['budget', 'cost', 'money', 'financial']):
-            content_themes.extend(['organized home office', 'clean kitchen with calculators', 'tidy financial planning space'])
-        elif any(word in title_lower for word in ['lifestyle', 'living', 'community', 'neighborhood']):
-            content_themes.extend(['vibrant living room with community views', 'welcoming front porch', 'family gathering space'])
-        elif any(word in title_lower for word in ['upgrade', 'improve', 'better', 'enhance']):
-            content_themes.extend(['modern renovated kitchen', 'stylish updated bathroom', 'contemporary living space'])
-        elif any(word in title_lower for word in ['slow', 'pause', 'patient', 'careful']):
-            content_themes.extend(['quiet meditation corner', 'calm study space', 'peaceful contemplation area'])
-        else:
-            # Default themes
-            content_themes.extend(['welcoming living room', 'bright kitchen area', 'cozy family space'])
-        
-        # Select a theme
-        import random
-        selected_theme = random.choice(content_themes)
-        
-        # Theme style mappings
-        theme_styles = {
-            "luxury": "luxurious materials, marble textures, gold accents, premium finishes, sophisticated lighting",
-            "modern": "clean lines, minimalist design, contemporary furniture, geometric shapes, neutral colors",
-            "warm": "warm colors, cozy atmosphere, inviting textures, soft lighting, comfortable furnishings",
-            "professional": "clean and organized, sophisticated neutral colors, business-appropriate aesthetics",
-            "vibrant": "bright accent colors, energetic atmosphere, dynamic composition, bold design elements"
-        }
-        
-        theme_description = theme_styles.get(theme, theme_styles["modern"])
-        
-        return (
-            f"Create a detailed description for a {theme} social media background image for real estate content titled: '{title}'. "
-            f"The background should feature: {selected_theme} with {theme_description}. "
-            f"Style requirements: {style} with excellent contrast areas for text overlay. "
-            f"The image should evoke emotions related to the theme of '{title}' while maintaining professional real estate standards. "
-            f"Avoid: people, text, logos, busy patterns, or overly detailed elements that would interfere with text readability. "
-            f"Focus on: architectural elements, interior design, lighting, and spatial composition that supports the emotional message of '{title}'. "
-            f"Describe the color palette, lighting conditions, furniture arrangement, and any unique design elements that make this background "
-            f"specifically tailored to the content theme. Keep the description detailed but concise (under 200 words)."
-        )
+        return _bg_prompt(title, style, theme, variant_seed)
     
     def _create_dalle_background_prompt(self, title: str, theme: str, client_context: str) -> str:
         """Create optimized DALL-E prompt for any business type based on context analysis
@@ -383,42 +1676,28 @@ class OpenAIService:
         industry_elements = self._get_industry_visual_elements(business_type, theme)
         
         # Build enhanced DALL-E prompt for HD quality professional results
-        dalle_prompt = (
-            f"Ultra-high-quality professional {business_type.replace('_', ' ')} photography of a {focus}, showcasing {industry_elements}. "
-            f"The scene should convey the emotional theme of '{title}' - creating powerful feelings that resonate with "
-            f"the target audience and inspire trust, confidence, and engagement. "
-            f"Technical specifications: Shot with professional camera equipment, perfect depth of field, razor-sharp focus, "
-            f"studio-quality lighting with soft shadows and balanced exposure. Wide angle view optimized for text overlay placement. "
-            f"Visual style: Award-winning commercial photography, luxury brand aesthetic, magazine cover quality, "
-            f"Instagram-worthy composition with sophisticated color grading and professional post-processing. "
-            f"Composition requirements: Clean background areas for text placement, balanced visual weight, "
-            f"leading lines that guide the eye, professional staging and arrangement. "
-            f"Lighting setup: Multi-point professional lighting with key light, fill light, and accent lighting "
-            f"to create dimensional depth and premium atmosphere appropriate for {business_type.replace('_', ' ')}. "
-            f"Avoid: People, faces, text, logos, brand names, cluttered details, harsh shadows, "
-            f"dark areas that interfere with text readability, amateur photography aesthetics. "
-            f"Color palette: Sophisticated, brand-appropriate colors that complement text overlays and "
-            f"create emotional connection with the target audience. "
-            f"Final result: Premium visual that elevates brand perception and drives engagement."
-        )
+        parts = [_DALLE_PROMPT.format_map({
+            "business": business_type.replace('_', ' '),
+            "focus": focus,
+            "elements": industry_elements,
+            "title": title
+        })]
         
         # Add client context adaptations
         if client_context and len(client_context) > 50:
             context_lower = client_context.lower()
             
             # Universal audience adaptations
-            if "millennial" in context_lower:
-                dalle_prompt += " Appeal to millennial preferences with modern, clean, authentic design."
-            if "luxury" in context_lower or "premium" in context_lower:
-                dalle_prompt += " Emphasize luxury elements, premium materials, and sophisticated atmosphere."
-            if "first-time" in context_lower or "beginner" in context_lower:
-                dalle_prompt += " Show approachable, welcoming spaces that reduce anxiety and build confidence."
-            if "professional" in context_lower or "business" in context_lower:
-                dalle_prompt += " Emphasize credibility, expertise, and professional excellence."
-        
-        return dalle_prompt
-    
-    def _detect_business_type(self, client_context: str, title: str) -> str:
+            parts.extend(
+                sentence for keywords, sentence in _AUDIENCE_ADAPTATIONS
+                if any(keyword in context_lower for keyword in keywords)
+            )
+        
+        return "".join(parts)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _detect_business_type(client_context: str, title: str) -> str:
         """Enhanced business type detection with comprehensive keyword matching
         
         Args:
@@ -427,87 +1706,32 @@ class OpenAIService:
             
         Returns:
             Business type identifier
+        
+        Results are cached per (client_context, title), so the detection is
+        only logged the first time a pair is seen.
         """
         context_lower = (client_context + " " + title).lower()
         
-        # ENHANCED Real Estate Detection - Tennessee residential focus
-        real_estate_keywords = [
-            # Direct real estate terms
-            'real estate', 'realtor', 'property', 'home', 'buyer', 'seller', 'listing',
-            'house', 'residential', 'agent', 'broker', 'mortgage', 'closing',
-            
-            # Geographic indicators
-            'tennessee', 'tn', 'nashville', 'memphis', 'knoxville', 'chattanooga',
-            'franklin', 'murfreesboro', 'clarksville', 'jackson', 'johnson city',
-            'south', 'southern', 'southeast',
-            
-            # Real estate specific terms
-            'mls', 'appraisal', 'inspection', 'contract', 'deed', 'title',
-            'neighborhood', 'community', 'subdivision', 'market analysis',
-            'first time buyer', 'investment property', 'rental', 'lease',
-            'square feet', 'sqft', 'bedroom', 'bathroom', 'lot size',
-            'new construction', 'foreclosure', 'short sale', 'refinance',
-            
-            # Emotional/lifestyle terms common in real estate
-            'dream home', 'family home', 'starter home', 'forever home',
-            'move', 'relocate', 'relocation', 'downsize', 'upgrade',
-            'school district', 'walkable', 'commute', 'neighborhood',
-            'local market', 'housing market'
-        ]
-        
-        # Count matches for better detection
-        real_estate_matches = [keyword for keyword in real_estate_keywords if keyword in context_lower]
-        
-        if real_estate_matches:
-            logger.info(f"🏠 REAL ESTATE DETECTED - Matched keywords: {real_estate_matches}")
-            return 'real_estate'
-        
-        # Fitness/Health
-        elif any(word in context_lower for word in ['fitness', 'gym', 'workout', 'health', 'nutrition', 'personal trainer', 'wellness']):
-            logger.info(f"💪 FITNESS business detected")
-            return 'fitness'
-        
-        # Restaurant/Food
-        elif any(word in context_lower for word in ['restaurant', 'food', 'chef', 'dining', 'cuisine', 'menu', 'culinary']):
-            logger.info(f"🍽️ RESTAURANT business detected")
-            return 'restaurant'
-        
-        # Coaching/Consulting
-        elif any(word in context_lower for word in ['coach', 'coaching', 'consultant', 'mentor', 'business coach', 'life coach']):
-            logger.info(f"🎯 COACHING business detected")
-            return 'coaching'
-        
-        # E-commerce/Retail
-        elif any(word in context_lower for word in ['e-commerce', 'retail', 'store', 'shop', 'product', 'selling', 'brand']):
-            logger.info(f"🛍️ RETAIL business detected")
-            return 'retail'
-        
-        # Professional Services
-        elif any(word in context_lower for word in ['lawyer', 'attorney', 'accountant', 'financial', 'consulting', 'professional']):
-            logger.info(f"⚖️ PROFESSIONAL SERVICES detected")
-            return 'professional_services'
-        
-        # Corporate/Business
-        elif any(word in context_lower for word in ['corporate', 'business', 'enterprise', 'company', 'office', 'executive', 'management']):
-            logger.info(f"🏢 CORPORATE business detected")
-            return 'corporate'
-        
-        # Technology/SaaS
-        elif any(word in context_lower for word in ['tech', 'software', 'app', 'saas', 'platform', 'digital', 'startup']):
-            logger.info(f"💻 TECHNOLOGY business detected")
-            return 'technology'
-        
-        # Beauty/Spa
-        elif any(word in context_lower for word in ['beauty', 'spa', 'salon', 'skincare', 'massage', 'aesthetics']):
-            logger.info(f"💄 BEAUTY business detected")
-            return 'beauty'
+        matches = _BUSINESS_TYPES.matches(context_lower)
         
         # Default to professional services but log warning
-        else:
+        if not matches:
             logger.warning(f"❓ NO BUSINESS TYPE MATCHED - Defaulting to professional_services. Context preview: '{context_lower[:100]}...'")
             return 'professional_services'
+        
+        priority = min(matches)[0]
+        business_type, message = _BUSINESS_TYPES.values[priority]
+        if business_type == 'real_estate':
+            # Collect matched keywords for logging
+            real_estate_matches = list(dict.fromkeys(keyword for index, keyword in matches if index == priority))
+            logger.info(f"🏠 REAL ESTATE DETECTED - Matched keywords: {real_estate_matches}")
+        else:
+            logger.info(message)
+        return business_type
     
-    def _generate_content_focus(self, title: str, business_type: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _generate_content_focus(title: str, business_type: str) -> str:
         """Generate content-appropriate visual focus based on business type and title
         
         Args:
@@ -517,79 +1741,13 @@ class OpenAIService:
         Returns:
             Visual focus description
         """
-        title_lower = title.lower()
-        
-        # Emotional themes that apply across industries
-        if any(word in title_lower for word in ['overwhelmed', 'confident', 'fear', 'peace', 'mind', 'stress']):
-            emotion = 'calming_confidence'
-        elif any(word in title_lower for word in ['success', 'achievement', 'growth', 'results']):
-            emotion = 'success_oriented'
-        elif any(word in title_lower for word in ['luxury', 'premium', 'exclusive', 'high-end']):
-            emotion = 'luxury_focused'
-        else:
-            emotion = 'professional_standard'
-        
-        # Business-specific visual mapping
-        focus_map = {
-            'real_estate': {
-                'calming_confidence': 'warm, inviting Tennessee home interior with cozy fireplace and natural light',
-                'success_oriented': 'beautiful Southern home exterior with front porch and mature landscaping',
-                'luxury_focused': 'upscale Tennessee residential architecture with luxury Southern charm',
-                'professional_standard': 'professionally staged Tennessee home with warm, welcoming atmosphere'
-            },
-            'fitness': {
-                'calming_confidence': 'serene, well-equipped fitness studio with natural lighting',
-                'success_oriented': 'modern gym with success-focused motivational atmosphere',
-                'luxury_focused': 'premium fitness facility with high-end equipment',
-                'professional_standard': 'clean, professional fitness environment'
-            },
-            'restaurant': {
-                'calming_confidence': 'warm, inviting restaurant interior with ambient lighting',
-                'success_oriented': 'bustling, successful restaurant kitchen in action',
-                'luxury_focused': 'upscale fine dining restaurant with elegant atmosphere',
-                'professional_standard': 'professional commercial kitchen or dining space'
-            },
-            'coaching': {
-                'calming_confidence': 'peaceful, professional office space for consultations',
-                'success_oriented': 'modern business environment showcasing growth and success',
-                'luxury_focused': 'premium executive office with sophisticated decor',
-                'professional_standard': 'clean, professional meeting or office space'
-            },
-            'retail': {
-                'calming_confidence': 'welcoming, organized retail space with soft lighting',
-                'success_oriented': 'thriving retail store with customers and activity',
-                'luxury_focused': 'high-end boutique with premium product displays',
-                'professional_standard': 'clean, well-organized retail environment'
-            },
-            'professional_services': {
-                'calming_confidence': 'calm, trustworthy professional office environment',
-                'success_oriented': 'modern business office showcasing professionalism and success',
-                'luxury_focused': 'executive-level office with premium furnishings',
-                'professional_standard': 'clean, professional business environment'
-            },
-            'technology': {
-                'calming_confidence': 'clean, modern tech workspace with calming elements',
-                'success_oriented': 'innovative tech office with cutting-edge equipment',
-                'luxury_focused': 'premium tech headquarters with sophisticated design',
-                'professional_standard': 'professional tech workspace or office'
-            },
-            'beauty': {
-                'calming_confidence': 'serene spa treatment room with soft, natural lighting',
-                'success_oriented': 'modern beauty salon with professional equipment',
-                'luxury_focused': 'luxury spa or high-end beauty salon with premium atmosphere',
-                'professional_standard': 'clean, professional beauty or wellness space'
-            },
-            'corporate': {
-                'calming_confidence': 'professional corporate office with calming, organized atmosphere',
-                'success_oriented': 'modern corporate headquarters showcasing business success',
-                'luxury_focused': 'premium executive boardroom with high-end corporate design',
-                'professional_standard': 'clean corporate office environment with business atmosphere'
-            }
-        }
+        emotion = _EMOTIONS.first(title.lower(), 'professional_standard')
         
-        return focus_map.get(business_type, focus_map['professional_services'])[emotion]
+        return _FOCUS_MAP.get(business_type, _FOCUS_MAP['professional_services'])[emotion]
     
-    def _get_industry_visual_elements(self, business_type: str, theme: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _get_industry_visual_elements(business_type: str, theme: str) -> str:
         """Get industry-specific visual elements for the theme
         
         Args:
@@ -599,29 +1757,8 @@ class OpenAIService:
         Returns:
             Industry-specific visual elements
         """
-        base_elements = {
-            "luxury": "premium materials, elegant fixtures, sophisticated lighting, high-end finishes",
-            "modern": "clean lines, contemporary design, minimalist aesthetic, natural light",
-            "warm": "cozy textures, warm lighting, inviting atmosphere, comfortable elements",
-            "professional": "clean design, neutral tones, business-appropriate elegance, organized space",
-            "vibrant": "bright natural light, energetic colors, dynamic atmosphere, engaging elements"
-        }
-        
-        # Industry-specific additions
-        industry_additions = {
-            'real_estate': "Southern architectural details, Tennessee home staging, cozy family atmosphere, residential warmth and charm",
-            'fitness': "exercise equipment, motivational elements, health-focused atmosphere, active energy",
-            'restaurant': "culinary elements, dining atmosphere, food presentation spaces, hospitality warmth",
-            'coaching': "consultation areas, growth-oriented atmosphere, trust-building elements, professional rapport",
-            'retail': "product displays, customer-friendly layout, brand presentation, shopping experience",
-            'professional_services': "credibility elements, trust-building atmosphere, expertise showcase, client comfort",
-            'technology': "innovation elements, modern tech aesthetic, cutting-edge atmosphere, digital sophistication",
-            'beauty': "wellness atmosphere, relaxation elements, self-care environment, transformation space",
-            'corporate': "business authority, executive presence, corporate professionalism, enterprise atmosphere"
-        }
-        
-        base = base_elements.get(theme, base_elements["professional"])
-        addition = industry_additions.get(business_type, industry_additions['professional_services'])
+        base = _THEME_ELEMENTS.get(theme, _THEME_ELEMENTS["professional"])
+        addition = _INDUSTRY_ELEMENTS.get(business_type, _INDUSTRY_ELEMENTS['professional_services'])
         
         return f"{base}, {addition}"
     
@@ -641,102 +1778,7 @@ class OpenAIService:
         Returns:
             Professional Instagram carousel optimization prompt
         """
-        return (
-            f"You are a professional Instagram carousel strategist creating polished, strategic content that stands alone "
-            f"while amplifying Facebook copy. Your carousels are self-contained stories that encourage swiping through "
-            f"natural narrative flow and curiosity gaps.\n\n"
-            
-            f"PROFESSIONAL CAROUSEL STRUCTURE (Slides 1-7):\n\n"
-            
-            f"SLIDE 1 - HOOK: Bold, scroll-stopping headline (max 5 words)\n"
-            f"  • Grab attention immediately with power phrases\n"
-            f"  • Examples: 'This Changes Everything', 'You're Missing This', 'The Hidden Truth'\n"
-            f"  • Create instant intrigue that demands the swipe\n\n"
-            
-            f"SLIDE 2 - PROBLEM/INSIGHT: Establish tension or context\n"
-            f"  • Build on slide 1's hook with deeper context\n"
-            f"  • Use smooth transitions: 'Here's what happens...', 'The problem is...', 'Most people believe...'\n"
-            f"  • Create anticipation for the solution coming next\n\n"
-            
-            f"SLIDE 3 - VALUE POINT 1: Single benefit, fact, or emotional driver\n"
-            f"  • Focus on ONE key insight that builds the story\n"
-            f"  • Connect logically: 'That's when I discovered...', 'The breakthrough came when...'\n"
-            f"  • Provide the 'aha moment' that explains slide 2's tension\n\n"
-            
-            f"SLIDE 4 - VALUE POINT 2: Proof, data, or transformation story\n"
-            f"  • Build credibility with evidence or deeper insight\n"
-            f"  • Transition smoothly: 'Here's why this matters...', 'The real impact was...'\n"
-            f"  • Set up anticipation for practical application\n\n"
-            
-            f"SLIDE 5 - SOLUTION/ACTION: Clear takeaway or action step\n"
-            f"  • Show the outcome/solution in action\n"
-            f"  • Connect with: 'So we started...', 'The result was...', 'Now when you...'\n"
-            f"  • Demonstrate real-world application of previous insights\n\n"
-            
-            f"SLIDE 6 - DEEPENING (Optional): Bonus insight, testimonial, or visual punch\n"
-            f"  • Strengthen the transformation story\n"
-            f"  • Use: 'And the best part...', 'What's even better...', 'This led to...'\n"
-            f"  • Provide additional evidence or benefits\n\n"
-            
-            f"SLIDE 7 - BRAND/CTA: Reinforce brand identity and next action\n"
-            f"  • Close the story loop with satisfying resolution\n"
-            f"  • Clear, specific call to action ('Book your free consult' not 'Learn more')\n"
-            f"  • Make the CTA feel like the natural conclusion to their journey\n\n"
-            
-            f"COHESIVE FLOW PRINCIPLES:\n"
-            f"- NEVER break sentences or thoughts across slides - each slide must be complete\n"
-            f"- Use literary devices for cliffhangers: curiosity gaps, not abrupt cuts\n"
-            f"- Each slide must stand alone AND contribute to the whole story\n"
-            f"- Create natural narrative bridges between slides\n"
-            f"- Build emotional momentum that crescendos toward resolution\n"
-            f"- Every slide should feel like the next logical chapter\n\n"
-            
-            f"PROFESSIONAL TEXT RULES:\n"
-            f"- MAX {lines_per_slide} lines per slide, 4-6 words per line (mobile-optimized)\n"
-            f"- Short, declarative sentences or powerful phrases\n"
-            f"- Every word must serve purpose - remove all filler\n"
-            f"- Write for skimmability - assume quick swiping\n"
-            f"- Use verbs and benefit-focused language\n"
-            f"- Direct address ('you') to keep it personal\n"
-            f"- Favor clarity over cleverness - avoid jargon\n\n"
-            
-            f"LITERARY CLIFFHANGER TECHNIQUES:\n"
-            f"- Use curiosity gaps: 'You're missing this one thing...' (next slide reveals it)\n"
-            f"- Employ foreshadowing: 'This discovery changed everything' (story unfolds)\n"
-            f"- Create anticipation: 'Here's why it matters →' (natural bridge)\n"
-            f"- Use incomplete revelation: 'The secret is simple...' (completed next slide)\n"
-            f"- Build suspense through pacing: alternate short headlines with micro-stories\n\n"
-            
-            f"ENGAGEMENT & SWIPE TECHNIQUES:\n"
-            f"- Each slide must pass the 'single-slide test' (screenshot value)\n"
-            f"- Create rhythm: alternate bold statements with context stories\n"
-            f"- Use progressive revelation: each slide unveils another layer\n"
-            f"- Reference previous slides to maintain cohesion\n"
-            f"- End with forward momentum that feels natural, not forced\n\n"
-            
-            f"QUALITY STANDARDS:\n"
-            f"- Tell a full story visually and textually\n"
-            f"- Clear and compelling without reading the caption\n"
-            f"- Consistent hierarchy: headline > subtext > visual cue\n"
-            f"- Smooth narrative flow that never feels choppy or disjointed\n"
-            f"- Natural conclusion that doesn't feel abrupt\n\n"
-            
-            f"FORMATTING REQUIREMENTS:\n"
-            f"- Start immediately with 'SLIDE 1:' followed by slide content\n"
-            f"- Each slide contains ONLY text that will appear on the slide\n"
-            f"- No introductory text, explanations, or meta-commentary\n"
-            f"- No phrases like 'Here's your carousel' or 'I'll create'\n"
-            f"- Focus on professional, cohesive storytelling\n\n"
-            
-            f"Create a professional carousel where each slide flows seamlessly into the next, "
-            f"building a complete narrative that feels polished, strategic, and engaging.\n\n"
-            
-            f"Format your response EXACTLY as:\n"
-            f"SLIDE 1:\n[bold hook - max 5 words]\n\n"
-            f"SLIDE 2:\n[problem/insight that builds naturally]\n\n"
-            f"... continuing through all slides with cohesive flow\n\n"
-            f"Content to transform:\n{content}"
-        )
+        return _content_prompt_head(lines_per_slide) + content
     
     def _parse_optimized_content(self, content_text: str) -> list[str]:
         """Parse GPT response into slide texts, filtering out unwanted content
@@ -747,51 +1789,53 @@ class OpenAIService:
         Returns:
             List of clean slide texts
         """
-        slides = []
-        current_slide = []
-        
-        # Filter out common unwanted phrases
-        unwanted_phrases = [
-            "here's your carousel",
-            "i'll create",
-            "let me craft",
-            "here are the slides",
-            "i've created",
-            "this carousel",
-            "here's how",
-            "let's break this down",
-            "i've optimized",
-            "here's the content",
-            "based on your request"
-        ]
+        return list(self._iter_parsed_slides(content_text))
+    
+    def _parse_json_slides(self, content_text: str) -> list[str]:
+        """Parse a JSON mode response into slide texts
         
-        lines = content_text.split('\n')
-        for line in lines:
-            line = line.strip()
-            
-            if line.startswith('SLIDE '):
-                # Save previous slide
-                if current_slide:
-                    slide_text = '\n'.join(current_slide).strip()
-                    if slide_text:  # Only add non-empty slides
-                        slides.append(slide_text)
-                    current_slide = []
-            elif line and not line.startswith('SLIDE '):
-                # Check if this line contains unwanted phrases
-                line_lower = line.lower()
-                contains_unwanted = any(phrase in line_lower for phrase in unwanted_phrases)
-                
-                # Skip lines that are clearly commentary/meta-text
-                if not contains_unwanted and not line.startswith('*') and not line.startswith('[') and not line.startswith('Note:'):
-                    current_slide.append(line)
+        Args:
+            content_text: GPT response text
+            
+        Returns:
+            List of clean slide texts
+            
+        Raises:
+            OpenAIError: If the response isn't the expected
+                {"slides": [[line, ...], ...]} object
+        """
+        try:
+            slides = orjson.loads(content_text)["slides"]
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+            raise OpenAIError(f"Malformed JSON slide response: {e!r}") from e
+        if not isinstance(slides, list):
+            raise OpenAIError(f"Malformed JSON slide response: 'slides' is {type(slides).__name__}, not a list")
         
-        # Save last slide
-        if current_slide:
-            slide_text = '\n'.join(current_slide).strip()
-            if slide_text:  # Only add non-empty slides
-                slides.append(slide_text)
+        slide_texts = []
+        for slide in slides:
+            lines = [slide] if isinstance(slide, str) else slide
+            if not isinstance(lines, list) or not all(isinstance(line, str) for line in lines):
+                raise OpenAIError(f"Malformed JSON slide response: unexpected slide {slide!r}")
+            slide_text = '\n'.join(filter(_is_slide_line, (line.strip() for line in lines)))
+            if slide_text:
+                slide_texts.append(_intern_slide(slide_text))
+        return slide_texts
+    
+    def _iter_parsed_slides(self, content_text: str) -> Iterator[str]:
+        """Yield clean slide texts from a GPT response as they are parsed
         
-        return slides
+        Args:
+            content_text: GPT response text
+            
+        Yields:
+            Slide text with meta-commentary lines removed
+        """
+        # Each SLIDE header line starts a new chunk; text before the first header
+        # is kept as its own chunk, matching the previous line-by-line parser
+        for chunk in _SLIDE_SPLIT.split(content_text):
+            slide_text = '\n'.join(filter(_is_slide_line, map(str.strip, chunk.splitlines())))
+            if slide_text:
+                yield _intern_slide(slide_text)
     
     def _estimate_dalle_cost(self, size: str) -> float:
         """Estimate DALL-E 3 HD quality API cost
@@ -802,47 +1846,45 @@ class OpenAIService:
         Returns:
             Estimated cost in USD for HD quality images
         """
-        # DALL-E 3 HD quality pricing (as of 2024)
-        if size == "1024x1024":
-            return 0.080  # $0.080 per HD image (double standard quality)
-        elif size in ["1792x1024", "1024x1792"]:
-            return 0.120  # $0.120 per HD image (1.5x standard quality)
-        else:
-            return 0.080  # Default to standard HD pricing
+        return _DALLE_HD_PRICING.get(size, _DALLE_HD_DEFAULT_PRICE)
     
-    def _estimate_gpt_cost(self, prompt: str) -> float:
-        """Estimate GPT-5 API cost
+    def _estimate_gpt_cost(self, prompt: str, model: str = "gpt-4o", max_tokens: Optional[int] = None) -> float:
+        """Estimate GPT API cost
         
         Args:
             prompt: Input prompt
+            model: Model the prompt will be sent to
+            max_tokens: Output cap of the request; the estimate assumes the
+                completion uses all of it
             
         Returns:
             Estimated cost in USD
         """
-        # Rough token estimation (4 chars ≈ 1 token)
-        input_tokens = len(prompt) // 4
-        output_tokens = 500  # Estimated output
-        
-        # GPT-5 pricing (as of 2024)
-        input_cost = input_tokens * 0.00003  # $0.03 per 1K tokens
-        output_cost = output_tokens * 0.00006  # $0.06 per 1K tokens
-        
-        return input_cost + output_cost
+        pricing = _GPT_PRICING[model]
+        output_tokens = max_tokens if max_tokens is not None else _ESTIMATED_OUTPUT_TOKENS
+        return _count_tokens(prompt, model) * pricing["input"] + output_tokens * pricing["output"]
     
-    def _calculate_actual_gpt_cost(self, usage) -> float:
+    def _calculate_actual_gpt_cost(self, usage, model: str = "gpt-4o") -> float:
         """Calculate actual GPT cost from usage
         
         Args:
             usage: OpenAI usage object
+            model: Model that produced the usage
             
         Returns:
-            Actual cost in USD
+            Actual cost in USD, zero when there is no usage (cached response);
+            prompt tokens served from OpenAI's prompt cache are discounted
         """
+        if usage is None:
+            return 0.0
+        
         input_tokens = usage.prompt_tokens
         output_tokens = usage.completion_tokens
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None) or 0
+        if cached_tokens:
+            logger.debug(f"Prompt cache hit: {cached_tokens}/{input_tokens} input tokens cached")
         
-        # GPT-5 pricing
-        input_cost = input_tokens * 0.00003  # $0.03 per 1K tokens
-        output_cost = output_tokens * 0.00006  # $0.06 per 1K tokens
-        
-        return input_cost + output_cost
\ No newline at end of file
+        pricing = _GPT_PRICING[model]
+        input_cost = (input_tokens - cached_tokens * (1 - _CACHED_INPUT_DISCOUNT)) * pricing["input"]
+        return input_cost + output_tokens * pricing["output"]
\ No newline at end of file
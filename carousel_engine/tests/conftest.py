@@ -3,9 +3,7 @@ Pytest configuration and fixtures
 """
 
 import pytest
-import asyncio
-from unittest.mock import Mock, AsyncMock
-from typing import Generator, Any
+from unittest.mock import Mock
 
 from ..core.config import Config
 from ..core.engine import CarouselEngine
@@ -16,14 +14,6 @@ from ..utils.image_processor import ImageProcessor
 from ..utils.content_processor import ContentProcessor
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, Any, None]:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def test_config():
     """Test configuration"""
@@ -40,39 +30,31 @@ def test_config():
 @pytest.fixture
 def mock_notion_service():
     """Mock Notion service"""
-    mock = Mock(spec=NotionService)
-    mock.get_page = AsyncMock()
-    mock.update_page_status = AsyncMock()
-    return mock
+    # spec_set turns the service's async methods into AsyncMocks and rejects unknown attributes
+    return Mock(spec_set=NotionService)
 
 
 @pytest.fixture
 def mock_google_drive_service():
     """Mock Google Drive service"""
-    mock = Mock(spec=GoogleDriveService)
-    mock.create_folder = AsyncMock()
-    mock.upload_image = AsyncMock()
-    mock.upload_multiple_images = AsyncMock()
-    mock.get_folder_info = AsyncMock()
-    return mock
+    # spec rather than spec_set: .service is set in __init__, so it isn't on the
+    # class, and the health check test configures it
+    return Mock(spec=GoogleDriveService)
 
 
 @pytest.fixture
 def mock_openai_service():
     """Mock OpenAI service"""
+    # spec rather than spec_set: tests attach a mock SDK client as .client
     mock = Mock(spec=OpenAIService)
-    mock.generate_background_description = AsyncMock()
-    mock.generate_background_image = AsyncMock()
-    mock.optimize_content_for_slides = AsyncMock()
-    mock.get_total_cost = Mock(return_value=0.0)
-    mock.reset_cost_tracking = Mock()
+    mock.get_total_cost.return_value = 0.0
     return mock
 
 
 @pytest.fixture
 def mock_image_processor():
     """Mock image processor"""
-    mock = Mock(spec=ImageProcessor)
+    mock = Mock(spec_set=ImageProcessor)
     mock.create_carousel_slide = Mock(return_value=(b"fake_image_data", None))
     return mock
 
@@ -80,7 +62,7 @@ def mock_image_processor():
 @pytest.fixture
 def mock_content_processor():
     """Mock content processor"""
-    mock = Mock(spec=ContentProcessor)
+    mock = Mock(spec_set=ContentProcessor)
     mock.process_content_to_slides = Mock()
     mock.validate_slide_content = Mock(return_value=(True, ""))
     return mock
@@ -104,9 +86,9 @@ def carousel_engine(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_notion_page():
-    """Sample Notion page data"""
+    """Sample Notion page data, shared per module - use model_copy to vary it"""
     from ..core.models import NotionPage, CarouselFormat, CarouselStatus
     from datetime import datetime
     
@@ -123,9 +105,9 @@ def sample_notion_page():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_carousel_slides():
-    """Sample carousel slides"""
+    """Sample carousel slides, shared per module"""
     from ..core.models import CarouselSlide
     
     return [
@@ -0,0 +1,146 @@
+"""
+Tests for the alerting utilities
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from ..utils import alerts as alerts_module
+from ..utils.alerts import Alert, AlertLevel, AlertManager, WebhookAlertHandler, webhook_alert_handler
+
+WEBHOOK_URL = "https://hooks.example.com/alerts"
+
+
+def _response(status_code: int) -> Mock:
+    """Mock HTTP response with the given status"""
+    return Mock(status_code=status_code)
+
+
+@pytest.fixture
+def webhook_handler():
+    """Webhook handler with a mocked HTTP client"""
+    handler = WebhookAlertHandler(WEBHOOK_URL)
+    handler._client.close()
+    handler._client = Mock()
+    handler._client.post.return_value = _response(200)
+    return handler
+
+
+class TestAlertManagerDispatch:
+    """Test cases for the AlertManager dispatcher thread"""
+
+    def test_handlers_receive_alerts_in_order(self):
+        """Test per-alert and batch handlers both see every alert in order"""
+        manager = AlertManager()
+        seen, batched = [], []
+
+        def record(alert):
+            seen.append(alert.message)
+
+        class BatchRecorder:
+            __name__ = "BatchRecorder"
+
+            def __call__(self, alert):
+                raise AssertionError("batch handler called per alert")
+
+            def handle_batch(self, alerts):
+                batched.extend(alert.message for alert in alerts)
+
+        manager.add_handler(record)
+        manager.add_handler(BatchRecorder())
+        for i in range(250):
+            manager.create_alert(AlertLevel.INFO, "Progress", str(i))
+        manager.flush()
+
+        expected = [str(i) for i in range(250)]
+        assert seen == expected
+        assert batched == expected
+
+    def test_flush_waits_for_slow_handlers(self):
+        """Test that flush returns only after handlers have finished"""
+        manager = AlertManager()
+        done = []
+
+        def slow_handler(alert):
+            time.sleep(0.05)
+            done.append(alert.message)
+
+        manager.add_handler(slow_handler)
+        manager.create_alert(AlertLevel.ERROR, "Failed", "first")
+        manager.create_alert(AlertLevel.ERROR, "Failed", "second")
+        manager.flush()
+
+        assert done == ["first", "second"]
+
+    def test_full_queue_drops_and_counts_alerts(self):
+        """Test that alerts beyond the queue are stored but skip the handlers"""
+        manager = AlertManager(max_queued_alerts=1)
+        started, release = threading.Event(), threading.Event()
+        seen = []
+
+        def blocking_handler(alert):
+            started.set()
+            release.wait(5)
+            seen.append(alert.message)
+
+        manager.add_handler(blocking_handler)
+        manager.create_alert(AlertLevel.ERROR, "Failed", "in handler")
+        assert started.wait(5)
+
+        manager.create_alert(AlertLevel.ERROR, "Failed", "queued")
+        manager.create_alert(AlertLevel.ERROR, "Failed", "dropped")
+        release.set()
+        manager.flush()
+
+        assert seen == ["in handler", "queued"]
+        assert manager.dropped_alerts == 1
+        summary = manager.get_alert_summary()
+        assert summary["dropped_alerts"] == 1
+        assert summary["total_alerts"] == 3
+
+
+class TestWebhookAlertHandler:
+    """Test cases for WebhookAlertHandler"""
+
+    def test_batch_sent_in_one_request(self, webhook_handler):
+        """Test that several alerts are posted together"""
+        alerts = [Alert(AlertLevel.ERROR, "Failed", f"run {i}") for i in range(3)]
+
+        webhook_handler.handle_batch(alerts)
+
+        webhook_handler._client.post.assert_called_once_with(
+            WEBHOOK_URL, json={"alerts": [alert.to_dict() for alert in alerts]}
+        )
+
+    def test_rejected_batch_falls_back_to_single_posts(self, webhook_handler):
+        """Test that a 4xx on a batch switches to one request per alert"""
+        alerts = [Alert(AlertLevel.ERROR, "Failed", f"run {i}") for i in range(2)]
+        webhook_handler._client.post.side_effect = [_response(400), _response(200), _response(200)]
+
+        webhook_handler.handle_batch(alerts)
+
+        assert webhook_handler.batching is False
+        posted = [call.kwargs["json"] for call in webhook_handler._client.post.call_args_list]
+        assert posted[1:] == [alert.to_dict() for alert in alerts]
+
+        # Later batches go straight to single posts
+        webhook_handler._client.post.reset_mock(side_effect=True)
+        webhook_handler._client.post.return_value = _response(200)
+        webhook_handler.handle_batch(alerts)
+        assert webhook_handler._client.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_function_handler_reuses_shared_client(self, monkeypatch, webhook_handler):
+        """Test that webhook_alert_handler delegates to one handler per URL"""
+        monkeypatch.setitem(alerts_module._webhook_handlers, WEBHOOK_URL, webhook_handler)
+        alert = Alert(AlertLevel.WARNING, "Slow", "took 30s")
+
+        await webhook_alert_handler(alert, WEBHOOK_URL)
+        await webhook_alert_handler(alert, WEBHOOK_URL)
+
+        assert alerts_module.get_webhook_handler(WEBHOOK_URL) is webhook_handler
+        assert webhook_handler._client.post.call_count == 2
+        webhook_handler._client.post.assert_called_with(WEBHOOK_URL, json=alert.to_dict())
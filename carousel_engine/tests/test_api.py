@@ -10,10 +10,11 @@ from ..api.main import app
 from ..core.models import CarouselResponse
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Test client for FastAPI app"""
-    return TestClient(app)
+    """Test client for FastAPI app, running the app lifespan once per module"""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
@@ -29,6 +30,15 @@ def mock_engine():
     return engine
 
 
+@pytest.fixture(autouse=True)
+def app_state(mock_engine):
+    """Patch the app state so every endpoint sees the mock engine"""
+    with patch('carousel_engine.api.main.app.state') as state:
+        state.engine = mock_engine
+        state.get_engine.return_value = mock_engine
+        yield state
+
+
 class TestAPI:
     """Test cases for API endpoints"""
 
@@ -48,10 +58,8 @@ class TestAPI:
         assert "version" in data
         assert "environment" in data
 
-    @patch('carousel_engine.api.main.app.state')
-    def test_health_check_endpoint(self, mock_state, client, mock_engine):
+    def test_health_check_endpoint(self, client, mock_engine):
         """Test health check endpoint"""
-        mock_state.engine = mock_engine
         mock_engine.health_check.return_value = {
             "engine": "healthy",
             "services": {
@@ -67,10 +75,8 @@ class TestAPI:
         data = response.json()
         assert data["status"] in ["healthy", "degraded", "unhealthy"]
 
-    @patch('carousel_engine.api.main.app.state')
-    def test_generate_carousel_endpoint(self, mock_state, client, mock_engine):
+    def test_generate_carousel_endpoint(self, client, mock_engine):
         """Test carousel generation endpoint"""
-        mock_state.engine = mock_engine
         mock_engine.generate_carousel.return_value = CarouselResponse(
             success=True,
             notion_page_id="test_page_id",
@@ -91,11 +97,8 @@ class TestAPI:
         assert data["notion_page_id"] == "test_page_id"
         assert data["slides_generated"] == 3
 
-    @patch('carousel_engine.api.main.app.state')
-    def test_generate_carousel_async_endpoint(self, mock_state, client, mock_engine):
+    def test_generate_carousel_async_endpoint(self, client, mock_engine):
         """Test async carousel generation endpoint"""
-        mock_state.engine = mock_engine
-        
         response = client.post(
             "/api/generate-async",
             json={"notion_page_id": "test_page_id"}
@@ -106,13 +109,11 @@ class TestAPI:
         assert data["status"] == "queued"
         assert data["notion_page_id"] == "test_page_id"
 
-    @patch('carousel_engine.api.main.app.state')
-    def test_carousel_status_endpoint(self, mock_state, client, mock_engine):
+    def test_carousel_status_endpoint(self, client, mock_engine):
         """Test carousel status endpoint"""
         from ..core.models import NotionPage, CarouselFormat, CarouselStatus
         from datetime import datetime
         
-        mock_state.engine = mock_engine
         mock_notion_page = NotionPage(
             id="test_page_id",
             title="Test Page",
@@ -135,10 +136,8 @@ class TestAPI:
         assert data["title"] == "Test Page"
         assert data["status"] == "completed"
 
-    @patch('carousel_engine.api.main.app.state')
-    def test_list_carousels_endpoint(self, mock_state, client, mock_engine):
+    def test_list_carousels_endpoint(self, client, mock_engine):
         """Test list carousels endpoint"""
-        mock_state.engine = mock_engine
         mock_engine.get_all_metrics.return_value = {}
         
         response = client.get("/api/list")
@@ -155,11 +154,8 @@ class TestAPI:
         data = response.json()
         assert data["status"] == "webhook endpoint operational"
 
-    @patch('carousel_engine.api.main.app.state')
-    def test_webhook_notion_endpoint(self, mock_state, client, mock_engine):
+    def test_webhook_notion_endpoint(self, client, mock_engine):
         """Test Notion webhook endpoint"""
-        mock_state.engine = mock_engine
-        
         webhook_payload = {
             "type": "page",
             "data": {
@@ -197,10 +193,8 @@ class TestAPI:
         data = response.json()
         assert data["status"] == "ignored"
 
-    @patch('carousel_engine.api.main.app.state')
-    def test_services_health_endpoint(self, mock_state, client, mock_engine):
+    def test_services_health_endpoint(self, client, mock_engine):
         """Test services health endpoint"""
-        mock_state.engine = mock_engine
         mock_engine.health_check.return_value = {
             "services": {
                 "notion": "healthy",
@@ -217,13 +211,11 @@ class TestAPI:
         assert "google_drive" in data
         assert "openai" in data
 
-    @patch('carousel_engine.api.main.app.state')
-    def test_health_metrics_endpoint(self, mock_state, client, mock_engine):
+    def test_health_metrics_endpoint(self, client, mock_engine):
         """Test health metrics endpoint"""
         from ..core.models import ProcessingMetrics
         from datetime import datetime
         
-        mock_state.engine = mock_engine
         mock_metrics = {
             "page1": ProcessingMetrics(
                 notion_page_id="page1",
@@ -0,0 +1,127 @@
+"""
+Tests for the caching utilities
+"""
+
+import threading
+
+import pytest
+
+from ..utils import cache as cache_module
+from ..utils.cache import DiskCache, MemoryCache, RedisSemanticCache, SemanticCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable clock for the cache module's monotonic and wall time"""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    return now
+
+
+class TestMemoryCache:
+    """Test cases for MemoryCache"""
+
+    def test_evicts_least_recently_used(self):
+        """Test that reads refresh recency and the oldest entry is evicted"""
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Touch "a" so "b" becomes the least recently used
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_entries_expire_after_ttl(self, clock):
+        """Test default and per-entry expiry"""
+        cache = MemoryCache(maxsize=10, default_ttl=60)
+        cache.set("default", "x")
+        cache.set("short", "y", expire=5)
+
+        clock[0] += 10
+        assert cache.get("short", "miss") == "miss"
+        assert cache.get("default") == "x"
+
+        clock[0] += 60
+        assert cache.get("default") is None
+
+
+class TestDiskCache:
+    """Test cases for DiskCache"""
+
+    def test_round_trip(self, tmp_path):
+        """Test that JSON values survive a reopen of the database"""
+        cache = DiskCache(str(tmp_path))
+        cache.set("key", {"slides": ["one", "two"], "cost": 0.01})
+        cache.close()
+
+        reopened = DiskCache(str(tmp_path))
+        assert reopened.get("key") == {"slides": ["one", "two"], "cost": 0.01}
+        assert reopened.get("missing", "default") == "default"
+        reopened.close()
+
+    def test_expired_row_is_deleted(self, tmp_path, clock):
+        """Test that an expired row is a miss and is removed from the table"""
+        cache = DiskCache(str(tmp_path), default_ttl=30)
+        cache.set("key", "value")
+
+        clock[0] += 31
+        assert cache.get("key") is None
+
+        row = cache._conn.execute("SELECT 1 FROM cache WHERE key = ?", ("key",)).fetchone()
+        assert row is None
+        cache.close()
+
+
+class TestSemanticCache:
+    """Test cases for SemanticCache"""
+
+    def test_hit_at_or_above_threshold(self):
+        """Test that a similar embedding returns the cached value"""
+        cache = SemanticCache(threshold=0.9)
+        cache.add([1.0, 0.0, 0.0], "first")
+        cache.add([0.0, 1.0, 0.0], "second")
+
+        # Cosine similarity with [1, 0, 0] is ~0.995; magnitude is ignored
+        assert cache.search([10.0, 1.0, 0.0]) == "first"
+
+    def test_miss_below_threshold(self):
+        """Test that a dissimilar embedding misses"""
+        cache = SemanticCache(threshold=0.9)
+        cache.add([1.0, 0.0, 0.0], "first")
+
+        # Cosine similarity is ~0.707
+        assert cache.search([1.0, 1.0, 0.0]) is None
+
+    def test_oldest_entry_evicted(self):
+        """Test that the cache keeps at most maxsize entries"""
+        cache = SemanticCache(threshold=0.99, maxsize=1)
+        cache.add([1.0, 0.0], "old")
+        cache.add([0.0, 1.0], "new")
+
+        assert cache.search([1.0, 0.0]) is None
+        assert cache.search([0.0, 1.0]) == "new"
+
+
+class TestRedisSemanticCache:
+    """Test cases for RedisSemanticCache"""
+
+    @pytest.mark.asyncio
+    async def test_fallback_search_runs_off_event_loop(self):
+        """Test that without Redis the local scan runs in a worker thread"""
+        search_threads = []
+
+        class RecordingCache(SemanticCache):
+            def search(self, embedding):
+                search_threads.append(threading.get_ident())
+                return super().search(embedding)
+
+        cache = RedisSemanticCache(None, fallback=RecordingCache(threshold=0.9))
+        await cache.add([1.0, 0.0], "first")
+
+        assert await cache.search([1.0, 0.1]) == "first"
+        assert search_threads and search_threads[0] != threading.get_ident()
@@ -3,12 +3,10 @@ Tests for the Carousel Engine core functionality
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
-from datetime import datetime
+from unittest.mock import Mock, AsyncMock
 
-from ..core.engine import CarouselEngine
-from ..core.models import CarouselStatus, CarouselSlide
-from ..core.exceptions import CarouselEngineError, CostLimitExceededError
+from ..core.models import CarouselStatus
+from ..core.exceptions import CostLimitExceededError
 
 
 class TestCarouselEngine:
@@ -72,9 +70,9 @@ class TestCarouselEngine:
     ):
         """Test carousel generation when already processed"""
         # Setup - page already completed
-        sample_notion_page.status = CarouselStatus.COMPLETED
-        sample_notion_page.google_folder_url = "existing_folder_url"
-        mock_notion_service.get_page.return_value = sample_notion_page
+        mock_notion_service.get_page.return_value = sample_notion_page.model_copy(
+            update={"status": CarouselStatus.COMPLETED, "google_folder_url": "existing_folder_url"}
+        )
         
         # Execute
         result = await carousel_engine.generate_carousel("test_page_id")
@@ -98,8 +96,9 @@ class TestCarouselEngine:
     ):
         """Test forced regeneration of completed carousel"""
         # Setup - page already completed but force regenerate
-        sample_notion_page.status = CarouselStatus.COMPLETED
-        mock_notion_service.get_page.return_value = sample_notion_page
+        mock_notion_service.get_page.return_value = sample_notion_page.model_copy(
+            update={"status": CarouselStatus.COMPLETED}
+        )
         mock_notion_service.update_page_status.return_value = True
         
         mock_openai_service.generate_background_image.return_value = (b"fake_bg_image", 0.04)
@@ -168,9 +167,9 @@ class TestCarouselEngine:
     async def test_health_check(self, carousel_engine, mock_notion_service, mock_google_drive_service, mock_openai_service):
         """Test health check functionality"""
         # Setup mocks for successful health checks
-        mock_notion_service.client.databases.query.return_value = {"results": []}
         mock_google_drive_service.service.about.return_value.get.return_value.execute.return_value = {"user": {}}
-        mock_openai_service.client.models.list.return_value = []
+        mock_openai_service.client = Mock()
+        mock_openai_service.client.models.list = AsyncMock(return_value=[])
         
         # Execute
         health_status = await carousel_engine.health_check()
@@ -180,6 +179,7 @@ class TestCarouselEngine:
         assert "notion" in health_status["services"]
         assert "google_drive" in health_status["services"]
         assert "openai" in health_status["services"]
+        mock_notion_service.check_connection.assert_awaited_once()
 
     def test_get_processing_metrics(self, carousel_engine):
         """Test processing metrics retrieval"""
@@ -0,0 +1,97 @@
+"""
+Tests for the image processing helpers
+"""
+
+import random
+
+import pytest
+
+from ..utils.image_processor import ImageProcessor, _largest_fitting_font_size
+
+
+def _linear_font_size(min_size, max_size, fits):
+    """Reference: the original scan from the largest size down in 4pt steps"""
+    for size in range(max_size, min_size - 1, -4):
+        if fits(size):
+            return size
+    return None
+
+
+class TestLargestFittingFontSize:
+    """Test cases for the font size binary search"""
+
+    @pytest.mark.parametrize("min_size,max_size", [(60, 96), (60, 84), (60, 60), (10, 73)])
+    @pytest.mark.parametrize("threshold", [0, 59, 60, 61, 72, 75, 83, 84, 96, 200])
+    def test_matches_linear_scan(self, min_size, max_size, threshold):
+        """Test that bisecting a monotone predicate picks the scan's size"""
+        fits = lambda size: size <= threshold
+
+        assert _largest_fitting_font_size(min_size, max_size, fits) == _linear_font_size(min_size, max_size, fits)
+
+    def test_nothing_fits(self):
+        """Test that None is returned when even the smallest size overflows"""
+        assert _largest_fitting_font_size(60, 96, lambda size: False) is None
+
+    def test_everything_fits(self):
+        """Test that the largest size wins in a logarithmic number of trials"""
+        trials = []
+
+        def fits(size):
+            trials.append(size)
+            return True
+
+        assert _largest_fitting_font_size(60, 96, fits) == 96
+        assert len(trials) <= 4
+
+
+class _AdditiveFont:
+    """Font stub whose text width is the sum of its glyph widths"""
+
+    def getlength(self, text):
+        return sum(4 if ch == " " else 8 + ord(ch) % 7 for ch in text)
+
+
+def _joined_wrap(text, font, box_width, max_lines):
+    """Reference: the original wrap that re-measures each joined line prefix"""
+    words = text.split()
+    lines, current_line, overflow_words = [], [], []
+    usable_width = int(box_width * 0.8)
+
+    for i, word in enumerate(words):
+        if font.getlength(" ".join(current_line + [word])) <= usable_width or not current_line:
+            current_line.append(word)
+        elif len(lines) < max_lines - 1:
+            lines.append(" ".join(current_line))
+            current_line = [word]
+        else:
+            lines.append(" ".join(current_line))
+            overflow_words = words[i:]
+            break
+
+    if current_line and len(lines) < max_lines and not overflow_words:
+        lines.append(" ".join(current_line))
+    elif current_line and not overflow_words:
+        overflow_words = current_line
+
+    return lines or [text], " ".join(overflow_words)
+
+
+class TestGreedyWrap:
+    """Test cases for wrapping with precomputed word widths"""
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_line_breaks_match_joined_measurement(self, seed):
+        """Test that running word widths break lines where joined strings did"""
+        rng = random.Random(seed)
+        processor = ImageProcessor()
+        font = _AdditiveFont()
+
+        for _ in range(50):
+            words = ["".join(rng.choices("abcdefghij", k=rng.randint(1, 12))) for _ in range(rng.randint(1, 40))]
+            text = " ".join(words)
+            box_width = rng.randint(40, 1000)
+            max_lines = rng.randint(1, 4)
+
+            assert processor._wrap_text_with_overflow_intelligence(
+                text, font, box_width, max_lines
+            ) == _joined_wrap(text, font, box_width, max_lines)
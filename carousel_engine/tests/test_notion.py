@@ -0,0 +1,45 @@
+"""
+Tests for the Notion service retry policy
+"""
+
+import httpx
+import pytest
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+from tenacity import RetryCallState
+
+from ..services.notion import _should_retry
+
+
+def _failed_state(exc: BaseException, **kwargs) -> RetryCallState:
+    """Build a retry state for a _request call whose attempt raised exc"""
+    state = RetryCallState(retry_object=None, fn=None, args=(), kwargs=kwargs)
+    state.set_exception((type(exc), exc, None))
+    return state
+
+
+def _http_error(status: int) -> HTTPResponseError:
+    """Build a Notion HTTP error with the given status"""
+    request = httpx.Request("POST", "https://api.notion.com/v1/pages")
+    return HTTPResponseError(httpx.Response(status, request=request))
+
+
+class TestShouldRetry:
+    """Test cases for the NotionService._request retry policy"""
+
+    @pytest.mark.parametrize("exc", [RequestTimeoutError(), _http_error(429), _http_error(503)])
+    def test_idempotent_calls_retry_transient_errors(self, exc):
+        """Test that reads and updates retry timeouts, 429 and 5xx"""
+        assert _should_retry(_failed_state(exc)) is True
+
+    @pytest.mark.parametrize("exc", [RequestTimeoutError(), _http_error(500), _http_error(503)])
+    def test_non_idempotent_calls_skip_ambiguous_failures(self, exc):
+        """Test that a create which may have succeeded is not resent"""
+        assert _should_retry(_failed_state(exc, idempotent=False)) is False
+
+    def test_non_idempotent_calls_retry_rate_limits(self):
+        """Test that a rate limited create is retried"""
+        assert _should_retry(_failed_state(_http_error(429), idempotent=False)) is True
+
+    def test_client_errors_are_not_retried(self):
+        """Test that a 400 is never retried"""
+        assert _should_retry(_failed_state(_http_error(400))) is False
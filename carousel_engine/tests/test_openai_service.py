@@ -0,0 +1,383 @@
+"""
+Tests for the OpenAI service response handling
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from unittest.mock import AsyncMock, Mock
+from openai import OpenAIError as OpenAISDKError
+from openai.types import CompletionUsage
+
+from ..core.config import config
+from ..core.exceptions import OpenAIError
+from ..services.openai_service import OpenAIService, collect_slides
+
+
+def _completion(content: str, finish_reason: str = "stop") -> SimpleNamespace:
+    """Chat completion response with a single choice"""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason=finish_reason)],
+        usage=CompletionUsage(prompt_tokens=100, completion_tokens=50, total_tokens=150)
+    )
+
+
+async def _stream(*deltas: str, usage=None):
+    """Streamed chat completion: one chunk per delta, then an optional usage chunk"""
+    for delta in deltas:
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))], usage=None)
+    if usage is not None:
+        yield SimpleNamespace(choices=[], usage=usage)
+
+
+@pytest.fixture
+def openai_service(monkeypatch, tmp_path):
+    """OpenAI service with caches under tmp_path and a mocked SDK client"""
+    monkeypatch.setattr(config, "openai_cache_dir", str(tmp_path / "responses"))
+    monkeypatch.setattr(config, "openai_image_cache_dir", str(tmp_path / "images"))
+    service = OpenAIService(api_key="test_openai_key")
+    service.client = Mock()
+    service.client.chat.completions.create = AsyncMock()
+    return service
+
+
+class TestJsonSlides:
+    """Test cases for JSON mode slide optimization"""
+
+    @pytest.mark.asyncio
+    async def test_valid_response(self, openai_service):
+        """Test that each slide's lines are joined and meta lines dropped"""
+        openai_service.client.chat.completions.create.return_value = _completion(orjson.dumps({
+            "slides": [["First line", "Second line"], "Single line", ["Note: skip me"]]
+        }).decode())
+
+        slides, cost = await openai_service.optimize_content_for_slides("Some content")
+
+        assert slides == ["First line\nSecond line", "Single line"]
+        assert cost > 0
+        assert openai_service.total_cost == cost
+
+    @pytest.mark.asyncio
+    async def test_truncated_response_raises(self, openai_service):
+        """Test that a response cut off at max_tokens is an error, not slides"""
+        openai_service.client.chat.completions.create.return_value = _completion(
+            '{"slides": [["First line", "Second', finish_reason="length"
+        )
+
+        with pytest.raises(OpenAIError, match="truncated"):
+            await openai_service.optimize_content_for_slides("Some content")
+        assert openai_service.total_cost > 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content_text", [
+        '{"slides": [["First line"',
+        '["First line", "Second line"]',
+        '{"items": [["First line"]]}',
+        '{"slides": "First line"}',
+        '{"slides": [["First line", 2]]}',
+    ])
+    async def test_malformed_response_raises(self, openai_service, content_text):
+        """Test that invalid JSON and unexpected shapes are not parsed as text"""
+        openai_service.client.chat.completions.create.return_value = _completion(content_text)
+
+        with pytest.raises(OpenAIError, match="Malformed JSON slide response"):
+            await openai_service.optimize_content_for_slides("Some content")
+
+
+class TestBackgroundDescriptionsBatch:
+    """Test cases for generating several background descriptions in one call"""
+
+    @pytest.mark.asyncio
+    async def test_descriptions_returned_in_order(self, openai_service):
+        """Test that each title gets its description and a share of the cost"""
+        openai_service.client.chat.completions.create.return_value = _completion(
+            orjson.dumps({"items": [" Sunlit kitchen ", "Quiet study nook"]}).decode()
+        )
+
+        results = await openai_service.generate_background_descriptions_batch(["Budget tips", "Slow down"])
+
+        assert [description for description, _ in results] == ["Sunlit kitchen", "Quiet study nook"]
+        assert sum(cost for _, cost in results) == pytest.approx(openai_service.total_cost)
+
+    @pytest.mark.asyncio
+    async def test_count_mismatch_is_not_rewrapped(self, openai_service):
+        """Test that a short items array raises its own error with the prompt"""
+        openai_service.client.chat.completions.create.return_value = _completion('{"items": ["Sunlit kitchen"]}')
+
+        with pytest.raises(OpenAIError, match="^Expected 2 background descriptions, got 1$") as exc_info:
+            await openai_service.generate_background_descriptions_batch(["Budget tips", "Slow down"])
+        assert "Budget tips" in exc_info.value.prompt
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content_text", ['{"items": ["Sunlit', '{"slides": []}', '{"items": [1, 2]}'])
+    async def test_malformed_response_raises(self, openai_service, content_text):
+        """Test that decode and shape errors raise OpenAIError chained to the cause"""
+        openai_service.client.chat.completions.create.return_value = _completion(content_text)
+
+        with pytest.raises(OpenAIError, match="Malformed background descriptions response") as exc_info:
+            await openai_service.generate_background_descriptions_batch(["Budget tips", "Slow down"])
+        assert exc_info.value.__cause__ is not None
+
+    @pytest.mark.asyncio
+    async def test_cost_limit_checked_before_request(self, monkeypatch, openai_service):
+        """Test that the cost limit error is raised as is, without calling the API"""
+        monkeypatch.setattr(config, "max_cost_per_run", 0.0)
+
+        with pytest.raises(OpenAIError, match="^Cost limit would be exceeded"):
+            await openai_service.generate_background_descriptions_batch(["Budget tips", "Slow down"])
+        openai_service.client.chat.completions.create.assert_not_called()
+
+
+def _batch_output_line(custom_id: str, content: str) -> str:
+    """Batch API output line for a successful chat completion"""
+    return orjson.dumps({
+        "custom_id": custom_id,
+        "response": {
+            "status_code": 200,
+            "body": {
+                "choices": [{"message": {"content": content}}],
+                "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
+            }
+        }
+    }).decode()
+
+
+@pytest.fixture
+def batch_client(openai_service):
+    """Mock Batch API endpoints of the service's client; set output.text per test"""
+    client = openai_service.client
+    client.files.create = AsyncMock(return_value=SimpleNamespace(id="file-in"))
+    client.batches.create = AsyncMock(
+        return_value=SimpleNamespace(id="batch-1", status="completed", output_file_id="file-out")
+    )
+    client.files.content = AsyncMock(return_value=SimpleNamespace(text=""))
+    return client
+
+
+class TestBatchOptimizeContent:
+    """Test cases for slide optimization through the Batch API"""
+
+    @pytest.mark.asyncio
+    async def test_one_request_per_jsonl_line(self, openai_service, batch_client):
+        """Test that each content is one complete request object, in input order"""
+        batch_client.files.content.return_value.text = "\n".join([
+            _batch_output_line("slides-1", "SLIDE 1:\nSecond"),
+            _batch_output_line("slides-0", "SLIDE 1:\nFirst"),
+        ])
+
+        results = await openai_service.batch_optimize_content_for_slides(["first content", "second content"])
+
+        _, jsonl = batch_client.files.create.call_args.kwargs["file"]
+        requests = [orjson.loads(line) for line in jsonl.splitlines()]
+        assert [request["custom_id"] for request in requests] == ["slides-0", "slides-1"]
+        assert requests[1]["body"]["messages"][-1]["content"].endswith("second content")
+        assert [slides for slides, _ in results] == [["First"], ["Second"]]
+
+    @pytest.mark.asyncio
+    async def test_cost_limit_covers_whole_batch(self, monkeypatch, openai_service, batch_client):
+        """Test that a batch whose requests fit singly but not together is not submitted"""
+        single_cost = openai_service._estimate_slide_messages_cost(
+            openai_service._slide_messages("content", 2, None), max_tokens=1000
+        )
+        monkeypatch.setattr(config, "max_cost_per_run", single_cost * 1.5)
+
+        with pytest.raises(OpenAIError, match="Cost limit would be exceeded"):
+            await openai_service.batch_optimize_content_for_slides(["content"] * 4)
+        batch_client.files.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("line", [
+        "not json",
+        '{"custom_id": "slides-0", "response": {"status_code": 200, "body": {"choices": []}}}',
+        '{"custom_id": "other-0", "response": {"status_code": 200}}',
+    ])
+    async def test_malformed_output_line_raises(self, openai_service, batch_client, line):
+        """Test that an unreadable output line raises OpenAIError"""
+        batch_client.files.content.return_value.text = line
+
+        with pytest.raises(OpenAIError, match="Malformed line in batch batch-1 output"):
+            await openai_service.batch_optimize_content_for_slides(["first content"])
+
+
+class TestStreamContent:
+    """Test cases for streaming slide optimization"""
+
+    @pytest.mark.asyncio
+    async def test_slides_streamed_and_cost_tracked(self, openai_service):
+        """Test that slides split across chunks come out whole, costed from usage"""
+        usage = CompletionUsage(prompt_tokens=100, completion_tokens=50, total_tokens=150)
+        openai_service.client.chat.completions.create.return_value = _stream(
+            "SLIDE 1:\nFirst ", "line\nSLI", "DE 2:\nSecond line", usage=usage
+        )
+
+        slides = await collect_slides(openai_service.stream_content_for_slides("Some content"))
+
+        assert slides == ["First line", "Second line"]
+        assert openai_service.total_cost == openai_service._calculate_actual_gpt_cost(usage)
+
+    @pytest.mark.asyncio
+    async def test_missing_usage_is_estimated(self, openai_service):
+        """Test that a stream without a usage chunk still adds a cost"""
+        openai_service.client.chat.completions.create.return_value = _stream("SLIDE 1:\nFirst line")
+
+        slides = await collect_slides(openai_service.stream_content_for_slides("Some content"))
+
+        assert slides == ["First line"]
+        assert openai_service.total_cost > 0
+
+    @pytest.mark.asyncio
+    async def test_cost_limit_is_not_rewrapped(self, monkeypatch, openai_service):
+        """Test that the cost limit error is raised as is, without calling the API"""
+        monkeypatch.setattr(config, "max_cost_per_run", 0.0)
+
+        with pytest.raises(OpenAIError, match="^Cost limit would be exceeded"):
+            await collect_slides(openai_service.stream_content_for_slides("Some content"))
+        openai_service.client.chat.completions.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_api_error_is_chained(self, openai_service):
+        """Test that SDK errors are wrapped with the original as the cause"""
+        sdk_error = OpenAISDKError("connection reset")
+        openai_service.client.chat.completions.create.side_effect = sdk_error
+
+        with pytest.raises(OpenAIError, match="OpenAI API error streaming content") as exc_info:
+            await collect_slides(openai_service.stream_content_for_slides("Some content"))
+        assert exc_info.value.__cause__ is sdk_error
+
+
+class TestBackgroundImage:
+    """Test cases for DALL-E background image generation"""
+
+    @pytest.fixture
+    def image_client(self, openai_service):
+        """Mock images endpoint and image download"""
+        openai_service.client.images.generate = AsyncMock(
+            return_value=SimpleNamespace(data=[SimpleNamespace(url="https://images.example.com/bg.png")])
+        )
+        openai_service._download_image = AsyncMock(return_value=b"png bytes")
+        return openai_service.client
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_served_from_cache(self, openai_service, image_client):
+        """Test that the same request is generated and billed once"""
+        first = await openai_service.generate_background_image("Budget tips", "modern")
+        second = await openai_service.generate_background_image("Budget tips", "modern")
+
+        assert first == (b"png bytes", openai_service.total_cost)
+        assert second == (b"png bytes", 0.0)
+        image_client.images.generate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cost_limit_is_not_rewrapped(self, monkeypatch, openai_service, image_client):
+        """Test that the cost limit error is raised as is, without calling the API"""
+        monkeypatch.setattr(config, "max_cost_per_run", 0.0)
+
+        with pytest.raises(OpenAIError, match="^Cost limit would be exceeded"):
+            await openai_service.generate_background_image("Budget tips", "modern")
+        image_client.images.generate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_api_error_is_chained(self, openai_service, image_client):
+        """Test that SDK errors are wrapped with the original as the cause"""
+        sdk_error = OpenAISDKError("content policy violation")
+        image_client.images.generate.side_effect = sdk_error
+
+        with pytest.raises(OpenAIError, match="OpenAI API error generating background image") as exc_info:
+            await openai_service.generate_background_image("Budget tips", "modern")
+        assert exc_info.value.__cause__ is sdk_error
+        assert openai_service.total_cost == 0.0
+
+
+class TestGenerateCarouselAssets:
+    """Test cases for the concurrent carousel asset fan-out"""
+
+    @pytest.mark.asyncio
+    async def test_results_returned_in_order(self, openai_service):
+        """Test that each generation's result lands in its slot"""
+        openai_service.generate_background_description = AsyncMock(return_value=("Sunlit kitchen", 0.01))
+        openai_service.optimize_content_for_slides = AsyncMock(return_value=(["First line"], 0.02))
+        openai_service.generate_background_image = AsyncMock(return_value=(b"png bytes", 0.08))
+
+        assets = await openai_service.generate_carousel_assets("Budget tips", "Some content")
+
+        assert assets == (("Sunlit kitchen", 0.01), (["First line"], 0.02), (b"png bytes", 0.08))
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_image_generation(self, openai_service):
+        """Test that a failed sibling doesn't leave DALL-E running"""
+        image_started, image_cancelled = asyncio.Event(), asyncio.Event()
+
+        async def slow_image(*args):
+            image_started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                image_cancelled.set()
+                raise
+
+        async def failing_slides(*args):
+            await image_started.wait()
+            raise OpenAIError("Malformed JSON slide response")
+
+        openai_service.generate_background_description = AsyncMock(return_value=("Sunlit kitchen", 0.01))
+        openai_service.optimize_content_for_slides = failing_slides
+        openai_service.generate_background_image = slow_image
+
+        with pytest.raises(OpenAIError, match="Malformed JSON slide response"):
+            await openai_service.generate_carousel_assets("Budget tips", "Some content")
+        await asyncio.wait_for(image_cancelled.wait(), timeout=1)
+
+
+class TestOptimizeMultipleContents:
+    """Test cases for packing several contents into one slide optimization call"""
+
+    @pytest.mark.asyncio
+    async def test_item_blocks_split_per_content(self, openai_service):
+        """Test that each <<ITEM k>> block becomes that content's slides"""
+        openai_service.client.chat.completions.create.return_value = _completion(
+            "<<ITEM 2>>\nSLIDE 1:\nSecond content\n<<END>>\n"
+            "<<ITEM 1>>\nSLIDE 1:\nFirst content\nSLIDE 2:\nMore first\n<<END>>"
+        )
+
+        results = await openai_service.optimize_multiple_contents_for_slides(["first", "second"])
+
+        assert [slides for slides, _ in results] == [["First content", "More first"], ["Second content"]]
+        assert sum(cost for _, cost in results) == pytest.approx(openai_service.total_cost)
+        openai_service.client.chat.completions.create.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_item_falls_back_to_single_calls(self, openai_service):
+        """Test that a response missing a block is redone one content per call"""
+        openai_service.client.chat.completions.create.return_value = _completion(
+            "<<ITEM 1>>\nSLIDE 1:\nFirst content\n<<END>>"
+        )
+        openai_service.optimize_content_for_slides = AsyncMock(
+            side_effect=[(["First retry"], 0.01), (["Second retry"], 0.01)]
+        )
+
+        results = await openai_service.optimize_multiple_contents_for_slides(["first", "second"])
+
+        assert results == [(["First retry"], 0.01), (["Second retry"], 0.01)]
+        assert [call.args[0] for call in openai_service.optimize_content_for_slides.call_args_list] == [
+            "first", "second"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_contents_grouped_ten_per_call(self, openai_service):
+        """Test that more than ten contents are split across requests"""
+        def packed_response(**request):
+            count = request["messages"][-1]["content"].count("Content ")
+            return _completion("".join(f"<<ITEM {k}>>\nSLIDE 1:\nSlide {k}\n<<END>>" for k in range(1, count + 1)))
+
+        openai_service.client.chat.completions.create.side_effect = packed_response
+        openai_service.optimize_content_for_slides = AsyncMock(return_value=(["Single"], 0.01))
+
+        results = await openai_service.optimize_multiple_contents_for_slides([f"content {i}" for i in range(12)])
+
+        assert len(results) == 12
+        assert openai_service.client.chat.completions.create.call_count == 2
+        assert results[0][0] == ["Slide 1"]
+        assert results[11][0] == ["Slide 2"]
+        openai_service.optimize_content_for_slides.assert_not_called()
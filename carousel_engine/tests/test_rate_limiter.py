@@ -0,0 +1,54 @@
+"""
+Tests for the async rate limiting utilities
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from ..utils.rate_limiter import AsyncTokenBucket
+
+
+class TestAsyncTokenBucket:
+    """Test cases for AsyncTokenBucket"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_are_spaced_at_rate(self):
+        """Test that waiters past the burst are released one per 1/rate seconds"""
+        rate = 20.0
+        bucket = AsyncTokenBucket(rate=rate, capacity=1)
+        start = time.monotonic()
+
+        async def acquire() -> float:
+            await bucket.acquire()
+            return time.monotonic() - start
+
+        times = sorted(await asyncio.gather(*(acquire() for _ in range(5))))
+
+        # The first token is the burst; each later one waits another 1/rate
+        for i, elapsed in enumerate(times):
+            assert elapsed == pytest.approx(i / rate, abs=0.03)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_returns_its_token(self):
+        """Test that cancelling a waiter gives its reservation back"""
+        bucket = AsyncTokenBucket(rate=10.0, capacity=1)
+        await bucket.acquire()
+
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        assert bucket._tokens == pytest.approx(-1, abs=0.05)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert bucket._tokens == pytest.approx(0, abs=0.05)
+
+    def test_rejects_non_positive_settings(self):
+        """Test that rate and capacity must be positive"""
+        with pytest.raises(ValueError):
+            AsyncTokenBucket(rate=0, capacity=1)
+        with pytest.raises(ValueError):
+            AsyncTokenBucket(rate=1, capacity=0)
@@ -0,0 +1,79 @@
+"""
+Tests for the retry helpers
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from tenacity import RetryCallState
+
+from ..utils.retry import MAX_RETRY_AFTER_SECONDS, retry_after_seconds, wait_retry_after_or_exponential
+
+
+def _failed_state(exc: BaseException, **kwargs) -> RetryCallState:
+    """Build a retry state whose first attempt raised exc"""
+    state = RetryCallState(retry_object=None, fn=None, args=(), kwargs=kwargs)
+    state.set_exception((type(exc), exc, None))
+    return state
+
+
+class _HeaderError(Exception):
+    """Error carrying headers like the Notion SDK errors"""
+
+    def __init__(self, headers):
+        super().__init__("rate limited")
+        self.headers = headers
+
+
+class _ResponseError(Exception):
+    """Error carrying a response like the OpenAI SDK errors"""
+
+    def __init__(self, headers):
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(headers=headers)
+
+
+class TestRetryAfterSeconds:
+    """Test cases for retry_after_seconds"""
+
+    @pytest.mark.parametrize("error_type", [_HeaderError, _ResponseError])
+    def test_reads_retry_after(self, error_type):
+        """Test Retry-After on both SDK error shapes"""
+        assert retry_after_seconds(error_type({"retry-after": "2"})) == 2.0
+
+    def test_prefers_milliseconds_header(self):
+        """Test that retry-after-ms wins over retry-after"""
+        exc = _HeaderError({"retry-after-ms": "250", "retry-after": "5"})
+        assert retry_after_seconds(exc) == 0.25
+
+    def test_caps_long_delays(self):
+        """Test that server delays are capped"""
+        exc = _HeaderError({"retry-after": "3600"})
+        assert retry_after_seconds(exc) == MAX_RETRY_AFTER_SECONDS
+
+    @pytest.mark.parametrize("exc", [
+        None,
+        ValueError("no headers"),
+        _HeaderError({}),
+        _HeaderError({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+    ])
+    def test_unusable_header_returns_none(self, exc):
+        """Test missing, empty and HTTP-date headers"""
+        assert retry_after_seconds(exc) is None
+
+
+class TestWaitRetryAfterOrExponential:
+    """Test cases for wait_retry_after_or_exponential"""
+
+    def test_uses_server_delay(self):
+        """Test that a Retry-After header sets the wait"""
+        wait = wait_retry_after_or_exponential(initial=1, max=30)
+        assert wait(_failed_state(_HeaderError({"retry-after": "7"}))) == 7.0
+
+    def test_falls_back_to_exponential_backoff(self):
+        """Test jittered backoff when the server gives no delay"""
+        wait = wait_retry_after_or_exponential(initial=1, max=30)
+        delay = wait(_failed_state(ValueError("boom")))
+
+        # First attempt: initial plus up to one second of jitter
+        assert 1 <= delay <= 2
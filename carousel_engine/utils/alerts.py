@@ -3,12 +3,38 @@ Alerting and notification utilities
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Callable
+import atexit
+import logging
+import queue
+import sys
+import threading
+import time
+import weakref
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from itertools import islice, takewhile
+from typing import Deque, Dict, Any, List, Optional, Callable
 from enum import Enum
 import structlog
 
 logger = structlog.get_logger(__name__)
+# Stdlib logger behind the structlog one; its level checks are cached, so hot
+# paths can skip building log kwargs when INFO is filtered out
+_stdlib_logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1)
+_NS_PER_HOUR = 3600 * 10 ** 9
+
+
+def _datetime_to_ns(value: datetime) -> int:
+    """Nanoseconds since the epoch for a naive UTC or timezone-aware datetime"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+# Most alerts the dispatcher hands to batch-aware handlers at once
+MAX_DISPATCH_BATCH = 100
 
 
 class AlertLevel(str, Enum):
@@ -20,7 +46,15 @@ class AlertLevel(str, Enum):
 
 
 class Alert:
-    """Alert message"""
+    """Alert message
+    
+    Titles are meant to come from a small vocabulary (e.g. "Health check
+    failed: <name>") with specifics in the message, so they are interned
+    and repeated alerts share one title string.
+    """
+    
+    # No per-instance __dict__; up to max_alerts of these stay buffered
+    __slots__ = ('level', 'level_str', 'title', 'message', 'metadata', 'timestamp_ns', '_timestamp', '_timestamp_iso')
     
     def __init__(
         self,
@@ -31,29 +65,73 @@ class Alert:
         timestamp: Optional[datetime] = None
     ):
         self.level = level
-        self.title = title
+        # Plain string copy of the level for logging, counting and serialization
+        self.level_str = level.value
+        self.title = sys.intern(title)
         self.message = message
         self.metadata = metadata or {}
-        self.timestamp = timestamp or datetime.utcnow()
+        # Stored as epoch nanoseconds; the datetime is only built when asked for
+        self.timestamp_ns = time.time_ns() if timestamp is None else _datetime_to_ns(timestamp)
+        self._timestamp: Optional[datetime] = None
+        self._timestamp_iso: Optional[str] = None
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Alert time as a naive UTC datetime, built on first access"""
+        if self._timestamp is None:
+            self._timestamp = _EPOCH + timedelta(microseconds=self.timestamp_ns // 1000)
+        return self._timestamp
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert alert to dictionary"""
         return {
-            "level": self.level.value,
+            "level": self.level_str,
             "title": self.title,
             "message": self.message,
             "metadata": self.metadata,
-            "timestamp": self.timestamp.isoformat()
+            "timestamp": self._timestamp_iso or self._format_timestamp()
         }
+    
+    def _format_timestamp(self) -> str:
+        self._timestamp_iso = self.timestamp.isoformat()
+        return self._timestamp_iso
 
 
 class AlertManager:
-    """Manage alerts and notifications"""
+    """Manage alerts and notifications
     
-    def __init__(self):
-        self.alerts: List[Alert] = []
+    Alerts are assumed to arrive in timestamp order, so time-window queries
+    walk back from the newest alert and stop at the first older one.
+    
+    Handlers run on a background dispatcher thread fed by a bounded queue,
+    so a slow handler never blocks the code raising the alert. When the
+    queue is full, new alerts are still stored, but skip the handlers once
+    overflow_timeout has passed; get_alert_summary reports how many did.
+    Handlers with a ``handle_batch`` method receive every alert queued at
+    the time as one list.
+    """
+    
+    def __init__(self, max_alerts: int = 1000, max_queued_alerts: int = 10000, overflow_timeout: float = 0.0):
+        """Initialize alert manager
+        
+        Args:
+            max_alerts: Most recent alerts kept for queries
+            max_queued_alerts: Alerts waiting for the handlers before new ones are dropped
+            overflow_timeout: Seconds send_alert waits for room in a full queue
+                before dropping; 0 never blocks the caller
+        """
+        # Ring buffer of the most recent alerts, oldest first
+        self.alerts: Deque[Alert] = deque(maxlen=max_alerts)
+        # The same alerts split by level, evicted together with self.alerts
+        self._by_level: Dict[str, Deque[Alert]] = {level.value: deque() for level in AlertLevel}
         self.handlers: List[Callable[[Alert], None]] = []
-        self.alert_counts = {level: 0 for level in AlertLevel}
+        # All-time counts keyed by level string
+        self.alert_counts = {level.value: 0 for level in AlertLevel}
+        self.dropped_alerts = 0
+        self.overflow_timeout = overflow_timeout
+        self._queue: "queue.Queue[Alert]" = queue.Queue(maxsize=max_queued_alerts)
+        self._dispatcher: Optional[threading.Thread] = None
+        self._dispatcher_lock = threading.Lock()
         
     def add_handler(self, handler: Callable[[Alert], None]) -> None:
         """Add alert handler
@@ -65,40 +143,91 @@ class AlertManager:
         logger.info("Added alert handler", handler=handler.__name__)
         
     def send_alert(self, alert: Alert) -> None:
-        """Send alert to all handlers
+        """Store alert and queue it for the handlers
         
         Args:
             alert: Alert to send
         """
         try:
-            # Store alert
+            # Store alert; the deque drops the oldest once full
+            if len(self.alerts) == self.alerts.maxlen:
+                self._by_level[self.alerts[0].level_str].popleft()
             self.alerts.append(alert)
-            self.alert_counts[alert.level] += 1
+            self._by_level[alert.level_str].append(alert)
+            self.alert_counts[alert.level_str] += 1
             
-            # Trim old alerts (keep last 1000)
-            if len(self.alerts) > 1000:
-                self.alerts = self.alerts[-1000:]
+            # Hand off to the dispatcher thread
+            self._start_dispatcher()
+            try:
+                if self.overflow_timeout > 0:
+                    self._queue.put(alert, timeout=self.overflow_timeout)
+                else:
+                    self._queue.put_nowait(alert)
+            except queue.Full:
+                self.dropped_alerts += 1
+                # Warn on the first drop and every thousandth after, not for each alert in a storm
+                if self.dropped_alerts % 1000 == 1:
+                    logger.warning(
+                        "Alert queue full, skipping handlers",
+                        title=alert.title,
+                        dropped=self.dropped_alerts
+                    )
             
-            # Send to handlers
-            for handler in self.handlers:
+        except Exception as e:
+            logger.error("Failed to send alert", error=str(e))
+    
+    def flush(self) -> None:
+        """Block until every queued alert has been through the handlers"""
+        self._queue.join()
+    
+    def _start_dispatcher(self) -> None:
+        if self._dispatcher is not None:
+            return
+        with self._dispatcher_lock:
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch_loop, name="alert-dispatcher", daemon=True
+                )
+                self._dispatcher.start()
+    
+    def _dispatch_loop(self) -> None:
+        while True:
+            # Wait for one alert, then take whatever else is already queued
+            alerts = [self._queue.get()]
+            while len(alerts) < MAX_DISPATCH_BATCH:
+                try:
+                    alerts.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._dispatch(alerts)
+            finally:
+                for _ in alerts:
+                    self._queue.task_done()
+    
+    def _dispatch(self, alerts: List[Alert]) -> None:
+        """Send alerts to all handlers"""
+        for handler in self.handlers:
+            handle_batch = getattr(handler, "handle_batch", None)
+            calls = [(handle_batch, alerts)] if handle_batch else [(handler, alert) for alert in alerts]
+            for func, arg in calls:
                 try:
-                    handler(alert)
+                    func(arg)
                 except Exception as e:
                     logger.error(
                         "Alert handler failed",
                         handler=handler.__name__,
                         error=str(e)
                     )
-            
-            logger.info(
-                "Alert sent",
-                level=alert.level.value,
-                title=alert.title,
-                handlers=len(self.handlers)
-            )
-            
-        except Exception as e:
-            logger.error("Failed to send alert", error=str(e))
+        
+        if _stdlib_logger.isEnabledFor(logging.INFO):
+            for alert in alerts:
+                logger.info(
+                    "Alert sent",
+                    level=alert.level_str,
+                    title=alert.title,
+                    handlers=len(self.handlers)
+                )
     
     def create_alert(
         self,
@@ -132,26 +261,21 @@ class AlertManager:
             limit: Limit number of results
             
         Returns:
-            List of alerts
+            List of alerts, newest first
         """
-        filtered_alerts = self.alerts
+        # Alerts are stored in arrival order, so walking backwards yields newest first
+        filtered_alerts = reversed(self._by_level[level.value] if level else self.alerts)
         
-        # Filter by level
-        if level:
-            filtered_alerts = [a for a in filtered_alerts if a.level == level]
-        
-        # Filter by time
+        # Filter by time, stopping at the first alert older than since
         if since:
-            filtered_alerts = [a for a in filtered_alerts if a.timestamp >= since]
-        
-        # Sort by timestamp (newest first)
-        filtered_alerts.sort(key=lambda a: a.timestamp, reverse=True)
+            since_ns = _datetime_to_ns(since)
+            filtered_alerts = takewhile(lambda a: a.timestamp_ns >= since_ns, filtered_alerts)
         
-        # Apply limit
+        # Apply limit, stopping as soon as enough alerts are found
         if limit:
-            filtered_alerts = filtered_alerts[:limit]
+            filtered_alerts = islice(filtered_alerts, limit)
             
-        return filtered_alerts
+        return list(filtered_alerts)
     
     def get_alert_summary(self, hours: int = 24) -> Dict[str, Any]:
         """Get alert summary statistics
@@ -162,19 +286,22 @@ class AlertManager:
         Returns:
             Alert summary
         """
-        since = datetime.utcnow() - timedelta(hours=hours)
-        recent_alerts = self.get_alerts(since=since)
+        since_ns = time.time_ns() - hours * _NS_PER_HOUR
         
-        level_counts = {level.value: 0 for level in AlertLevel}
-        for alert in recent_alerts:
-            level_counts[alert.level.value] += 1
+        # One backward pass over the window, counted in C
+        recent_levels = Counter(
+            a.level_str for a in takewhile(lambda a: a.timestamp_ns >= since_ns, reversed(self.alerts))
+        )
+        level_counts = {level.value: recent_levels[level.value] for level in AlertLevel}
+        total_alerts = sum(level_counts.values())
         
         return {
             "time_window_hours": hours,
-            "total_alerts": len(recent_alerts),
+            "total_alerts": total_alerts,
             "by_level": level_counts,
-            "latest_alert": recent_alerts[0].to_dict() if recent_alerts else None,
-            "all_time_counts": {level.value: count for level, count in self.alert_counts.items()}
+            "latest_alert": self.alerts[-1].to_dict() if total_alerts else None,
+            "all_time_counts": dict(self.alert_counts),
+            "dropped_alerts": self.dropped_alerts
         }
 
 
@@ -193,6 +320,8 @@ class HealthChecker:
             name: Check name
             check_func: Function that returns True if healthy
         """
+        # Interned so last_check_results lookups hit the identity fast path
+        name = sys.intern(name)
         self.checks[name] = check_func
         logger.info("Added health check", name=name)
         
@@ -204,10 +333,18 @@ class HealthChecker:
         """
         results = {}
         
-        for name, check_func in self.checks.items():
+        # Checks are mostly blocking I/O, so run them all at once in worker threads
+        names = list(self.checks)
+        logger.debug("Running health checks", names=names)
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(self.checks[name]) for name in names),
+            return_exceptions=True
+        )
+        
+        for name, result in zip(names, outcomes):
             try:
-                logger.debug("Running health check", name=name)
-                result = check_func()
+                if isinstance(result, BaseException):
+                    raise result
                 results[name] = result
                 
                 # Check if status changed
@@ -246,13 +383,13 @@ class HealthChecker:
 # Alert handlers
 def console_alert_handler(alert: Alert) -> None:
     """Print alert to console"""
-    print(f"[{alert.level.value.upper()}] {alert.title}: {alert.message}")
+    print(f"[{alert.level_str.upper()}] {alert.title}: {alert.message}")
 
 
 def log_alert_handler(alert: Alert) -> None:
     """Log alert using structured logger"""
     logger.log(
-        alert.level.value,
+        alert.level_str,
         "Alert triggered",
         title=alert.title,
         message=alert.message,
@@ -260,23 +397,110 @@ def log_alert_handler(alert: Alert) -> None:
     )
 
 
-async def webhook_alert_handler(alert: Alert, webhook_url: str) -> None:
-    """Send alert to webhook endpoint"""
-    try:
+class WebhookAlertHandler:
+    """Post alerts to a webhook over one keep-alive HTTP connection
+    
+    Alerts dispatched together are sent as a single ``{"alerts": [...]}``
+    request. If the endpoint rejects that with a 4xx, the handler switches
+    to posting each alert on its own, as webhook_alert_handler does.
+    
+    Usage::
+    
+        alert_manager.add_handler(WebhookAlertHandler("https://hooks.example.com/alerts"))
+    """
+    
+    def __init__(self, webhook_url: str, timeout: float = 10.0):
+        """Initialize webhook handler
+        
+        Args:
+            webhook_url: Endpoint receiving the alerts
+            timeout: Request timeout in seconds
+        """
         import httpx
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                webhook_url,
-                json=alert.to_dict(),
-                timeout=10.0
-            )
-            response.raise_for_status()
+        # AlertManager logs handlers by __name__
+        self.__name__ = type(self).__name__
+        self.webhook_url = webhook_url
+        self.batching = True
+        self._client = httpx.Client(timeout=timeout)
+        # Closed by the module's atexit hook; the weak set doesn't keep us alive
+        _live_webhook_handlers.add(self)
+    
+    def __call__(self, alert: Alert) -> None:
+        self.handle_batch([alert])
+    
+    def handle_batch(self, alerts: List[Alert]) -> None:
+        """Post a batch of alerts
+        
+        Args:
+            alerts: Alerts to send
+        """
+        try:
+            if self.batching and len(alerts) > 1:
+                response = self._client.post(
+                    self.webhook_url,
+                    json={"alerts": [alert.to_dict() for alert in alerts]}
+                )
+                if 400 <= response.status_code < 500:
+                    logger.warning(
+                        "Webhook rejected alert batch, posting alerts individually",
+                        status_code=response.status_code
+                    )
+                    self.batching = False
+                else:
+                    response.raise_for_status()
+                    logger.info("Alerts sent to webhook", webhook_url=self.webhook_url, count=len(alerts))
+                    return
             
-        logger.info("Alert sent to webhook", webhook_url=webhook_url)
+            for alert in alerts:
+                self._client.post(self.webhook_url, json=alert.to_dict()).raise_for_status()
+            logger.info("Alert sent to webhook", webhook_url=self.webhook_url, count=len(alerts))
+            
+        except Exception as e:
+            logger.error("Failed to send webhook alert", error=str(e))
+    
+    def close(self) -> None:
+        """Close the HTTP connection pool"""
+        self._client.close()
+
+
+# Every open WebhookAlertHandler, closed once at interpreter exit
+_live_webhook_handlers: "weakref.WeakSet[WebhookAlertHandler]" = weakref.WeakSet()
+
+# Shared handler per webhook URL, so repeated calls reuse one connection pool
+_webhook_handlers: Dict[str, WebhookAlertHandler] = {}
+_webhook_handlers_lock = threading.Lock()
+
+
+def _close_webhook_handlers() -> None:
+    for handler in list(_live_webhook_handlers):
+        handler.close()
+
+
+atexit.register(_close_webhook_handlers)
+
+
+def get_webhook_handler(webhook_url: str) -> WebhookAlertHandler:
+    """Get the shared webhook handler for a URL, creating it on first use
+    
+    Args:
+        webhook_url: Endpoint receiving the alerts
         
-    except Exception as e:
-        logger.error("Failed to send webhook alert", error=str(e))
+    Returns:
+        WebhookAlertHandler bound to the URL
+    """
+    handler = _webhook_handlers.get(webhook_url)
+    if handler is None:
+        with _webhook_handlers_lock:
+            handler = _webhook_handlers.get(webhook_url)
+            if handler is None:
+                handler = _webhook_handlers[webhook_url] = WebhookAlertHandler(webhook_url)
+    return handler
+
+
+async def webhook_alert_handler(alert: Alert, webhook_url: str) -> None:
+    """Send alert to webhook endpoint through the shared handler for the URL"""
+    await asyncio.to_thread(get_webhook_handler(webhook_url), alert)
 
 
 # Global alert manager
@@ -0,0 +1,488 @@
+"""
+Caching utilities for API responses
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import operator
+import os
+import sqlite3
+import struct
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a stable cache key from JSON-serializable parts
+
+    Args:
+        *parts: Values that identify the cached item
+
+    Returns:
+        SHA-256 hex digest of the serialized parts
+    """
+    payload = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.sha256(payload).hexdigest()
+
+
+class MemoryCache:
+    """In-process LRU cache with per-entry expiry
+
+    Sits in front of DiskCache so hot keys skip the SQLite read.
+    """
+
+    def __init__(self, maxsize: int = 1000, default_ttl: Optional[float] = None):
+        """Initialize memory cache
+
+        Args:
+            maxsize: Maximum number of entries; least recently used are evicted
+            default_ttl: Default expiry in seconds, None to keep entries until evicted
+        """
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[str, tuple[Any, Optional[float]]]" = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a cached value
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, expire: Optional[float] = None) -> None:
+        """Store a value
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            expire: Expiry in seconds, defaults to the cache's default_ttl
+        """
+        ttl = expire if expire is not None else self.default_ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a cached value
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all cached values"""
+        with self._lock:
+            self._data.clear()
+
+
+class SemanticCache:
+    """Nearest-neighbour cache over embedding vectors
+
+    Returns the value stored for the most similar previous key when its
+    cosine similarity reaches the threshold, so near-duplicate inputs
+    (e.g. reworded titles) reuse an earlier result. Embeddings are
+    normalized on insert, making similarity a plain dot product.
+    """
+
+    def __init__(self, threshold: float = 0.92, maxsize: int = 256):
+        """Initialize semantic cache
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            maxsize: Maximum number of entries; oldest are evicted first
+        """
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: list[tuple[tuple[float, ...], Any]] = []
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> tuple[float, ...]:
+        norm = math.sqrt(sum(x * x for x in embedding)) or 1.0
+        return tuple(x / norm for x in embedding)
+
+    def search(self, embedding: Sequence[float]) -> Optional[Any]:
+        """Find the value for the most similar cached embedding
+
+        The scan is linear in pure Python; async callers should run it with
+        asyncio.to_thread.
+
+        Args:
+            embedding: Query embedding
+
+        Returns:
+            Cached value, or None if nothing is similar enough
+        """
+        query = self._normalize(embedding)
+        with self._lock:
+            entries = list(self._entries)
+
+        best_score, best_value = self.threshold, None
+        for vector, value in entries:
+            score = sum(map(operator.mul, query, vector))
+            if score >= best_score:
+                best_score, best_value = score, value
+        return best_value
+
+    def add(self, embedding: Sequence[float], value: Any) -> None:
+        """Store a value under an embedding
+
+        Args:
+            embedding: Key embedding
+            value: Value to cache
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            self._entries.append((vector, value))
+            if len(self._entries) > self.maxsize:
+                del self._entries[0]
+
+    def clear(self) -> None:
+        """Remove all cached values"""
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisSemanticCache:
+    """Semantic cache shared across worker processes through Redis Stack
+
+    Embeddings live in a RediSearch HNSW index (cosine distance), so every
+    worker sees the others' entries. When no URL is configured, the redis
+    package is missing or the server can't be reached, calls fall through
+    to a local SemanticCache; after a failure Redis is retried once
+    ``retry_interval`` seconds have passed.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str],
+        fallback: SemanticCache,
+        index_name: str = "semantic_cache_idx",
+        prefix: str = "semantic:",
+        ttl: Optional[int] = None,
+        retry_interval: float = 60.0
+    ):
+        """Initialize Redis semantic cache
+
+        Args:
+            url: Redis URL, None to only use the local fallback
+            fallback: Local cache used when Redis is unavailable; its
+                threshold also applies to Redis hits
+            index_name: RediSearch index name
+            prefix: Key prefix of the hashes covered by the index
+            ttl: Expiry in seconds for Redis entries, None to keep them
+            retry_interval: Seconds to wait before retrying Redis after a failure
+        """
+        self.url = url
+        self.fallback = fallback
+        self.index_name = index_name
+        self.prefix = prefix
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self._redis = None
+        self._index_ready = False
+        self._disabled_until = 0.0 if url else math.inf
+
+    def _client(self):
+        if time.monotonic() < self._disabled_until:
+            return None
+        if self._redis is None:
+            try:
+                import redis.asyncio as redis
+            except ImportError:
+                logger.warning("redis package not installed, using local semantic cache")
+                self._disabled_until = math.inf
+                return None
+            self._redis = redis.Redis.from_url(self.url, socket_connect_timeout=1, socket_timeout=1)
+        return self._redis
+
+    def _disable(self, error: Exception) -> None:
+        logger.warning(f"Redis semantic cache unavailable, using local cache: {error}")
+        self._disabled_until = time.monotonic() + self.retry_interval
+
+    async def _ensure_index(self, client, dim: int) -> None:
+        if self._index_ready:
+            return
+        try:
+            await client.execute_command(
+                "FT.CREATE", self.index_name, "ON", "HASH", "PREFIX", 1, self.prefix,
+                "SCHEMA", "emb", "VECTOR", "HNSW", 6,
+                "TYPE", "FLOAT32", "DIM", dim, "DISTANCE_METRIC", "COSINE"
+            )
+        except Exception as e:
+            if "already exists" not in str(e).lower():
+                raise
+        self._index_ready = True
+
+    @staticmethod
+    def _pack(embedding: Sequence[float]) -> bytes:
+        return struct.pack(f"<{len(embedding)}f", *embedding)
+
+    async def search(self, embedding: Sequence[float]) -> Optional[Any]:
+        """Find the value for the most similar cached embedding
+
+        Args:
+            embedding: Query embedding
+
+        Returns:
+            Cached value, or None if nothing is similar enough
+        """
+        client = self._client()
+        if client is None:
+            return await asyncio.to_thread(self.fallback.search, embedding)
+
+        try:
+            await self._ensure_index(client, len(embedding))
+            # Cosine distance is 1 - similarity
+            max_distance = 1.0 - self.fallback.threshold
+            result = await client.execute_command(
+                "FT.SEARCH", self.index_name, "*=>[KNN 1 @emb $vec AS distance]",
+                "PARAMS", 2, "vec", self._pack(embedding),
+                "RETURN", 2, "distance", "payload",
+                "SORTBY", "distance", "DIALECT", 2, "LIMIT", 0, 1
+            )
+        except Exception as e:
+            self._disable(e)
+            return await asyncio.to_thread(self.fallback.search, embedding)
+
+        if not result or result[0] == 0:
+            return None
+
+        fields = dict(zip(result[2][::2], result[2][1::2]))
+        if float(fields[b"distance"]) > max_distance:
+            return None
+        return orjson.loads(fields[b"payload"])
+
+    async def add(self, embedding: Sequence[float], value: Any) -> None:
+        """Store a value under an embedding
+
+        Args:
+            embedding: Key embedding
+            value: JSON-serializable value
+        """
+        client = self._client()
+        if client is None:
+            self.fallback.add(embedding, value)
+            return
+
+        key = f"{self.prefix}{uuid.uuid4().hex}"
+        try:
+            await self._ensure_index(client, len(embedding))
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping={"emb": self._pack(embedding), "payload": orjson.dumps(value)})
+                if self.ttl is not None:
+                    pipe.expire(key, self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            self._disable(e)
+            self.fallback.add(embedding, value)
+
+
+class DiskCache:
+    """Small persistent key/value cache backed by SQLite
+
+    Values are stored as JSON and survive process restarts, so repeated runs
+    on the same input can skip the API call entirely.
+    """
+
+    def __init__(self, directory: str, default_ttl: Optional[float] = None):
+        """Initialize disk cache
+
+        Args:
+            directory: Directory holding the cache database, created if missing
+            default_ttl: Default expiry in seconds, None to keep entries forever
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "cache.sqlite3")
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a cached value
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None:
+                return default
+
+            value, expires_at = row
+            if expires_at is not None and expires_at < time.time():
+                self.delete(key)
+                return default
+
+            return orjson.loads(value)
+
+        except Exception as e:
+            logger.warning(f"Disk cache read failed: {e}")
+            return default
+
+    def set(self, key: str, value: Any, expire: Optional[float] = None) -> None:
+        """Store a value
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            expire: Expiry in seconds, defaults to the cache's default_ttl
+        """
+        ttl = expire if expire is not None else self.default_ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+
+        try:
+            payload = orjson.dumps(value).decode()
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, payload, expires_at)
+                )
+        except Exception as e:
+            logger.warning(f"Disk cache write failed: {e}")
+
+    def delete(self, key: str) -> None:
+        """Remove a cached value
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class FileCache:
+    """Content-addressed cache of binary blobs, one file per key
+
+    Suited to large payloads such as generated images. Reads refresh the
+    file's mtime, and writes evict the least recently used files once the
+    directory grows past max_bytes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, suffix: str = ""):
+        """Initialize file cache
+
+        Args:
+            directory: Directory holding cached files, created if missing
+            max_bytes: Total size at which least recently used files are evicted
+            suffix: File name suffix, e.g. ".png"
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{self.suffix}")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Read a cached blob
+
+        Args:
+            key: Cache key, e.g. from make_cache_key
+
+        Returns:
+            Cached bytes, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"File cache read failed: {e}")
+            return None
+
+    def set(self, key: str, data: bytes) -> None:
+        """Store a blob, then evict old files if the cache is over its size limit
+
+        Args:
+            key: Cache key
+            data: Bytes to store
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            # Write then rename so readers never see a partial file
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._evict()
+        except OSError as e:
+            logger.warning(f"File cache write failed: {e}")
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            total = 0
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(self.suffix):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except FileNotFoundError:
+                    pass
@@ -4,6 +4,7 @@ Content processing utilities for Carousel Engine v2
 
 import logging
 import re
+from itertools import chain, islice
 from typing import List, Tuple
 from ..core.models import CarouselSlide
 from ..core.config import config
@@ -11,6 +12,35 @@ from ..core.exceptions import ContentProcessingError
 
 logger = logging.getLogger(__name__)
 
+# Content cleaning patterns
+_WHITESPACE_RE = re.compile(r'\s+')
+# Headers, bold, italic and code in one pass; the last three keep their inner text
+_MARKDOWN_RE = re.compile(r'(?P<header>#{1,6}\s*)|\*\*(?P<bold>.*?)\*\*|\*(?P<italic>.*?)\*|`(?P<code>.*?)`')
+_BULLET_RE = re.compile(r'^\s*[•\-\*]\s*', re.MULTILINE)
+_REPEATED_PUNCTUATION_RE = re.compile(r'([.!?])\1+')
+
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+\s+')
+
+# Social media keyword enhancements, applied in order
+_SOCIAL_REPLACEMENTS = (
+    # Add emoji support (basic patterns)
+    (re.compile(r'\btip\b', re.IGNORECASE), '💡 tip'),
+    (re.compile(r'\bimportant\b', re.IGNORECASE), '⚠️ important'),
+    (re.compile(r'\bsuccess\b', re.IGNORECASE), '✅ success'),
+    # Enhance call-to-action phrases
+    (re.compile(r'\blearn more\b', re.IGNORECASE), 'Learn More →'),
+    (re.compile(r'\bget started\b', re.IGNORECASE), 'Get Started 🚀'),
+)
+_NUMBER_RE = re.compile(r'(\d+)')
+
+
+def _strip_markdown(match: re.Match) -> str:
+    """Replacement for _MARKDOWN_RE: drop headers, unwrap the other markup"""
+    if match.lastgroup == 'header':
+        return ''
+    # Markup nested inside bold/italic/code is stripped too
+    return _MARKDOWN_RE.sub(_strip_markdown, match.group(match.lastgroup))
+
 
 class ContentProcessor:
     """Content processing utilities for carousel generation"""
@@ -40,36 +70,25 @@ class ContentProcessor:
             ContentProcessingError: If content processing fails
         """
         try:
-            logger.info(f"Processing content into slides. Title: {title}")
-            
-            slides = []
+            logger.info("Processing content into slides. Title: %s", title)
             
             # NO title slide - jump straight to content as per requirements
             
-            # Process content slides  
-            if optimized_content:
-                # Use AI-optimized content (4-7 slides as determined by AI)
-                for i, slide_text in enumerate(optimized_content):
-                    content_slide = CarouselSlide(
-                        slide_number=i + 1,
-                        title=None,
-                        content=slide_text.strip(),
-                        is_title_slide=False
-                    )
-                    slides.append(content_slide)
-            else:
-                # Fallback to manual segmentation
-                content_slides = self._segment_content_manually(content)
-                for i, slide_text in enumerate(content_slides):
-                    content_slide = CarouselSlide(
-                        slide_number=i + 1,
-                        title=None,
-                        content=slide_text.strip(),
-                        is_title_slide=False
-                    )
-                    slides.append(content_slide)
-            
-            logger.info(f"Successfully created {len(slides)} content slides")
+            # Use AI-optimized content (4-7 slides as determined by AI), falling
+            # back to manual segmentation
+            slide_texts = optimized_content or self._segment_content_manually(content)
+            
+            slides = [
+                CarouselSlide(
+                    slide_number=i + 1,
+                    title=None,
+                    content=slide_text.strip(),
+                    is_title_slide=False
+                )
+                for i, slide_text in enumerate(slide_texts)
+            ]
+            
+            logger.info("Successfully created %d content slides", len(slides))
             return slides
             
         except Exception as e:
@@ -90,53 +109,33 @@ class ContentProcessor:
             # Clean and normalize content
             content = self._clean_content(content)
             
-            # Split into paragraphs
-            paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
-            
-            slides = []
-            current_slide_lines = []
-            
-            for paragraph in paragraphs:
-                # Split paragraph into sentences
-                sentences = self._split_into_sentences(paragraph)
-                
-                for sentence in sentences:
-                    # Check if adding this sentence would exceed line limit
-                    if len(current_slide_lines) >= self.lines_per_slide:
-                        # Save current slide and start new one
-                        if current_slide_lines:
-                            slides.append('\n'.join(current_slide_lines))
-                        current_slide_lines = [sentence]
-                    else:
-                        current_slide_lines.append(sentence)
-                    
-                    # Stop if we've reached max slides
-                    if len(slides) >= self.max_slides:
-                        break
-                
-                if len(slides) >= self.max_slides:
-                    break
-            
-            # Add remaining lines as final slide
-            if current_slide_lines and len(slides) < self.max_slides:
-                slides.append('\n'.join(current_slide_lines))
-            
-            return slides[:self.max_slides]
+            # Split into paragraphs, stripped lazily as they are consumed
+            paragraphs = filter(None, map(str.strip, content.split('\n\n')))
+            
+            # One sentence per line, so only the sentences that fit on max_slides
+            # slides are needed; later paragraphs are never split
+            lines_per_slide = max(self.lines_per_slide, 1)
+            sentences = list(islice(
+                chain.from_iterable(map(self._split_into_sentences, paragraphs)),
+                lines_per_slide * self.max_slides
+            ))
+            
+            return [
+                '\n'.join(sentences[i:i + lines_per_slide])
+                for i in range(0, len(sentences), lines_per_slide)
+            ]
             
         except Exception as e:
             logger.error(f"Error in manual content segmentation: {e}")
             # Fallback: just split by lines
-            lines = [line.strip() for line in content.split('\n') if line.strip()]
-            slides = []
-            
-            for i in range(0, len(lines), self.lines_per_slide):
-                slide_lines = lines[i:i + self.lines_per_slide]
-                if slide_lines:
-                    slides.append('\n'.join(slide_lines))
-                if len(slides) >= self.max_slides:
-                    break
-            
-            return slides
+            lines_per_slide = max(self.lines_per_slide, 1)
+            lines = [line for line in map(str.strip, content.split('\n')) if line]
+            lines = lines[:lines_per_slide * self.max_slides]
+            
+            return [
+                '\n'.join(lines[i:i + lines_per_slide])
+                for i in range(0, len(lines), lines_per_slide)
+            ]
     
     def _clean_content(self, content: str) -> str:
         """Clean and normalize content text
@@ -148,21 +147,16 @@ class ContentProcessor:
             Cleaned content
         """
         # Remove extra whitespace
-        content = re.sub(r'\s+', ' ', content)
+        content = _WHITESPACE_RE.sub(' ', content)
         
         # Remove markdown formatting (basic)
-        content = re.sub(r'#{1,6}\s*', '', content)  # Headers
-        content = re.sub(r'\*\*(.*?)\*\*', r'\1', content)  # Bold
-        content = re.sub(r'\*(.*?)\*', r'\1', content)  # Italic
-        content = re.sub(r'`(.*?)`', r'\1', content)  # Code
+        content = _MARKDOWN_RE.sub(_strip_markdown, content)
         
         # Clean up bullet points
-        content = re.sub(r'^\s*[•\-\*]\s*', '• ', content, flags=re.MULTILINE)
+        content = _BULLET_RE.sub('• ', content)
         
         # Remove excessive punctuation
-        content = re.sub(r'\.{2,}', '.', content)
-        content = re.sub(r'\!{2,}', '!', content)
-        content = re.sub(r'\?{2,}', '?', content)
+        content = _REPEATED_PUNCTUATION_RE.sub(r'\1', content)
         
         return content.strip()
     
@@ -176,17 +170,13 @@ class ContentProcessor:
             List of sentences
         """
         # Simple sentence splitting (could be improved with NLP)
-        sentences = re.split(r'[.!?]+\s+', paragraph)
+        sentences = map(str.strip, _SENTENCE_SPLIT_RE.split(paragraph))
         
-        # Clean up sentences
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        # Ensure sentences end with punctuation
-        for i, sentence in enumerate(sentences):
-            if not sentence.endswith(('.', '!', '?')):
-                sentences[i] = sentence + '.'
-        
-        return sentences
+        # Drop empty sentences and ensure the rest end with punctuation
+        return [
+            sentence if sentence.endswith(('.', '!', '?')) else sentence + '.'
+            for sentence in sentences if sentence
+        ]
     
     def validate_slide_content(self, slide: CarouselSlide) -> Tuple[bool, str]:
         """Validate slide content meets requirements
@@ -206,18 +196,18 @@ class ContentProcessor:
             
             # Check line count (for non-title slides) - more flexible for engaging content
             if not slide.is_title_slide:
-                lines = [line.strip() for line in content.split('\n') if line.strip()]
+                line_count = sum(1 for line in content.split('\n') if line.strip())
                 # Allow more flexibility for better storytelling (up to 5 lines for engaging content)
                 max_allowed = 5  # Allow up to 5 lines for compelling social media content
-                if len(lines) > max_allowed:
-                    return False, f"Too many lines ({len(lines)}). Maximum: {max_allowed}"
+                if line_count > max_allowed:
+                    return False, f"Too many lines ({line_count}). Maximum: {max_allowed}"
             
             # Check content length (reasonable limits for social media)
             if len(content) > 2000:  # More reasonable limit for social media
                 return False, "Content too long for social media slide"
             
-            # Check for problematic characters
-            if any(ord(char) > 65535 for char in content):
+            # Check for problematic characters (outside the Basic Multilingual Plane)
+            if not content.isascii() and max(content) > '\uffff':
                 return False, "Content contains unsupported characters"
             
             return True, ""
@@ -235,17 +225,12 @@ class ContentProcessor:
             Optimized content
         """
         try:
-            # Add emoji support (basic patterns)
-            content = re.sub(r'\btip\b', '💡 tip', content, flags=re.IGNORECASE)
-            content = re.sub(r'\bimportant\b', '⚠️ important', content, flags=re.IGNORECASE)
-            content = re.sub(r'\bsuccess\b', '✅ success', content, flags=re.IGNORECASE)
-            
-            # Enhance call-to-action phrases
-            content = re.sub(r'\blearn more\b', 'Learn More →', content, flags=re.IGNORECASE)
-            content = re.sub(r'\bget started\b', 'Get Started 🚀', content, flags=re.IGNORECASE)
+            # Add emojis and enhance call-to-action phrases
+            for pattern, replacement in _SOCIAL_REPLACEMENTS:
+                content = pattern.sub(replacement, content)
             
             # Improve readability
-            content = re.sub(r'(\d+)', r'**\1**', content)  # Bold numbers
+            content = _NUMBER_RE.sub(r'**\1**', content)  # Bold numbers
             
             return content
             
@@ -2,11 +2,15 @@
 Image processing utilities for Carousel Engine v2
 """
 
+import bisect
+import functools
+import hashlib
 import logging
 import os
 import tempfile
+from collections import OrderedDict
 from io import BytesIO
-from typing import Tuple, Optional
+from typing import Callable, Tuple, Optional, Sequence
 from PIL import Image, ImageDraw, ImageFont
 import requests
 import threading
@@ -14,12 +18,229 @@ import threading
 from ..core.config import config
 from ..core.exceptions import ImageProcessingError
 
+try:
+    import pyspng  # Optional fast PNG decoder
+except ImportError:
+    pyspng = None
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB  # Optional libjpeg-turbo bindings
+except ImportError:
+    TurboJPEG = None
+
 logger = logging.getLogger(__name__)
 
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_JPEG_SIGNATURE = b'\xff\xd8\xff'
+
+# Encoder settings per slide output format. Slides are an opaque photographic
+# background with text, so lossy JPEG/WebP encode far faster than PNG deflate.
+_SLIDE_SAVE_OPTIONS = {
+    'JPEG': {'quality': 90, 'optimize': False, 'progressive': False},
+    'WEBP': {'quality': 90, 'method': 4},
+}
+
+# Large downscales first shrink by an integer factor with Pillow's fast box
+# reduce, then finish with Lanczos; 3.0 is visually indistinguishable from a
+# full Lanczos pass
+_RESIZE_REDUCING_GAP = 3.0
+
+# Decoded, resized backgrounds kept per processor; a carousel reuses one
+_BACKGROUND_CACHE_SIZE = 4
+
+# File extension for each slide output format
+SLIDE_FILE_EXTENSIONS = {
+    'JPEG': '.jpg',
+    'WEBP': '.webp',
+    'PNG': '.png',
+}
+
 # Thread-safe font cache
 _font_cache = {}
 _font_cache_lock = threading.Lock()
 
+# Font bundled with the package; works in serverless deployments
+_BUNDLED_FONT_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'fonts', 'opensans.ttf')
+
+# General-purpose fonts for _get_font, most likely to succeed first
+_SYSTEM_FONT_OPTIONS = (
+    "/System/Library/Fonts/Helvetica.ttc",  # macOS
+    "/System/Library/Fonts/HelveticaNeue.ttc",  # macOS alternative
+    "Arial.ttf",
+    "arial.ttf",
+    "Helvetica.ttf",
+    "helvetica.ttf",
+    "/System/Library/Fonts/Arial.ttf",  # macOS
+    "/usr/share/fonts/truetype/arial.ttf",  # Linux
+    "/Windows/Fonts/arial.ttf"  # Windows
+)
+
+# Slide text fonts: bundled font, then Lato, then TrueType system fallbacks
+# that respect the requested size
+_SLIDE_FONT_OPTIONS = (
+    _BUNDLED_FONT_PATH,
+    "Lato-Regular.ttf",
+    "lato-regular.ttf",
+    "/System/Library/Fonts/Lato-Regular.ttf",  # macOS
+    "/usr/share/fonts/truetype/lato/Lato-Regular.ttf",  # Linux
+    "/Windows/Fonts/Lato-Regular.ttf",  # Windows
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/System/Library/Fonts/HelveticaNeue.ttc",
+    "/System/Library/Fonts/Arial.ttf",
+    "/System/Library/Fonts/Courier.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+    "/usr/share/fonts/truetype/arial.ttf",
+    "/Windows/Fonts/arial.ttf",
+    "/Windows/Fonts/Arial.ttf",
+    "/Windows/Fonts/calibri.ttf",
+    "Arial.ttf",
+    "arial.ttf",
+    "Helvetica.ttf",
+    "helvetica.ttf"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_font_path(font_options: Sequence[str]) -> Optional[str]:
+    """Return the first loadable font in ``font_options``
+    
+    The fallback list is probed once per process; later lookups skip the
+    failing ``truetype`` calls entirely.
+    
+    Args:
+        font_options: Candidate font paths in priority order
+        
+    Returns:
+        Path of the first font that loads, or None if none do
+    """
+    for font_path in font_options:
+        try:
+            ImageFont.truetype(font_path, 12)
+        except (OSError, IOError):
+            continue
+        logger.info(f"✅ Resolved font: {font_path}")
+        return font_path
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _load_truetype(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, reusing parsed fonts keyed by (path, size)
+    
+    Args:
+        font_path: Path to the font file
+        size: Font size in points
+        
+    Returns:
+        PIL FreeTypeFont object
+    """
+    return ImageFont.truetype(font_path, size)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_turbojpeg() -> Optional["TurboJPEG"]:
+    """Create the shared TurboJPEG decoder, or None if libjpeg-turbo is unavailable"""
+    if TurboJPEG is None:
+        return None
+    try:
+        return TurboJPEG()
+    except (OSError, RuntimeError) as e:
+        logger.warning(f"libjpeg-turbo not loadable, using PIL JPEG decoder: {e}")
+        return None
+
+
+def _jpeg_scale_denominator(source_size: Tuple[int, int], target_size: Tuple[int, int]) -> int:
+    """Largest libjpeg DCT downscale (1/2, 1/4, 1/8) that stays at or above the target size"""
+    for denominator in (8, 4, 2):
+        if (source_size[0] // denominator >= target_size[0]
+                and source_size[1] // denominator >= target_size[1]):
+            return denominator
+    return 1
+
+
+def _decode_background(image_data: bytes, size: Tuple[int, int]) -> Image.Image:
+    """Decode background image bytes, preferring pyspng / libjpeg-turbo
+    
+    JPEGs much larger than ``size`` are decoded at a reduced DCT scale, so
+    the Lanczos resize that follows starts from 4-64x fewer pixels. Falls
+    back to ``Image.open`` when the optional decoders are not installed,
+    the format is something else, or the fast decode fails.
+    
+    Args:
+        image_data: Encoded image bytes
+        size: Target (width, height) the image will be resized to
+        
+    Returns:
+        Decoded PIL image, never smaller than ``size`` due to draft scaling
+    """
+    try:
+        if pyspng is not None and image_data.startswith(_PNG_SIGNATURE):
+            return Image.fromarray(pyspng.load(image_data))
+        
+        if image_data.startswith(_JPEG_SIGNATURE):
+            jpeg = _get_turbojpeg()
+            if jpeg is not None:
+                width, height, _, _ = jpeg.decode_header(image_data)
+                denominator = _jpeg_scale_denominator((width, height), size)
+                return Image.fromarray(jpeg.decode(
+                    image_data,
+                    pixel_format=TJPF_RGB,
+                    scaling_factor=(1, denominator) if denominator > 1 else None
+                ))
+    except Exception as e:
+        # e.g. 16-bit PNGs that PIL cannot wrap from an array
+        logger.debug(f"Fast background decode failed, using PIL: {e}")
+    
+    image = Image.open(BytesIO(image_data))
+    # Let libjpeg decode at 1/2, 1/4 or 1/8 scale; a no-op for other formats
+    image.draft('RGB', size)
+    return image
+
+
+def _largest_fitting_font_size(
+    min_size: int,
+    max_size: int,
+    fits: Callable[[int], bool],
+    step: int = 4
+) -> Optional[int]:
+    """Binary-search the largest font size on the ``step`` grid that fits
+    
+    Candidates are ``max_size, max_size - step, ...`` down to ``min_size``,
+    the same sizes the old linear scan tried. ``fits`` must be monotone:
+    if a size fits, every smaller size fits too.
+    
+    Args:
+        min_size: Smallest font size to consider
+        max_size: Largest font size to consider
+        fits: Predicate returning True if text fits at the given size
+        step: Spacing between candidate sizes
+        
+    Returns:
+        Largest fitting size, or None if no candidate fits
+    """
+    candidates = range(max_size, min_size - 1, -step)[::-1]
+    first_too_big = bisect.bisect_left(candidates, True, key=lambda size: not fits(size))
+    return candidates[first_too_big - 1] if first_too_big else None
+
+
+def _measure_words(font: ImageFont.ImageFont, words: Sequence[str]) -> Tuple[list[float], float]:
+    """Measure each word and the space glyph once for greedy wrapping
+    
+    Line widths are treated as the sum of word widths plus one space per
+    gap, so wrapping is O(n) measurements instead of re-measuring every
+    growing line prefix.
+    
+    Args:
+        font: Font to use for measuring
+        words: Words to measure
+        
+    Returns:
+        Tuple of (word_widths, space_width)
+    """
+    measure = font.getlength
+    return [measure(word) for word in words], measure(' ')
+
 
 class ImageProcessor:
     """Image processing utilities for carousel generation"""
@@ -29,6 +250,12 @@ class ImageProcessor:
         self.width = config.image_width
         self.height = config.image_height
         self._consistent_font_size = None  # Store font size for consistency across slides
+        
+        # (image digest, width, height) -> RGBA background, least recently used first
+        self._background_cache: "OrderedDict[Tuple[bytes, int, int], Image.Image]" = OrderedDict()
+        
+        # (font size, number text) -> (badge tile, text width, text height)
+        self._slide_number_tiles: dict[Tuple[int, str], Tuple[Image.Image, int, int]] = {}
     
     def reset_font_consistency(self):
         """Reset font size for new carousel generation"""
@@ -59,18 +286,9 @@ class ImageProcessor:
         try:
             logger.info(f"Creating carousel slide. Title slide: {is_title_slide}")
             
-            # Load background image
-            background = Image.open(BytesIO(background_image_data))
-            
-            # Ensure background matches expected dimensions
-            if background.size != (self.width, self.height):
-                # Only resize if dimensions don't match to maintain 1:1 ratio
-                background = background.resize((self.width, self.height), Image.Resampling.LANCZOS)
-                logger.debug(f"Resized background from {background.size} to {self.width}x{self.height}")
-            
-            # Ensure RGB mode
-            if background.mode != 'RGB':
-                background = background.convert('RGB')
+            # Load background image; the decoded, resized RGBA image is cached
+            # per processor and copied so slides don't share pixels
+            background = self._load_background(background_image_data).copy()
             
             # Create drawing context
             draw = ImageDraw.Draw(background)
@@ -87,8 +305,14 @@ class ImageProcessor:
             # self._add_branding(draw, self.width, self.height)
             
             # Convert to bytes
+            background = background.convert('RGB')
             output_buffer = BytesIO()
-            background.save(output_buffer, format='PNG', optimize=True)
+            slide_format = config.slide_output_format
+            if slide_format == 'PNG':
+                # Lossless option for cases that need exact pixels
+                background.save(output_buffer, format='PNG', compress_level=config.png_compress_level)
+            else:
+                background.save(output_buffer, format=slide_format, **_SLIDE_SAVE_OPTIONS[slide_format])
             
             return output_buffer.getvalue(), overflow_text
             
@@ -97,6 +321,86 @@ class ImageProcessor:
             logger.error(error_msg)
             raise ImageProcessingError(error_msg)
     
+    def _load_background(self, background_image_data: bytes) -> Image.Image:
+        """Decode and resize a background once and reuse it across slides
+        
+        Every slide of a carousel shares the same background, so the decode,
+        Lanczos resize and RGBA conversion are done on the first slide only.
+        
+        Args:
+            background_image_data: Background image as bytes
+            
+        Returns:
+            Cached RGBA background at the slide size; callers must copy it
+            before drawing
+        """
+        cache_key = (
+            hashlib.blake2b(background_image_data, digest_size=16).digest(),
+            self.width,
+            self.height
+        )
+        cached = self._background_cache.get(cache_key)
+        if cached is not None:
+            self._background_cache.move_to_end(cache_key)
+            return cached
+        
+        background = _decode_background(background_image_data, (self.width, self.height))
+        
+        # Ensure background matches expected dimensions
+        if background.size != (self.width, self.height):
+            # Only resize if dimensions don't match to maintain 1:1 ratio
+            original_size = background.size
+            background = background.resize(
+                (self.width, self.height),
+                Image.Resampling.LANCZOS,
+                reducing_gap=_RESIZE_REDUCING_GAP
+            )
+            logger.debug(f"Resized background from {original_size} to {self.width}x{self.height}")
+        
+        # Work in RGBA so the overlay boxes composite in place; the single
+        # conversion back to RGB happens at save time
+        if background.mode != 'RGBA':
+            background = background.convert('RGBA')
+        
+        self._background_cache[cache_key] = background
+        if len(self._background_cache) > _BACKGROUND_CACHE_SIZE:
+            self._background_cache.popitem(last=False)
+        
+        return background
+    
+    def _composite_rounded_box(
+        self,
+        image: Image.Image,
+        box: Tuple[int, int, int, int],
+        radius: int,
+        fill: Tuple[int, int, int, int]
+    ) -> None:
+        """Alpha-composite a translucent rounded rectangle onto an RGBA image
+        
+        The overlay is only as large as the box (clipped to the image), so
+        compositing touches the box region rather than the whole frame.
+        
+        Args:
+            image: RGBA image, modified in place
+            box: (left, top, right, bottom) in image coordinates, inclusive
+            radius: Corner radius in pixels
+            fill: RGBA fill color
+        """
+        left, top, right, bottom = (int(v) for v in box)
+        origin_x, origin_y = max(left, 0), max(top, 0)
+        overlay_width = min(right + 1, image.width) - origin_x
+        overlay_height = min(bottom + 1, image.height) - origin_y
+        if overlay_width <= 0 or overlay_height <= 0:
+            return
+        
+        box_overlay = Image.new('RGBA', (overlay_width, overlay_height), (0, 0, 0, 0))
+        ImageDraw.Draw(box_overlay).rounded_rectangle(
+            [left - origin_x, top - origin_y, right - origin_x, bottom - origin_y],
+            radius=radius,
+            fill=fill
+        )
+        image.alpha_composite(box_overlay, dest=(origin_x, origin_y))
+    
     def _add_title_text(self, draw: ImageDraw.Draw, title: str, width: int, height: int) -> Optional[str]:
         """Add title text to image with intelligent font sizing
         
@@ -111,10 +415,10 @@ class ImageProcessor:
             optimal_font_size = self._calculate_optimal_title_font_size(title, width, height)
             title_font = self._get_lato_font(optimal_font_size)
             
-            # Calculate text dimensions first
-            bbox = draw.textbbox((0, 0), title, font=title_font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
+            # Calculate text dimensions from font metrics (no glyph rendering)
+            ascent, descent = title_font.getmetrics()
+            text_width = int(title_font.getlength(title))
+            text_height = ascent + descent
             
             # Center text position
             x = (width - text_width) // 2
@@ -127,22 +431,14 @@ class ImageProcessor:
             box_right = x + text_width + padding
             box_bottom = y + text_height + padding
             
-            # Draw semi-opaque background
-            background_image = draw._image
-            background_rgba = background_image.convert('RGBA')
-            box_overlay = Image.new('RGBA', background_rgba.size, (0, 0, 0, 0))
-            box_draw = ImageDraw.Draw(box_overlay)
-            box_draw.rounded_rectangle(
-                [box_left, box_top, box_right, box_bottom],
+            # Draw semi-opaque background (white with 60% opacity)
+            self._composite_rounded_box(
+                draw._image,
+                (box_left, box_top, box_right, box_bottom),
                 radius=20,
-                fill=(255, 255, 255, 153)  # White with 60% opacity
+                fill=(255, 255, 255, 153)
             )
             
-            # Composite the box overlay onto the main image
-            background_rgba = Image.alpha_composite(background_rgba, box_overlay)
-            final_image = background_rgba.convert('RGB')
-            draw._image.paste(final_image)
-            
             # Create new draw context and draw text
             final_draw = ImageDraw.Draw(draw._image)
             text_color = (64, 64, 64)  # Dark gray
@@ -209,28 +505,14 @@ class ImageProcessor:
             box_x = text_box_left_margin
             box_y = (height - box_height) // 2
             
-            # Create semi-opaque white background box (40% opacity)
-            box_overlay = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-            box_draw = ImageDraw.Draw(box_overlay)
-            
             # Draw rounded rectangle with 60% white opacity (255 * 0.6 = 153)
-            box_draw.rounded_rectangle(
-                [(box_x, box_y), (box_x + box_width, box_y + box_height)],
+            self._composite_rounded_box(
+                draw._image,
+                (box_x, box_y, box_x + box_width, box_y + box_height),
                 radius=20,
-                fill=(255, 255, 255, 153)  # White with 60% opacity
+                fill=(255, 255, 255, 153)
             )
             
-            # Composite the box overlay onto the main image
-            background_image = draw._image
-            background_rgba = background_image.convert('RGBA')
-            background_rgba = Image.alpha_composite(background_rgba, box_overlay)
-            
-            # Convert back to RGB and create new draw context for text rendering
-            final_image = background_rgba.convert('RGB')
-            
-            # Replace the original image with the composited version
-            draw._image.paste(final_image)
-            
             # Create a new draw context on the final composited image
             final_draw = ImageDraw.Draw(draw._image)
             
@@ -285,30 +567,67 @@ class ImageProcessor:
         try:
             # Small font for slide number
             font_size = min(width, height) // 40
-            number_font = self._get_font(font_size)
-            
-            # Position in bottom right
             number_text = str(slide_number)
-            bbox = draw.textbbox((0, 0), number_text, font=number_font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
+            padding = 5
             
+            # Badges never change for a given size, so rasterize each once
+            cache_key = (font_size, number_text)
+            cached = self._slide_number_tiles.get(cache_key)
+            if cached is None:
+                cached = self._render_slide_number_tile(number_text, font_size, padding)
+                self._slide_number_tiles[cache_key] = cached
+            tile, text_width, text_height = cached
+            
+            # Position in bottom right
             x = width - text_width - 20
             y = height - text_height - 20
             
-            # Semi-transparent background
-            padding = 5
-            draw.rectangle(
-                [x - padding, y - padding, x + text_width + padding, y + text_height + padding],
-                fill=(0, 0, 0, 128)
-            )
-            
-            # Draw number
-            draw.text((x, y), number_text, font=number_font, fill=(255, 255, 255))
+            # The tile's alpha blends antialiased glyph edges over the background
+            draw._image.paste(tile, (x - padding, y - padding), tile)
             
         except Exception as e:
             logger.error(f"Failed to add slide number: {e}")
     
+    def _render_slide_number_tile(
+        self,
+        number_text: str,
+        font_size: int,
+        padding: int
+    ) -> Tuple[Image.Image, int, int]:
+        """Render a slide-number badge (dark box plus white digits) to an RGBA tile
+        
+        The tile's origin is the box's top-left corner. Glyph ink that hangs
+        past the box keeps partial alpha so pasting with the tile as mask
+        matches drawing the text directly on the slide.
+        
+        Args:
+            number_text: Slide number as text
+            font_size: Font size in points
+            padding: Box padding around the text in pixels
+            
+        Returns:
+            Tuple of (tile, text_width, text_height)
+        """
+        number_font = self._get_font(font_size)
+        bbox = number_font.getbbox(number_text)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+        
+        box_right = text_width + padding * 2
+        box_bottom = text_height + padding * 2
+        tile_size = (
+            max(box_right, padding + bbox[2]) + 1,
+            max(box_bottom, padding + bbox[3]) + 1
+        )
+        
+        # Transparent white, so glyph coverage outside the box becomes alpha only
+        tile = Image.new('RGBA', tile_size, (255, 255, 255, 0))
+        tile_draw = ImageDraw.Draw(tile)
+        tile_draw.rectangle([0, 0, box_right, box_bottom], fill=(0, 0, 0, 255))
+        tile_draw.text((padding, padding), number_text, font=number_font, fill=(255, 255, 255, 255))
+        
+        return tile, text_width, text_height
+    
     def _add_branding(self, draw: ImageDraw.Draw, width: int, height: int) -> None:
         """Add branding/watermark to image
         
@@ -354,26 +673,9 @@ class ImageProcessor:
             PIL ImageFont object
         """
         try:
-            # Try to load a nice font (Arial, Helvetica, etc.)
-            font_options = [
-                "/System/Library/Fonts/Helvetica.ttc",  # macOS - move most likely to succeed first
-                "/System/Library/Fonts/HelveticaNeue.ttc",  # macOS alternative
-                "Arial.ttf",
-                "arial.ttf", 
-                "Helvetica.ttf",
-                "helvetica.ttf",
-                "/System/Library/Fonts/Arial.ttf",  # macOS
-                "/usr/share/fonts/truetype/arial.ttf",  # Linux
-                "/Windows/Fonts/arial.ttf"  # Windows
-            ]
-            
-            for font_path in font_options:
-                try:
-                    font = ImageFont.truetype(font_path, size)
-                    logger.debug(f"Successfully loaded font: {font_path} at {size}pt")
-                    return font
-                except (OSError, IOError):
-                    continue
+            font_path = _resolve_font_path(_SYSTEM_FONT_OPTIONS)
+            if font_path:
+                return _load_truetype(font_path, size)
             
             # Fallback to default font - but warn about potential size issues
             logger.warning(f"Could not load any TrueType font, using PIL default. Font size {size}pt may not render correctly.")
@@ -400,77 +702,16 @@ class ImageProcessor:
                 return _font_cache[cache_key]
         
         try:
-            # FIRST: Try bundled font (this will work in production!)
-            bundled_font_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'fonts', 'opensans.ttf')
-            try:
-                if os.path.exists(bundled_font_path):
-                    font = ImageFont.truetype(bundled_font_path, size)
-                    logger.info(f"✅ SUCCESS: Loaded bundled OpenSans font at {size}pt from {bundled_font_path}")
-                    
-                    # Cache the successful font load
-                    with _font_cache_lock:
-                        _font_cache[cache_key] = font
-                    
-                    return font
-                else:
-                    logger.warning(f"Bundled font not found at {bundled_font_path}")
-            except Exception as e:
-                logger.warning(f"Failed to load bundled font: {e}")
-            
-            # Try to load Lato font second
-            lato_options = [
-                "Lato-Regular.ttf",
-                "lato-regular.ttf",
-                "/System/Library/Fonts/Lato-Regular.ttf",  # macOS
-                "/usr/share/fonts/truetype/lato/Lato-Regular.ttf",  # Linux
-                "/Windows/Fonts/Lato-Regular.ttf"  # Windows
-            ]
-            
-            for font_path in lato_options:
-                try:
-                    font = ImageFont.truetype(font_path, size)
-                    logger.info(f"✅ Successfully loaded Lato font: {font_path} at {size}pt")
-                    return font
-                except (OSError, IOError):
-                    continue
-            
-            # Fallback to system fonts - CRITICAL: These must be TrueType fonts that respect size
-            fallback_options = [
-                # macOS fonts (most reliable)
-                "/System/Library/Fonts/Helvetica.ttc",  
-                "/System/Library/Fonts/HelveticaNeue.ttc",
-                "/System/Library/Fonts/Arial.ttf",
-                "/System/Library/Fonts/Courier.ttc",
+            # Bundled font first, then Lato, then system TrueType fonts
+            font_path = _resolve_font_path(_SLIDE_FONT_OPTIONS)
+            if font_path:
+                font = _load_truetype(font_path, size)
                 
-                # Linux fonts
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-                "/usr/share/fonts/truetype/arial.ttf",
-                
-                # Windows fonts
-                "/Windows/Fonts/arial.ttf",
-                "/Windows/Fonts/Arial.ttf",
-                "/Windows/Fonts/calibri.ttf",
+                # Cache the successful font load
+                with _font_cache_lock:
+                    _font_cache[cache_key] = font
                 
-                # Common system locations
-                "Arial.ttf",
-                "arial.ttf", 
-                "Helvetica.ttf",
-                "helvetica.ttf"
-            ]
-            
-            for font_path in fallback_options:
-                try:
-                    font = ImageFont.truetype(font_path, size)
-                    logger.info(f"✅ Successfully loaded system font: {font_path} at {size}pt")
-                    
-                    # Cache the successful font load
-                    with _font_cache_lock:
-                        _font_cache[cache_key] = font
-                    
-                    return font
-                except (OSError, IOError):
-                    continue
+                return font
             
             # CRITICAL FALLBACK: Download a web font dynamically for serverless environments
             logger.error(f"🚨 CRITICAL: All system fonts failed! Attempting to download web font for {size}pt")
@@ -572,12 +813,7 @@ class ImageProcessor:
                 test_line = current_line + [word]
                 test_text = ' '.join(test_line)
                 
-                # Use textlength for accurate measurement
-                if hasattr(font, 'getlength'):
-                    text_width = font.getlength(test_text)
-                else:
-                    # Fallback for older PIL versions
-                    text_width = font.getsize(test_text)[0]
+                text_width = font.getlength(test_text)
                 
                 if text_width <= max_width:
                     current_line.append(word)
@@ -622,11 +858,7 @@ class ImageProcessor:
             # Test adding this word to current line
             test_line = ' '.join(current_line + [word])
             
-            # Create a temporary draw object for measuring
-            temp_img = Image.new('RGB', (1, 1))
-            temp_draw = ImageDraw.Draw(temp_img)
-            bbox = temp_draw.textbbox((0, 0), test_line, font=font)
-            line_width = bbox[2] - bbox[0]
+            line_width = font.getlength(test_line)
             
             if line_width <= max_width:
                 current_line.append(word)
@@ -665,24 +897,23 @@ class ImageProcessor:
             # Use 80% of box width for text, leaving 10% buffer on each side
             usable_width = int(box_width * 0.8)
             
-            for word in words:
-                test_line = ' '.join(current_line + [word])
-                
-                # Use textlength for accurate measurement
-                if hasattr(font, 'getlength'):
-                    text_width = font.getlength(test_line)
-                else:
-                    # Fallback for older PIL versions
-                    text_width = font.getsize(test_line)[0]
-                
-                if text_width <= usable_width or not current_line:
+            # Measure each word once; line width is a running sum
+            word_widths, space_width = _measure_words(font, words)
+            current_width = 0.0
+            
+            for word, word_width in zip(words, word_widths):
+                if not current_line:
+                    current_line.append(word)
+                    current_width = word_width
+                elif current_width + space_width + word_width <= usable_width:
                     current_line.append(word)
+                    current_width += space_width + word_width
                 else:
                     # Start new line if we haven't reached max lines
                     if len(lines) < max_lines - 1:
-                        if current_line:
-                            lines.append(' '.join(current_line))
+                        lines.append(' '.join(current_line))
                         current_line = [word]
+                        current_width = word_width
                     else:
                         # We're at max lines, finish current line
                         if current_line:
@@ -719,24 +950,23 @@ class ImageProcessor:
             available_width = int(width * 0.8)
             available_height = int(height * 0.4)
             
-            # Try font sizes from max to min
-            for font_size in range(max_font_size, min_font_size - 1, -4):
+            def fits(font_size: int) -> bool:
                 test_font = self._get_lato_font(font_size)
                 
                 # Test if title fits in single line with this font size
-                if hasattr(test_font, 'getlength'):
-                    text_width = test_font.getlength(title)
-                    metrics = test_font.getmetrics()
-                    text_height = metrics[0] + metrics[1]  # ascent + descent
-                else:
-                    # Fallback for older PIL
-                    text_width, text_height = test_font.getsize(title)
+                text_width = test_font.getlength(title)
+                metrics = test_font.getmetrics()
+                text_height = metrics[0] + metrics[1]  # ascent + descent
                 
                 # Check if text fits with padding
                 padding = 40
-                if (text_width + padding * 2) <= available_width and (text_height + padding * 2) <= available_height:
-                    logger.info(f"✅ OPTIMAL TITLE FONT: {font_size}pt for '{title[:30]}...' (text_width: {text_width}px, available: {available_width}px)")
-                    return font_size
+                return (text_width + padding * 2) <= available_width and (text_height + padding * 2) <= available_height
+            
+            # Larger fonts only get wider, so binary-search the size grid
+            font_size = _largest_fitting_font_size(min_font_size, max_font_size, fits)
+            if font_size is not None:
+                logger.info(f"✅ OPTIMAL TITLE FONT: {font_size}pt for '{title[:30]}...' (available width: {available_width}px)")
+                return font_size
             
             # Use minimum font size if nothing fits
             logger.warning(f"Using minimum title font size {min_font_size}pt - text may be tight")
@@ -766,8 +996,7 @@ class ImageProcessor:
             text_box_width = int(width * 0.9)
             available_height = int(height * 0.6)
             
-            # Try font sizes from max to min
-            for font_size in range(max_font_size, min_font_size - 1, -4):
+            def fits(font_size: int) -> bool:
                 test_font = self._get_lato_font(font_size)
                 
                 # Test text wrapping with this font size
@@ -785,9 +1014,13 @@ class ImageProcessor:
                 padding = int(width * 0.06)  # 6% padding
                 
                 # Check if text fits without overflow and within height
-                if not overflow and (total_text_height + padding * 2) <= available_height:
-                    logger.info(f"✅ OPTIMAL CONTENT FONT: {font_size}pt for content length {len(content)} chars ({len(lines)} lines, total_height: {total_text_height}px, available: {available_height}px)")
-                    return font_size
+                return not overflow and (total_text_height + padding * 2) <= available_height
+            
+            # Larger fonts wrap to more lines, so binary-search the size grid
+            font_size = _largest_fitting_font_size(min_font_size, max_font_size, fits)
+            if font_size is not None:
+                logger.info(f"✅ OPTIMAL CONTENT FONT: {font_size}pt for content length {len(content)} chars (available height: {available_height}px)")
+                return font_size
             
             # Use minimum font size if nothing fits
             logger.warning(f"Using minimum content font size {min_font_size}pt - may need overflow handling")
@@ -821,24 +1054,23 @@ class ImageProcessor:
             # Use 80% of box width for text, leaving 10% buffer on each side
             usable_width = int(box_width * 0.8)
             
-            for i, word in enumerate(words):
-                test_line = ' '.join(current_line + [word])
-                
-                # Use textlength for accurate measurement
-                if hasattr(font, 'getlength'):
-                    text_width = font.getlength(test_line)
-                else:
-                    # Fallback for older PIL versions
-                    text_width = font.getsize(test_line)[0]
-                
-                if text_width <= usable_width or not current_line:
+            # Measure each word once; line width is a running sum
+            word_widths, space_width = _measure_words(font, words)
+            current_width = 0.0
+            
+            for i, (word, word_width) in enumerate(zip(words, word_widths)):
+                if not current_line:
                     current_line.append(word)
+                    current_width = word_width
+                elif current_width + space_width + word_width <= usable_width:
+                    current_line.append(word)
+                    current_width += space_width + word_width
                 else:
                     # Start new line if we haven't reached max lines
                     if len(lines) < max_lines - 1:
-                        if current_line:
-                            lines.append(' '.join(current_line))
+                        lines.append(' '.join(current_line))
                         current_line = [word]
+                        current_width = word_width
                     else:
                         # We're at max lines - everything else is overflow
                         if current_line:
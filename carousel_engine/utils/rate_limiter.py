@@ -0,0 +1,60 @@
+"""
+Async rate limiting utilities
+"""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """Token bucket limiter for asyncio code
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Each acquire takes one token; when the bucket is empty the caller
+    reserves the next token and sleeps until it becomes available, so
+    waiters are released in arrival order at the configured rate.
+
+    Usage::
+
+        limiter = AsyncTokenBucket(rate=2.5, capacity=5)
+        async with limiter:
+            ...
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """Initialize token bucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Take one token, waiting until one is available"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+        # A negative balance is a reservation; sleep until our token refills
+        self._tokens -= 1
+        if self._tokens < 0:
+            try:
+                await asyncio.sleep(-self._tokens / self.rate)
+            except asyncio.CancelledError:
+                # Give the reserved token back so the bucket doesn't shrink
+                self._tokens += 1
+                raise
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
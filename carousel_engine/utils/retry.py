@@ -0,0 +1,59 @@
+"""
+Retry helpers for transient API failures
+"""
+
+from typing import Optional
+
+from tenacity import RetryCallState
+from tenacity.wait import wait_base, wait_exponential_jitter
+
+# Upper bound on how long we honor a server-provided Retry-After
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+def retry_after_seconds(exc: Optional[BaseException]) -> Optional[float]:
+    """Read the Retry-After delay from an API error, if the server sent one
+
+    Works with OpenAI SDK errors (``exc.response.headers``) and Notion SDK
+    errors (``exc.headers``).
+
+    Args:
+        exc: Exception raised by the API client
+
+    Returns:
+        Delay in seconds, or None if the error carries no usable header
+    """
+    headers = getattr(exc, "headers", None)
+    if headers is None:
+        response = getattr(exc, "response", None)
+        headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return min(float(retry_after_ms) / 1000, MAX_RETRY_AFTER_SECONDS)
+
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            return min(float(retry_after), MAX_RETRY_AFTER_SECONDS)
+    except (TypeError, ValueError):
+        # HTTP-date values and other formats fall back to exponential backoff
+        return None
+
+    return None
+
+
+class wait_retry_after_or_exponential(wait_base):
+    """Wait for the server's Retry-After if given, else exponential backoff with jitter"""
+
+    def __init__(self, initial: float = 1, max: float = 30):
+        self.fallback = wait_exponential_jitter(initial=initial, max=max)
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        delay = retry_after_seconds(exc)
+        if delay is not None:
+            return delay
+        return self.fallback(retry_state)